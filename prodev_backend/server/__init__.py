@@ -1,3 +1,8 @@
 import os
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings.prod')
+
+# Load the Celery app with Django so @shared_task binds to it
+from .celery import app as celery_app  # noqa: E402
+
+__all__ = ("celery_app",)
@@ -8,6 +8,12 @@ class ActionsConfig(AppConfig):
     name = 'server.apps.actions'
     label = "actions"
 
-def ready(self):
-    # Import signals so they register
-    from . import signals  # noqa
+    def ready(self):
+        # Import signals so they register
+        from . import signals  # noqa
+        from server.apps.challenges.models import Challenge
+        from server.apps.core.versioning import track
+        from .models import ActionTemplate
+
+        # The template catalog is cached and validated by these table versions
+        track(ActionTemplate, Challenge)
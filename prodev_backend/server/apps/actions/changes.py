@@ -0,0 +1,43 @@
+# server/apps/actions/changes.py
+
+"""
+Single entry point for keeping tables derived from EcoAction in step.
+
+Every write path (model signals, bulk_create, bulk_update) reports
+(previous, current) ActionState pairs here; None stands for "did not exist".
+
+Only the deltas are computed in the request. Leaderboard scores and the
+daily rollup are updated by Celery tasks queued after commit, so the cost of
+a write doesn't grow with the number of leaderboards it touches. Deltas are
+additive, so tasks may run in any order.
+"""
+
+from typing import Iterable, Optional, Tuple
+
+from server.apps.core.deferred import defer
+from server.apps.leaderboard import scoring
+from server.apps.leaderboard.tasks import apply_score_deltas
+
+from . import rollups
+from .models import ActionState
+from .tasks import apply_rollup_deltas
+
+Change = Tuple[Optional[ActionState], Optional[ActionState]]
+
+
+def _score_state(state: Optional[ActionState]):
+    return (state.user_id, state.challenge_id, state.points) if state else None
+
+
+def apply_changes(changes: Iterable[Change], using: Optional[str] = None):
+    changes = [(previous, current) for previous, current in changes if previous != current]
+    if not changes:
+        return
+    score_rows = scoring.encode_deltas(
+        scoring.deltas_for_changes((_score_state(previous), _score_state(current)) for previous, current in changes)
+    )
+    if score_rows:
+        defer(apply_score_deltas, score_rows, using=using)
+    rollup_rows = rollups.encode_deltas(rollups.deltas_for_changes(changes))
+    if rollup_rows:
+        defer(apply_rollup_deltas, rollup_rows, using=using)
@@ -0,0 +1,68 @@
+# server/apps/actions/export.py
+
+"""
+Streaming EcoAction export.
+
+Rows come from a values_list() iterator, so only one chunk of tuples is held in
+memory at a time no matter how many actions are exported, and are encoded in
+batches to keep the number of writes to the client reasonable.
+"""
+
+import csv
+import io
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_CHUNK_SIZE = 2000
+
+# (output column, queryset field)
+EXPORT_COLUMNS = [
+    ("id", "id"),
+    ("user", "user_id"),
+    ("username", "user__username"),
+    ("action_type", "action_type"),
+    ("description", "description"),
+    ("points", "points"),
+    ("challenge", "challenge_id"),
+    ("performed_on", "performed_on"),
+    ("created_at", "created_at"),
+]
+HEADER = [name for name, _field in EXPORT_COLUMNS]
+
+
+def export_rows(queryset, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[tuple]:
+    fields = [field for _name, field in EXPORT_COLUMNS]
+    return queryset.order_by("id").values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def _batches(rows: Iterable[tuple], size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def stream_csv(rows: Iterable[tuple], batch_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    yield buffer.getvalue()
+    for batch in _batches(rows, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+def stream_ndjson(rows: Iterable[tuple], batch_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    for batch in _batches(rows, batch_size):
+        yield "".join(encoder.encode(dict(zip(HEADER, row))) + "\n" for row in batch)
+
+
+EXPORT_FORMATS = {
+    # format -> (encoder, content type)
+    "csv": (stream_csv, "text/csv; charset=utf-8"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
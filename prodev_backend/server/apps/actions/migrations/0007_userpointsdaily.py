@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+BACKFILL_BATCH = 1000
+
+
+def backfill_rollup(apps, schema_editor):
+    EcoAction = apps.get_model("actions", "EcoAction")
+    UserPointsDaily = apps.get_model("actions", "UserPointsDaily")
+    db = schema_editor.connection.alias
+
+    totals = (
+        EcoAction.objects.using(db)
+        .values("user_id", "performed_on", "action_type")
+        .annotate(total=Sum("points"), n=Count("id"))
+        .order_by()
+    )
+    batch = []
+    for row in totals.iterator(chunk_size=BACKFILL_BATCH):
+        batch.append(UserPointsDaily(
+            user_id=row["user_id"],
+            performed_on=row["performed_on"],
+            action_type=row["action_type"],
+            points=row["total"] or 0,
+            count=row["n"],
+        ))
+        if len(batch) >= BACKFILL_BATCH:
+            UserPointsDaily.objects.using(db).bulk_create(batch)
+            batch = []
+    if batch:
+        UserPointsDaily.objects.using(db).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actions', '0006_alter_actiontemplate_action_type_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPointsDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('performed_on', models.DateField()),
+                ('action_type', models.CharField(choices=[('transport', 'Public Transport'), ('plastic', 'Avoided Plastic'), ('vegetarian', 'Vegetarian Meal'), ('energy', 'Energy Saving'), ('water', 'Water Saving')], max_length=20)),
+                ('points', models.IntegerField(default=0)),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points_daily', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'performed_on', 'action_type'), name='unique_user_points_daily')],
+            },
+        ),
+        migrations.RunPython(backfill_rollup, migrations.RunPython.noop),
+    ]
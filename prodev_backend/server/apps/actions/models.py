@@ -1,12 +1,74 @@
 # server/apps/actions/models.py
 
-from django.db import models
+import datetime
+from typing import NamedTuple, Optional
+
+from django.db import models, transaction
 from django.utils import timezone
 
 from server.apps.challenges.models import Challenge
 from server.apps.core.models import TimeStampedModel
 from server.apps.users.models import CustomUser
 
+TRACKED_FIELDS = {
+    "user", "user_id", "challenge", "challenge_id", "action_type", "performed_on", "points",
+}
+PREVIOUS_STATE_CHUNK = 500
+
+
+class ActionState(NamedTuple):
+    """The fields of an EcoAction that derived tables (scores, rollups) depend on."""
+    user_id: Optional[int]
+    challenge_id: Optional[int]
+    action_type: str
+    performed_on: Optional[datetime.date]
+    points: int
+
+
+class EcoActionQuerySet(models.QuerySet):
+    """
+    bulk_create/bulk_update skip model signals, so apply leaderboard and rollup
+    deltas here in one upsert per batch instead of leaving them stale.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .changes import apply_changes
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            # With ignore/update_conflicts the backend may not report which rows
+            # landed; only count rows that came back with a primary key.
+            apply_changes(((None, o.tracked_state()) for o in created if o.pk), using=self.db)
+        for obj in created:
+            obj._tracked_state = obj.tracked_state()
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from .changes import apply_changes
+
+        objs = list(objs)
+        if not TRACKED_FIELDS.intersection(fields):
+            return super().bulk_update(objs, fields, *args, **kwargs)
+
+        with transaction.atomic(using=self.db):
+            previous = self._previous_states([o.pk for o in objs])
+            rows = super().bulk_update(objs, fields, *args, **kwargs)
+            apply_changes(((previous.get(o.pk), o.tracked_state()) for o in objs), using=self.db)
+        for obj in objs:
+            obj._tracked_state = obj.tracked_state()
+        return rows
+
+    def _previous_states(self, pks):
+        states = {}
+        for start in range(0, len(pks), PREVIOUS_STATE_CHUNK):
+            chunk = pks[start:start + PREVIOUS_STATE_CHUNK]
+            for pk, *values in self.model.objects.using(self.db).filter(
+                pk__in=chunk
+            ).values_list("pk", *ActionState._fields):
+                states[pk] = ActionState(*values[:-1], int(values[-1] or 0))
+        return states
+
 
 class EcoAction(TimeStampedModel):
     """
@@ -36,6 +98,26 @@ class EcoAction(TimeStampedModel):
     )
     performed_on = models.DateField(default=timezone.now, editable=False, db_index=True)
 
+    objects = EcoActionQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the tracked fields as loaded so saves can compute score and
+        rollup deltas without re-reading the row.
+        """
+        instance = super().from_db(db, field_names, values)
+        if not instance.get_deferred_fields() & set(ActionState._fields):
+            instance._tracked_state = instance.tracked_state()
+        return instance
+
+    def tracked_state(self) -> ActionState:
+        # performed_on holds a datetime until the row is saved and reloaded
+        performed_on = self._meta.get_field("performed_on").to_python(self.performed_on)
+        return ActionState(
+            self.user_id, self.challenge_id, self.action_type, performed_on, int(self.points or 0)
+        )
+
     def __str__(self):
         return f"{self.user.username} - {self.action_type}"
 
@@ -49,6 +131,32 @@ class Meta:
     ]
 
 
+class UserPointsDaily(models.Model):
+    """
+    Points and action count per user, day and action type.
+    Kept in step with EcoAction writes (see changes.py) so stats never scan actions.
+    """
+
+    user = models.ForeignKey(
+        CustomUser, on_delete=models.CASCADE, related_name="points_daily"
+    )
+    performed_on = models.DateField()
+    action_type = models.CharField(max_length=20, choices=EcoAction.ACTION_TYPES)
+    points = models.IntegerField(default=0)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "performed_on", "action_type"],
+                name="unique_user_points_daily",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.performed_on} {self.action_type}: {self.points} pts"
+
+
 class ActionTemplate(TimeStampedModel):
     """
     Public catalog: things users *can* do.
@@ -0,0 +1,70 @@
+# server/apps/actions/rollups.py
+
+"""
+Per-user daily points rollup.
+
+EcoAction writes become (points, count) deltas keyed by
+(user_id, performed_on, action_type) and are applied with one additive upsert
+per batch, mirroring the leaderboard scoring engine.
+"""
+
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import router
+
+from server.apps.core.upsert import increment_upsert
+
+from .models import ActionState, UserPointsDaily
+
+RollupKey = Tuple[int, object, str]  # (user_id, performed_on, action_type)
+
+
+def add_state(deltas: Dict[RollupKey, List[int]], state: Optional[ActionState], sign: int = 1):
+    if not state or not state.user_id or not state.performed_on:
+        return deltas
+    totals = deltas[(state.user_id, state.performed_on, state.action_type)]
+    totals[0] += sign * state.points
+    totals[1] += sign
+    return deltas
+
+
+def deltas_for_changes(changes: Iterable[Tuple[Optional[ActionState], Optional[ActionState]]]):
+    """(points, count) deltas for (previous, current) state pairs."""
+    deltas: Dict[RollupKey, List[int]] = defaultdict(lambda: [0, 0])
+    for previous, current in changes:
+        add_state(deltas, previous, -1)
+        add_state(deltas, current, 1)
+    return deltas
+
+
+def apply_deltas(deltas, using: Optional[str] = None) -> int:
+    rows = [(key, tuple(totals)) for key, totals in deltas.items() if any(totals)]
+    return increment_upsert(
+        UserPointsDaily,
+        ("user_id", "performed_on", "action_type"),
+        ("points", "count"),
+        rows,
+        using=using or router.db_for_write(UserPointsDaily),
+    )
+
+
+def encode_deltas(deltas) -> list:
+    """JSON form of `deltas` for a Celery task: [[user_id, "YYYY-MM-DD", action_type, points, count], ...]."""
+    return [
+        [user_id, performed_on.isoformat(), action_type, points, count]
+        for (user_id, performed_on, action_type), (points, count) in deltas.items()
+        if points or count
+    ]
+
+
+def decode_deltas(rows) -> Dict[RollupKey, List[int]]:
+    return {
+        (user_id, date.fromisoformat(performed_on), action_type): [points, count]
+        for user_id, performed_on, action_type, points, count in rows
+    }
+
+
+def record_changed(changes, using: Optional[str] = None) -> int:
+    return apply_deltas(deltas_for_changes(changes), using=using)
@@ -1,6 +1,7 @@
 # server/apps/actions/serializers.py
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
 from .models import EcoAction, ActionTemplate
 from server.apps.users.models import CustomUser
 from server.apps.challenges.models import Challenge
@@ -19,7 +20,7 @@ class ChallengeMiniSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description']
 
 
-class ActionTemplateSerializer(serializers.ModelSerializer):
+class ActionTemplateSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     challenge = ChallengeMiniSerializer()
 
     class Meta:
@@ -27,7 +28,7 @@ class ActionTemplateSerializer(serializers.ModelSerializer):
         fields = ["id", "action_type", "description", "points", "challenge"]
 
 
-class EcoActionSerializer(serializers.ModelSerializer):
+class EcoActionSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     user = UserChallengeSerializer()
     challenge = ChallengeMiniSerializer()
     class Meta:
@@ -38,3 +39,65 @@ class EcoActionCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = EcoAction
         fields = ["action_type", "description", "points", "challenge"]
+
+
+# Bulk logging
+class PrefetchedChallengeField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves the challenge from `context["challenges"]` (an in_bulk() map)
+    instead of issuing one query per item.
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get("challenges")
+        if prefetched is None:
+            return super().to_internal_value(data)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        challenge = prefetched.get(pk)
+        if challenge is None:
+            self.fail("does_not_exist", pk_value=data)
+        return challenge
+
+
+class EcoActionBulkListSerializer(serializers.ListSerializer):
+    """
+    Validates every item on its own so one bad row doesn't fail the whole batch.
+    """
+
+    def partition(self):
+        """
+        Returns (valid, errors): `valid` is a list of (index, validated_data),
+        `errors` a list of {"index", "errors"} for the rejected items.
+        """
+        items = self.initial_data
+        # Only ids that could be valid; anything else (lists, objects, "abc")
+        # is reported by that item's own validation
+        pks = set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                pks.add(int(item.get("challenge")))
+            except (TypeError, ValueError):
+                continue
+        self.context["challenges"] = Challenge.objects.in_bulk(pks)
+
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, self.child.run_validation(item)))
+            except serializers.ValidationError as exc:
+                errors.append({"index": index, "errors": exc.detail})
+        return valid, errors
+
+
+class EcoActionBulkCreateSerializer(EcoActionCreateSerializer):
+    challenge = PrefetchedChallengeField(
+        queryset=Challenge.objects.all(), required=False, allow_null=True
+    )
+
+    class Meta(EcoActionCreateSerializer.Meta):
+        list_serializer_class = EcoActionBulkListSerializer
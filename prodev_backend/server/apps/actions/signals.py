@@ -1,88 +1,50 @@
 # server/apps/actions/signals.py
 
+from django.db.models import QuerySet
 from django.db.models.signals import post_save, pre_save, post_delete
-from django.db.models import F
 from django.dispatch import receiver
 
-from .models import EcoAction
-from server.apps.leaderboard.models import LeaderboardEntry
-
-
-def _ensure_entry(user, challenge):
-    if not user or not challenge:
-        return None
-    entry, _ = LeaderboardEntry.objects.get_or_create(
-        user=user,
-        challenge=challenge,
-        defaults={"score": 0},
-    )
-    return entry
+from server.apps.users.models import CustomUser
+from .changes import apply_changes
+from .models import ActionState, EcoAction
 
 
 @receiver(pre_save, sender=EcoAction)
-def ecoaction_pre_save_capture(sender, instance: EcoAction, **kwargs):
+def ecoaction_pre_save_capture(sender, instance: EcoAction, raw=False, using=None, **kwargs):
     """
-    Store previous state on the instance so post_save can compute a delta.
+    Make sure the previous tracked state is known before the row is overwritten.
+    Instances loaded from the DB already carry it (see EcoAction.from_db), so this
+    only queries for hand-built instances that are saved over an existing pk.
     """
-    if instance.pk:
-        try:
-            prev = EcoAction.objects.get(pk=instance.pk)
-        except EcoAction.DoesNotExist:
-            prev = None
-    else:
-        prev = None
-    instance._prev = prev  # attach for later use
+    if raw or instance.pk is None or hasattr(instance, "_tracked_state"):
+        return
+    prev = (
+        EcoAction.objects.using(using)
+        .filter(pk=instance.pk)
+        .values_list(*ActionState._fields)
+        .first()
+    )
+    instance._tracked_state = ActionState(*prev[:-1], int(prev[-1] or 0)) if prev else None
 
 
 @receiver(post_save, sender=EcoAction)
-def ecoaction_post_save_update_leaderboard(
-    sender, instance: EcoAction, created: bool, **kwargs
+def ecoaction_post_save_update_derived(
+    sender, instance: EcoAction, created: bool, raw=False, using=None, **kwargs
 ):
-    prev = getattr(instance, "_prev", None)
-
-    # If no challenge, nothing to tally
-    if created:
-        if instance.challenge:
-            entry = _ensure_entry(instance.user, instance.challenge)
-            if entry and instance.points:
-                LeaderboardEntry.objects.filter(pk=entry.pk).update(
-                    score=F("score") + int(instance.points)
-                )
-    else:
-        # handle updates: points changed and/or challenge changed
-        prev_points = int(getattr(prev, "points", 0) or 0) if prev else 0
-        new_points = int(instance.points or 0)
-
-        prev_challenge = getattr(prev, "challenge", None) if prev else None
-        new_challenge = instance.challenge
-
-        # If challenge changed, subtract from old, add to new
-        if prev_challenge and prev_challenge != new_challenge:
-            old_entry = _ensure_entry(instance.user, prev_challenge)
-            if old_entry and prev_points:
-                LeaderboardEntry.objects.filter(pk=old_entry.pk).update(
-                    score=F("score") - prev_points
-                )
-        if new_challenge:
-            new_entry = _ensure_entry(instance.user, new_challenge)
-            if new_entry:
-                delta = (
-                    new_points
-                    if prev_challenge != new_challenge
-                    else (new_points - prev_points)
-                )
-                if delta:
-                    LeaderboardEntry.objects.filter(pk=new_entry.pk).update(
-                        score=F("score") + int(delta)
-                    )
+    if raw:
+        return
+    current = instance.tracked_state()
+    previous = None if created else getattr(instance, "_tracked_state", None)
+    # Handles points changes and moves between challenges/days in one upsert each
+    apply_changes([(previous, current)], using=using)
+    instance._tracked_state = current
 
 
 @receiver(post_delete, sender=EcoAction)
-def ecoaction_post_delete_update_leaderboard(sender, instance: EcoAction, **kwargs):
-    # On deletion, subtract the points from that challenge entry
-    if instance.challenge and instance.points:
-        entry = _ensure_entry(instance.user, instance.challenge)
-        if entry:
-            LeaderboardEntry.objects.filter(pk=entry.pk).update(
-                score=F("score") - int(instance.points)
-            )
+def ecoaction_post_delete_update_derived(sender, instance: EcoAction, using=None, origin=None, **kwargs):
+    # The user's entries and rollups are being cascaded away with them
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is CustomUser:
+        return
+    # On deletion, subtract the points from that challenge entry and day
+    apply_changes([(instance.tracked_state(), None)], using=using)
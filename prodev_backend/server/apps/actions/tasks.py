@@ -0,0 +1,17 @@
+# server/apps/actions/tasks.py
+
+from typing import Optional
+
+from celery import shared_task
+from django.db import router, transaction
+
+from . import rollups
+from .models import UserPointsDaily
+
+
+@shared_task(name="actions.apply_rollup_deltas")
+def apply_rollup_deltas(rows, using: Optional[str] = None) -> int:
+    """Apply daily points rollup deltas queued by an EcoAction write (see rollups.encode_deltas)."""
+    using = using or router.db_for_write(UserPointsDaily)
+    with transaction.atomic(using=using):
+        return rollups.apply_deltas(rollups.decode_deltas(rows), using=using)
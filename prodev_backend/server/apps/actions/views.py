@@ -1,17 +1,34 @@
 # server/apps/actions/views.py
 
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import viewsets, permissions, status
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
+from server.apps.challenges.models import Challenge
+from server.apps.core.caching import RenderedCacheMixin
+from server.apps.core.conditional import ConditionalGetMixin
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
+from server.apps.core.renderers import FastJSONRenderer
+from server.apps.core.projection import ValuesReadViewMixin
+from server.apps.core.versioning import versions_state
+from .export import EXPORT_FORMATS, export_rows
 from .models import EcoAction, ActionTemplate
 from .serializers import (
     EcoActionSerializer,
     EcoActionCreateSerializer,
+    EcoActionBulkCreateSerializer,
     ActionTemplateSerializer,
 )
 from .permissions import IsOwnerOrAdmin
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from rest_framework.response import Response
 
+BULK_MAX_ITEMS = 500
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -52,15 +69,28 @@ from rest_framework.response import Response
 )
 
 
-class EcoActionViewSet(viewsets.ModelViewSet):
+class EcoActionViewSet(ValuesReadViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    """
+    Eco actions CRUD Operations
+    """
     queryset = EcoAction.objects.select_related("user", "challenge").all()
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
     def get_permissions(self):
+        if self.action == "export":
+            return [permissions.IsAuthenticated(), permissions.IsAdminUser()]
         if self.action in ["list", "retrieve", "create"]:
             return [permissions.IsAuthenticated()]
         return [permissions.IsAuthenticated(), IsOwnerOrAdmin()]
 
+    def perform_content_negotiation(self, request, force=False):
+        # On export, ?format= selects the file encoding rather than a DRF
+        # renderer; errors are still rendered as JSON.
+        if self.action == "export":
+            renderer = FastJSONRenderer()
+            return renderer, renderer.media_type
+        return super().perform_content_negotiation(request, force)
+
     def get_serializer_class(self):
         return (
             EcoActionCreateSerializer
@@ -102,7 +132,122 @@ class EcoActionViewSet(viewsets.ModelViewSet):
         )
         return Response(full.data)
 
-class ActionTemplateViewSet(viewsets.ReadOnlyModelViewSet):
+    # ---------- CUSTOM ACTIONS ----------
+
+    @extend_schema(
+        tags=["Actions"],
+        summary="Log many actions at once (offline replay)",
+        request={"application/json": EcoActionCreateSerializer(many=True)},
+        responses={
+            201: {
+                "type": "object",
+                "properties": {
+                    "created": {"type": "array", "items": {"type": "object"}},
+                    "errors": {"type": "array", "items": {"type": "object"}},
+                },
+            },
+            400: None,
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="bulk", parser_classes=[FastJSONParser])
+    def bulk(self, request):
+        """
+        Validate each item independently, insert the valid ones with one
+        bulk_create and apply their leaderboard deltas in aggregate.
+        Rejected items are reported by their index in the payload.
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "Expected a list of actions."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > BULK_MAX_ITEMS:
+            return Response(
+                {"detail": f"At most {BULK_MAX_ITEMS} actions per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = EcoActionBulkCreateSerializer(
+            data=request.data, many=True, context=self.get_serializer_context()
+        )
+        valid, errors = serializer.partition()
+
+        with transaction.atomic():
+            created = EcoAction.objects.bulk_create(
+                [EcoAction(user=request.user, **attrs) for _index, attrs in valid]
+            )
+
+        data = EcoActionSerializer(
+            created, many=True, context=self.get_serializer_context()
+        ).data
+        return Response(
+            {"created": data, "errors": errors},
+            status=status.HTTP_201_CREATED if created or not errors else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @extend_schema(
+        tags=["Actions"],
+        summary="Export all actions as CSV or NDJSON (admin)",
+        parameters=[
+            OpenApiParameter(name="format", type=str, enum=list(EXPORT_FORMATS), description="Output encoding (default: csv)"),
+            OpenApiParameter(name="start", type=str, description="First performed_on day (YYYY-MM-DD)"),
+            OpenApiParameter(name="end", type=str, description="Last performed_on day (YYYY-MM-DD)"),
+            OpenApiParameter(name="action_type", type=str, description="Comma-separated action types"),
+            OpenApiParameter(name="challenge", type=int, description="Challenge ID"),
+        ],
+        responses={(200, "text/csv"): str, (200, "application/x-ndjson"): str, 400: None},
+    )
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """
+        Stream every matching action without materialising the queryset:
+        a values_list() iterator feeds the response chunk by chunk.
+        """
+        params = request.query_params
+        fmt = params.get("format", "csv")
+        if fmt not in EXPORT_FORMATS:
+            return Response(
+                {"format": f"Must be one of: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        qs = EcoAction.objects.all()
+        errors = {}
+        for name, lookup in (("start", "performed_on__gte"), ("end", "performed_on__lte")):
+            if name in params:
+                try:
+                    day = parse_date(params[name])
+                except ValueError:
+                    day = None
+                if day is None:
+                    errors[name] = "Must be a valid YYYY-MM-DD date."
+                else:
+                    qs = qs.filter(**{lookup: day})
+        if params.get("action_type"):
+            types = params["action_type"].split(",")
+            unknown = set(types) - {value for value, _label in EcoAction.ACTION_TYPES}
+            if unknown:
+                errors["action_type"] = f"Unknown action types: {', '.join(sorted(unknown))}."
+            else:
+                qs = qs.filter(action_type__in=types)
+        if params.get("challenge"):
+            if params["challenge"].isdigit():
+                qs = qs.filter(challenge_id=int(params["challenge"]))
+            else:
+                errors["challenge"] = "Must be a challenge ID."
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        encode, content_type = EXPORT_FORMATS[fmt]
+        response = StreamingHttpResponse(encode(export_rows(qs)), content_type=content_type)
+        filename = f"eco-actions-{timezone.localdate():%Y%m%d}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ActionTemplateViewSet(
+    ConditionalGetMixin, RenderedCacheMixin, SparseFieldsetViewMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     Public catalog: list + retrieve.
     """
@@ -110,3 +255,7 @@ class ActionTemplateViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = ActionTemplate.objects.select_related("challenge").all()
     permission_classes = [permissions.AllowAny]
     serializer_class = ActionTemplateSerializer
+
+    def get_data_state(self):
+        # Templates render their challenge, so both tables version the response
+        return versions_state([ActionTemplate, Challenge])
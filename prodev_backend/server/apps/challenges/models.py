@@ -4,6 +4,26 @@ from django.db import models
 from server.apps.core.models import TimeStampedModel
 from server.apps.users.models import CustomUser
 
+PARTICIPANTS_PREVIEW = 10
+
+
+class ChallengeQuerySet(models.QuerySet):
+    def with_participant_summary(self, preview: int = PARTICIPANTS_PREVIEW):
+        """
+        Annotate `participant_count` and prefetch at most `preview` participants
+        per challenge into `participants_preview` (one windowed query), instead of
+        loading every participant.
+        """
+        return self.annotate(
+            participant_count=models.Count("leaderboard_entries", distinct=True)
+        ).prefetch_related(
+            models.Prefetch(
+                "participants",
+                queryset=CustomUser.objects.only("id", "username", "avatar").order_by("id")[:preview],
+                to_attr="participants_preview",
+            )
+        )
+
 
 class Challenge(TimeStampedModel):
     """
@@ -20,5 +40,7 @@ class Challenge(TimeStampedModel):
         blank=True
     )
 
+    objects = ChallengeQuerySet.as_manager()
+
     def __str__(self):
         return self.title
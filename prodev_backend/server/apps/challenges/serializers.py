@@ -1,6 +1,7 @@
 # server/apps/challenges/serializers.py
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
 from .models import Challenge
 from server.apps.users.models import CustomUser
 
@@ -10,11 +11,16 @@ class UserChallengSerializer(serializers.ModelSerializer):
         model = CustomUser
         fields = ['id', 'username', 'avatar']
 
-class ChallengeSerializer(serializers.ModelSerializer):
-    participants = UserChallengSerializer(many=True)
+class ChallengeSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """
+    Expects a queryset built with `Challenge.objects.with_participant_summary()`:
+    `participants` is a bounded preview, the full list lives at /{id}/participants/.
+    """
+    participant_count = serializers.IntegerField(read_only=True)
+    participants = UserChallengSerializer(source="participants_preview", many=True, read_only=True)
     class Meta:
         model = Challenge
-        fields = ["id", "title", "description", "start_date", "end_date", "participants"]
+        fields = ["id", "title", "description", "start_date", "end_date", "participant_count", "participants"]
 
 class ChallengeCreateSerializer(serializers.ModelSerializer):
     class Meta:
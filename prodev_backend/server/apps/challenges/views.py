@@ -1,11 +1,14 @@
 # server/apps/challenges/views.py
 
 from rest_framework import viewsets, permissions, status
-from rest_framework.parsers import FormParser, MultiPartParser, JSONParser
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
 from rest_framework.decorators import action
 from django.utils import timezone
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
+from server.apps.users.models import CustomUser
 from .models import Challenge
-from .serializers import ChallengeSerializer, ChallengeCreateSerializer
+from .serializers import ChallengeSerializer, ChallengeCreateSerializer, UserChallengSerializer
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -56,25 +59,35 @@ from drf_spectacular.types import OpenApiTypes
 )
 
 
-class ChallengeViewSet(viewsets.ModelViewSet):
+class ChallengeViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Challenge.objects.all()
     serializer_class = ChallengeSerializer
     permission_classes = [permissions.AllowAny]
-    parser_classes = [FormParser, MultiPartParser, JSONParser]
+    parser_classes = [FormParser, MultiPartParser, FastJSONParser]
 
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update"]:
             return ChallengeCreateSerializer
         return ChallengeSerializer
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            qs = qs.with_participant_summary()
+        return qs
+
+    def _summary(self, challenge):
+        # Re-read with the participant count + preview for the detailed response
+        return ChallengeSerializer(
+            Challenge.objects.with_participant_summary().get(pk=challenge.pk),
+            context=self.get_serializer_context(),
+        ).data
+
     def create(self, request, *args, **kwargs):
         create_serializer = self.get_serializer(data=request.data)
         create_serializer.is_valid(raise_exception=True)
         self.perform_create(create_serializer)
-        full_serializer = ChallengeSerializer(
-            create_serializer.instance, context=self.get_serializer_context()
-        )
-        return Response(full_serializer.data, status=status.HTTP_201_CREATED)
+        return Response(self._summary(create_serializer.instance), status=status.HTTP_201_CREATED)
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -83,10 +96,7 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         )
         update_serializer.is_valid(raise_exception=True)
         self.perform_update(update_serializer)
-        full_serializer = ChallengeSerializer(
-            update_serializer.instance, context=self.get_serializer_context()
-        )
-        return Response(full_serializer.data)
+        return Response(self._summary(update_serializer.instance))
 
     # ---------- CUSTOM ACTIONS ----------
 
@@ -123,12 +133,10 @@ class ChallengeViewSet(viewsets.ModelViewSet):
             defaults={"score": 0},
         )
 
-        # Reload participants via serializer
-        data = ChallengeSerializer(
-            challenge, context=self.get_serializer_context()
-        ).data
+        # Reload participant summary via serializer
         return Response(
-            data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+            self._summary(challenge),
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
     @extend_schema(
@@ -145,3 +153,17 @@ class ChallengeViewSet(viewsets.ModelViewSet):
 
         LeaderboardEntry.objects.filter(challenge=challenge, user=request.user).delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(
+        tags=["Challenges"],
+        summary="List the participants of this challenge (cursor paginated)",
+        responses=UserChallengSerializer(many=True),
+    )
+    @action(detail=True, methods=["get"])
+    def participants(self, request, pk=None):
+        challenge = self.get_object()
+        qs = CustomUser.objects.filter(leaderboard_entries__challenge=challenge).only(
+            "id", "username", "avatar"
+        )
+        page = self.paginate_queryset(qs)
+        return self.get_paginated_response(UserChallengSerializer(page, many=True).data)
@@ -1,6 +1,7 @@
 # server/apps/core/apps.py
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
@@ -8,3 +9,10 @@ class CoreConfig(AppConfig):
     name = "server.apps.core"
     label = "core"
 
+    def ready(self):
+        # Serializer timing for RequestMetricsMiddleware; patched once, here,
+        # rather than whenever a middleware chain is built
+        if getattr(settings, "REQUEST_METRICS", True):
+            from .instrumentation import instrument_serializers
+
+            instrument_serializers()
@@ -0,0 +1,169 @@
+# server/apps/core/asyncviews.py
+
+"""
+Async read paths for DRF views, for ASGI deployments (ASYNC_READ_VIEWS=True).
+
+DRF views are synchronous, so under ASGI Django runs each of them in a
+thread. The hot read endpoints also have an async handler that runs on the
+event loop instead:
+
+    - viewsets: `alist` / `aretrieve` methods (AsyncReadViewMixin)
+    - function views: an `async def handler(view, request, ...)`
+
+async_reads() puts the handler behind the view's URL for GET/HEAD. Every
+other method still goes to the sync view, in a thread, as before. Under WSGI
+an async view gets an event loop of its own per request, so the setting is
+off by default and the URLs keep their sync views.
+
+The async dispatch keeps DRF's request handling: content negotiation,
+authentication (awaited when the authenticator has `aauthenticate`),
+permissions, throttles, exception handling and rendering. Handlers must not
+touch lazy relations; Django raises SynchronousOnlyOperation if they do.
+"""
+
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.shortcuts import aget_object_or_404
+from django.urls import URLPattern
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.response import Response
+
+READ_METHODS = ("get", "head")
+
+
+def enabled() -> bool:
+    return getattr(settings, "ASYNC_READ_VIEWS", False)
+
+
+async def aauthenticate(request):
+    """Request._authenticate() with awaitable authenticators."""
+    for authenticator in request.authenticators:
+        try:
+            if hasattr(authenticator, "aauthenticate"):
+                user_auth_tuple = await authenticator.aauthenticate(request)
+            else:
+                user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+        except exceptions.APIException:
+            request._not_authenticated()
+            raise
+
+        if user_auth_tuple is not None:
+            request._authenticator = authenticator
+            request.user, request.auth = user_auth_tuple
+            return
+
+    request._not_authenticated()
+
+
+async def adispatch(view, handler, request, *args, **kwargs):
+    """APIView.dispatch() with an async handler."""
+    view.args = args
+    view.kwargs = kwargs
+    request = view.initialize_request(request, *args, **kwargs)
+    view.request = request
+    view.headers = view.default_response_headers
+
+    try:
+        # Authenticated here, so initial() finds request.user already set
+        await aauthenticate(request)
+        view.initial(request, *args, **kwargs)
+        response = await handler(request, *args, **kwargs)
+    except Exception as exc:
+        response = view.handle_exception(exc)
+
+    view.response = view.finalize_response(request, response, *args, **kwargs)
+    # JSON renders without the database; leave the browsable API to Django's
+    # handler, which renders in a thread
+    renderer = getattr(view.response, "accepted_renderer", None)
+    if renderer is not None and renderer.format == "json":
+        view.response.render()
+    return view.response
+
+
+def async_reads(sync_view, handler=None):
+    """
+    `sync_view` (an as_view() callable) with GET/HEAD served by an async
+    handler: `handler(view, request, *args, **kwargs)`, or for viewsets the
+    class's `a<action>` method. Returns `sync_view` unchanged when
+    ASYNC_READ_VIEWS is off or there is no handler.
+    """
+    cls = getattr(sync_view, "cls", None)
+    actions = getattr(sync_view, "actions", None)
+    action = actions.get("get") if actions else None
+    if handler is None and action:
+        handler = getattr(cls, f"a{action}", None)
+    if not enabled() or cls is None or handler is None:
+        return sync_view
+
+    initkwargs = getattr(sync_view, "initkwargs", {})
+    run_sync = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method.lower() not in READ_METHODS:
+            return await run_sync(request, *args, **kwargs)
+
+        self = cls(**initkwargs)
+        if actions:
+            # What ViewSetMixin.as_view() sets up per request
+            self.action_map = actions
+            self.action = action
+            bound = getattr(self, f"a{action}")
+        else:
+            bound = partial(handler, self)
+        return await adispatch(self, bound, request, *args, **kwargs)
+
+    # URL resolution and schema generation look at these
+    view.__name__ = sync_view.__name__
+    view.__doc__ = sync_view.__doc__
+    view.cls = cls
+    view.initkwargs = initkwargs
+    if actions:
+        view.actions = actions
+    return csrf_exempt(view)
+
+
+def async_routes(patterns):
+    """async_reads() for every router URL whose viewset has an async handler for its GET action."""
+    return [
+        URLPattern(pattern.pattern, async_reads(pattern.callback), pattern.default_args, pattern.name)
+        if isinstance(pattern, URLPattern)
+        else pattern
+        for pattern in patterns
+    ]
+
+
+class AsyncReadViewMixin:
+    """alist()/aretrieve() twins of ListModelMixin/RetrieveModelMixin."""
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = None
+        if self.paginator is not None:
+            page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer([obj async for obj in queryset.aiterator()], many=True)
+        return Response(serializer.data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            obj = await aget_object_or_404(queryset, **filter_kwargs)
+        except (TypeError, ValueError, ValidationError):
+            # Same as rest_framework.generics.get_object_or_404
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
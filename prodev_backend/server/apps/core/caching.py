@@ -0,0 +1,118 @@
+# server/apps/core/caching.py
+
+"""
+Server-side cache of rendered JSON bodies, keyed by data version.
+
+The key embeds the view's data-state token (see conditional.DataStateMixin),
+so a save/delete that bumps a table version makes old entries unreachable;
+nothing has to be deleted. A hit returns the stored bytes without touching
+the queryset, the serializer or the renderer.
+
+Bodies are compressed once when stored (gzip, plus brotli when the `brotli`
+package is installed) and served in the encoding the client accepts.
+"""
+
+import gzip
+import hashlib
+import re
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import cc_delim_re, patch_vary_headers
+from rest_framework.response import Response
+
+from .conditional import DataStateMixin
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+RENDERED_CACHE_PREFIX = "rendered"
+
+COMPRESSORS = {"gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0)}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=9)
+
+# Preferred first when the client accepts several
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def accepted_encoding(request) -> str:
+    """The best stored encoding the client accepts, or "" for identity."""
+    header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    offered = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        match = re.search(r"q=([0-9.]+)", params)
+        offered[name.strip().lower()] = float(match.group(1)) if match else 1.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in COMPRESSORS and offered.get(encoding, offered.get("*", 0)) > 0:
+            return encoding
+    return ""
+
+
+class RenderedCacheMixin(DataStateMixin):
+    """
+    Caches JSON responses of `cached_actions`. Other formats (e.g. the
+    browsable API, which embeds the user and CSRF token) are never cached.
+    """
+
+    cached_actions = ("list",)
+    cache_alias = "default"
+    cache_timeout = 60 * 60 * 24
+
+    def _cacheable(self):
+        renderer = getattr(self.request, "accepted_renderer", None)
+        return self.action in self.cached_actions and renderer is not None and renderer.format == "json"
+
+    def representation_variant(self) -> str:
+        # Cached responses are sent compressed, so validators differ per encoding
+        return accepted_encoding(self.request) if self._cacheable() else ""
+
+    def rendered_cache_key(self) -> str:
+        token, _last_modified = self.data_state()
+        # Absolute: bodies carry next/previous links built from scheme and host
+        raw = "|".join([token, self.request.build_absolute_uri(), self.request.accepted_media_type])
+        return f"{RENDERED_CACHE_PREFIX}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    def _encoded_response(self, content_type, bodies, status=200):
+        encoding = accepted_encoding(self.request)
+        response = HttpResponse(bodies[encoding], content_type=content_type, status=status)
+        if encoding:
+            response["Content-Encoding"] = encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+    def cached(self, handler, request, *args, **kwargs):
+        """Serve `handler`'s response from the cache when possible."""
+        if self._cacheable():
+            hit = caches[self.cache_alias].get(self.rendered_cache_key())
+            if hit is not None:
+                content_type, bodies = hit
+                return self._encoded_response(content_type, bodies)
+        return handler(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached(super().list, request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if not (isinstance(response, Response) and response.status_code == 200 and self._cacheable()):
+            return response
+
+        response.render()
+        bodies = {"": response.content}
+        for encoding, compress in COMPRESSORS.items():
+            bodies[encoding] = compress(response.content)
+        content_type = response["Content-Type"]
+        caches[self.cache_alias].set(self.rendered_cache_key(), (content_type, bodies), self.cache_timeout)
+
+        # Send the same bytes a later hit would
+        encoded = self._encoded_response(content_type, bodies)
+        for header, value in response.items():
+            if header.lower() == "vary":
+                patch_vary_headers(encoded, cc_delim_re.split(value))
+            elif header.lower() not in ("content-type", "content-length"):
+                encoded.setdefault(header, value)
+        return encoded
@@ -0,0 +1,87 @@
+# server/apps/core/conditional.py
+
+"""
+Conditional GET (ETag / Last-Modified / 304) for near-static viewsets.
+
+The validators come from one cheap query (see `get_data_state`), so a
+revalidation that hits never touches the queryset or the serializer.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+class DataStateMixin:
+    """
+    Subclasses implement get_data_state() -> (token, last_modified), where the
+    token changes whenever anything the response renders changes.
+    """
+
+    def get_data_state(self) -> Tuple[str, Optional[datetime]]:
+        raise NotImplementedError
+
+    def representation_variant(self) -> str:
+        """Anything besides the absolute URL and media type that changes the response bytes."""
+        return ""
+
+    def data_state(self) -> Tuple[str, Optional[datetime]]:
+        # Views are instantiated per request, so this is queried at most once
+        if not hasattr(self, "_data_state"):
+            self._data_state = self.get_data_state()
+        return self._data_state
+
+
+class ConditionalGetMixin(DataStateMixin):
+    """
+    Adds strong ETags and Last-Modified to list/retrieve and answers
+    If-None-Match / If-Modified-Since with 304 before doing any work.
+    """
+
+    conditional_actions = ("list", "retrieve")
+
+    def get_etag(self, token: str) -> str:
+        # The same data renders differently per URL (scheme and host appear in
+        # the pagination links; ?fields=, cursor), negotiated format and content
+        # encoding, so all are part of the validator.
+        key = "|".join([
+            token,
+            self.request.build_absolute_uri(),
+            self.request.accepted_media_type or "",
+            self.representation_variant(),
+        ])
+        return '"%s"' % hashlib.sha1(key.encode()).hexdigest()
+
+    def _validators(self):
+        token, last_modified = self.data_state()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return self.get_etag(token), timestamp
+
+    def _set_validators(self, response, etag, timestamp):
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # Cacheable, but always revalidated
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def conditional(self, handler, request, *args, **kwargs):
+        if self.action not in self.conditional_actions:
+            return handler(request, *args, **kwargs)
+        etag, timestamp = self._validators()
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return self._set_validators(not_modified, etag, timestamp)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            self._set_validators(response, etag, timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
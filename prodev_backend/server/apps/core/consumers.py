@@ -0,0 +1,69 @@
+# server/apps/core/consumers.py
+
+"""
+ws/live/ — one authenticated socket per client, multiplexing:
+
+    {"type": "notification.created", "data": {...notification}}
+    {"type": "leaderboard.scores", "data": {"challenge": 3, "changes": [{"user": 7, "delta": 10}]}}
+
+The socket joins the user's group and the group of every challenge the user
+has joined. After joining another challenge mid-session the client sends
+{"subscribe": <challenge_id>}.
+"""
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from server.apps.leaderboard.models import LeaderboardEntry
+
+from .realtime import challenge_group, user_group
+
+UNAUTHORIZED = 4401
+
+
+class LiveConsumer(AsyncJsonWebsocketConsumer):
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=UNAUTHORIZED)
+            return
+        self.subscribed = {user_group(user.id)}
+        self.subscribed.update(challenge_group(cid) for cid in await self._joined_challenges())
+        for group in self.subscribed:
+            await self.channel_layer.group_add(group, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        for group in getattr(self, "subscribed", ()):
+            await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        challenge_id = content.get("subscribe") if isinstance(content, dict) else None
+        if not isinstance(challenge_id, int) or not await self._has_joined(challenge_id):
+            await self.send_json({"type": "error", "data": {"detail": "Unknown or unjoined challenge."}})
+            return
+        group = challenge_group(challenge_id)
+        if group not in self.subscribed:
+            self.subscribed.add(group)
+            await self.channel_layer.group_add(group, self.channel_name)
+        await self.send_json({"type": "subscribed", "data": {"challenge": challenge_id}})
+
+    # ---------- Group event handlers ----------
+
+    async def forward(self, event):
+        await self.send_json({"type": event["type"], "data": event["payload"]})
+
+    notification_created = forward
+    leaderboard_scores = forward
+
+    # ---------- Helpers ----------
+
+    @database_sync_to_async
+    def _joined_challenges(self):
+        return list(
+            LeaderboardEntry.objects.filter(user_id=self.scope["user"].id).values_list("challenge_id", flat=True)
+        )
+
+    @database_sync_to_async
+    def _has_joined(self, challenge_id):
+        return LeaderboardEntry.objects.filter(user_id=self.scope["user"].id, challenge_id=challenge_id).exists()
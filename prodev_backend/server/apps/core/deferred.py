@@ -0,0 +1,39 @@
+# server/apps/core/deferred.py
+
+"""
+Queue Celery tasks once the current transaction commits, so workers never
+see rows that were rolled back and the request never waits on the work.
+When the broker can't be reached the task runs inline instead.
+"""
+
+import logging
+from typing import Optional
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+def _send(task, args, kwargs):
+    try:
+        task.apply_async(args=args, kwargs=kwargs)
+    except Exception:  # noqa: BLE001 - the write is already committed
+        if task.app.conf.task_always_eager:
+            # apply_async already ran the task here; it is the task that failed
+            logger.exception("%s failed", task.name)
+            return
+        # Broker unreachable: run it here rather than lose the work
+        logger.exception("Could not queue %s; running it inline", task.name)
+        try:
+            task.apply(args=args, kwargs=kwargs, throw=True)
+        except Exception:  # noqa: BLE001
+            logger.exception("Inline run of %s failed", task.name)
+
+
+def defer(task, *args, using: Optional[str] = None, **kwargs):
+    """
+    Queue `task(*args, using=using, **kwargs)` after `using` commits.
+    Arguments must be JSON-serializable (eager mode skips serialization).
+    """
+    kwargs["using"] = using
+    transaction.on_commit(lambda: _send(task, args, kwargs), using=using)
@@ -0,0 +1,100 @@
+# server/apps/core/fieldsets.py
+
+"""
+Sparse fieldsets: `?fields=id,score` renders only those top-level fields and
+lets the view load only the columns they need.
+"""
+
+from typing import Optional, Set
+
+from django.core.exceptions import FieldDoesNotExist
+
+FIELDS_PARAM = "fields"
+
+
+def requested_fields(request) -> Optional[Set[str]]:
+    """The `?fields=` selection, or None when every field was asked for."""
+    if request is None:
+        return None
+    raw = request.query_params.get(FIELDS_PARAM) if hasattr(request, "query_params") else None
+    if not raw:
+        return None
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    return names or None
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Drops top-level fields not listed in `?fields=`. Nested serializers are
+    rendered whole. Unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        wanted = requested_fields(self.context.get("request"))
+        if wanted and wanted & set(self.fields):
+            for name in set(self.fields) - wanted:
+                self.fields.pop(name)
+
+
+class SparseFieldsetViewMixin:
+    """
+    For list/retrieve with `?fields=`, narrows the queryset with `.only()` and
+    keeps select_related() only for relations that are still rendered.
+    Falls back to the full queryset whenever a requested field can't be mapped
+    to a column (methods, properties, "*" sources).
+    """
+
+    sparse_actions = ("list", "retrieve")
+
+    def filter_queryset(self, queryset):
+        qs = super().filter_queryset(queryset)
+        if getattr(self, "action", None) not in self.sparse_actions:
+            return qs
+        wanted = requested_fields(self.request)
+        if not wanted:
+            return qs
+        return sparse_queryset(qs, self.get_serializer_class()().fields, wanted)
+
+
+def _select_related_paths(tree, prefix=""):
+    for name, children in tree.items():
+        path = f"{prefix}{name}"
+        yield path
+        yield from _select_related_paths(children, f"{path}__")
+
+
+def sparse_queryset(qs, serializer_fields, wanted):
+    matched = wanted & set(serializer_fields)
+    if not matched:
+        return qs
+
+    meta = qs.model._meta
+    columns = {meta.pk.name}
+    relations = set()
+    for name in matched:
+        root = serializer_fields[name].source.split(".")[0]
+        if root in qs.query.annotations:
+            continue
+        try:
+            field = meta.get_field(root)
+        except FieldDoesNotExist:
+            return qs
+        if not field.concrete or field.many_to_many:
+            return qs
+        columns.add(field.name)
+        if field.is_relation:
+            relations.add(field.name)
+
+    select_related = qs.query.select_related
+    if select_related:
+        paths = (
+            _select_related_paths(select_related)
+            if isinstance(select_related, dict)
+            else relations
+        )
+        keep = [path for path in paths if path.split("__")[0] in relations]
+        qs = qs.select_related(None)
+        if keep:
+            qs = qs.select_related(*keep)
+    return qs.only(*columns)
@@ -0,0 +1,271 @@
+# server/apps/core/instrumentation.py
+
+"""
+Per-request performance metrics.
+
+RequestMetricsMiddleware records, for every request:
+
+    db      SQL queries and time spent in them (connection.execute_wrapper)
+    ser     time inside serializer.data, minus the queries it triggered
+    render  time to render the response body
+    total   time spent in Django, and the response size
+
+and sends them back as a Server-Timing header (visible in the browser's
+network panel):
+
+    Server-Timing: db;dur=3.1;desc="4 queries", ser;dur=1.9, render;dur=0.4, total;dur=7.2
+
+With the "server.requests" logger at INFO (REQUEST_LOG_LEVEL; WARNING by
+default) each request is also logged as one JSON line. Serializer timing is
+installed by CoreConfig.ready().
+
+The slow-request sampler (SLOW_REQUEST_MS > 0) also keeps the SQL of sampled
+requests and logs the statements of the slowest ones, grouped so an N+1 shows
+up as one statement run many times. With it off, the only per-query work is
+a counter and a timer.
+"""
+
+import heapq
+import json
+import logging
+import random
+import threading
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger("server.requests")
+
+MAX_CAPTURED_QUERIES = 500
+SLOW_STATEMENTS_LOGGED = 10
+
+_current: ContextVar[Optional["RequestMetrics"]] = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Accumulates one request's numbers; also the execute_wrapper callable."""
+
+    __slots__ = ("queries", "db_ms", "serializer_ms", "render_ms", "sql", "_serializing", "_render_start")
+
+    def __init__(self, capture_sql: bool = False):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.serializer_ms = 0.0
+        self.render_ms = 0.0
+        self.sql: Optional[List[tuple]] = [] if capture_sql else None
+        self._serializing = False
+        self._render_start = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (perf_counter() - start) * 1000
+            self.queries += 1
+            self.db_ms += elapsed
+            if self.sql is not None and len(self.sql) < MAX_CAPTURED_QUERIES:
+                self.sql.append((sql, elapsed))
+
+    def statements(self) -> List[Dict]:
+        """Captured SQL grouped by statement text, most expensive first."""
+        grouped: Dict[str, List[float]] = {}
+        for sql, elapsed in self.sql or ():
+            grouped.setdefault(sql, []).append(elapsed)
+        ranked = sorted(grouped.items(), key=lambda item: sum(item[1]), reverse=True)
+        return [
+            {"sql": sql, "count": len(times), "ms": round(sum(times), 2)}
+            for sql, times in ranked[:SLOW_STATEMENTS_LOGGED]
+        ]
+
+
+# ---------- Serializer timing ----------
+
+def _timed(getter):
+    @wraps(getter)
+    def data(self):
+        metrics = _current.get()
+        # Only the outermost .data is timed (ListSerializer.data calls the base one)
+        if metrics is None or metrics._serializing:
+            return getter(self)
+        metrics._serializing = True
+        db_before = metrics.db_ms
+        start = perf_counter()
+        try:
+            return getter(self)
+        finally:
+            metrics._serializing = False
+            # Lazy querysets are evaluated here; count them as db, not ser
+            metrics.serializer_ms += (perf_counter() - start) * 1000 - (metrics.db_ms - db_before)
+
+    data._request_metrics = True
+    return data
+
+
+def instrument_serializers():
+    """Wrap DRF's Serializer.data properties with the timer (idempotent)."""
+    from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+
+    for cls in (BaseSerializer, Serializer, ListSerializer):
+        prop = cls.__dict__.get("data")
+        if isinstance(prop, property) and not getattr(prop.fget, "_request_metrics", False):
+            setattr(cls, "data", property(_timed(prop.fget)))
+
+
+# ---------- Slow-request sampler ----------
+
+class SlowRequestSampler:
+    """Keeps the `keep` slowest sampled requests of this process."""
+
+    def __init__(self, threshold_ms: float, rate: float, keep: int):
+        self.threshold_ms = threshold_ms
+        self.rate = rate
+        self.keep = keep
+        self._worst: List[tuple] = []  # min-heap of (ms, seq, entry)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def should_capture(self) -> bool:
+        return self.rate >= 1 or random.random() < self.rate
+
+    def offer(self, total_ms: float, entry: Dict) -> bool:
+        """Record a finished request; True if it is among the slowest so far."""
+        if total_ms < self.threshold_ms:
+            return False
+        with self._lock:
+            self._seq += 1
+            item = (total_ms, self._seq, entry)
+            if len(self._worst) < self.keep:
+                heapq.heappush(self._worst, item)
+                return True
+            if total_ms > self._worst[0][0]:
+                heapq.heapreplace(self._worst, item)
+                return True
+        return False
+
+    def worst(self) -> List[Dict]:
+        with self._lock:
+            return [entry for _ms, _seq, entry in sorted(self._worst, reverse=True)]
+
+
+# ---------- Middleware ----------
+
+def _wrap_connections(stack: ExitStack, metrics: RequestMetrics):
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(metrics))
+
+
+def _ms(value: float) -> float:
+    return round(value, 2)
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_METRICS", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        threshold = getattr(settings, "SLOW_REQUEST_MS", 0)
+        self.sampler = (
+            SlowRequestSampler(
+                threshold,
+                getattr(settings, "SLOW_REQUEST_SAMPLE_RATE", 1.0),
+                getattr(settings, "SLOW_REQUEST_KEEP", 20),
+            )
+            if threshold > 0
+            else None
+        )
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = RequestMetrics(capture_sql=self.sampler is not None and self.sampler.should_capture())
+        token = _current.set(metrics)
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                _wrap_connections(stack, metrics)
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (perf_counter() - start) * 1000
+        self._report(request, response, metrics, total_ms)
+        return response
+
+    async def __acall__(self, request):
+        # Under ASGI the ORM runs in the request's thread-sensitive executor
+        # thread, whose connections are not the event loop thread's: install
+        # (and later remove) the wrappers there.
+        metrics = RequestMetrics(capture_sql=self.sampler is not None and self.sampler.should_capture())
+        token = _current.set(metrics)
+        start = perf_counter()
+        stack = ExitStack()
+        try:
+            await sync_to_async(_wrap_connections)(stack, metrics)
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            _current.reset(token)
+        total_ms = (perf_counter() - start) * 1000
+        self._report(request, response, metrics, total_ms)
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before DRF/template responses are rendered
+        metrics = _current.get()
+        if metrics is not None:
+            metrics._render_start = perf_counter()
+            response.add_post_render_callback(lambda r: self._rendered(metrics))
+        return response
+
+    @staticmethod
+    def _rendered(metrics: RequestMetrics):
+        metrics.render_ms = (perf_counter() - metrics._render_start) * 1000
+
+    def _report(self, request, response, metrics: RequestMetrics, total_ms: float):
+        size = None if response.streaming else len(response.content)
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={_ms(metrics.db_ms)};desc="{metrics.queries} queries"',
+                f"ser;dur={_ms(metrics.serializer_ms)}",
+                f"render;dur={_ms(metrics.render_ms)}",
+                f"total;dur={_ms(total_ms)}",
+            ]
+        )
+
+        capture = metrics.sql is not None and total_ms >= self.sampler.threshold_ms
+        if not (capture or logger.isEnabledFor(logging.INFO)):
+            return
+
+        match = request.resolver_match
+        entry = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "total_ms": _ms(total_ms),
+            "db_ms": _ms(metrics.db_ms),
+            "queries": metrics.queries,
+            "serializer_ms": _ms(metrics.serializer_ms),
+            "render_ms": _ms(metrics.render_ms),
+            "bytes": size,
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(entry))
+
+        if capture:
+            slow = {**entry, "statements": metrics.statements()}
+            if self.sampler.offer(total_ms, slow):
+                logger.warning(json.dumps({"slow": True, **slow}))
@@ -13,3 +13,16 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class TableVersion(models.Model):
+    """
+    Monotonic change counter per table, for models without timestamps.
+    Bumped on every save/delete of a tracked model (see core/versioning.py).
+    """
+    label = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.label} v{self.version}"
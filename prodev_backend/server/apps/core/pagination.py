@@ -0,0 +1,90 @@
+# server/apps/core/pagination.py
+
+"""
+Shared pagination for list endpoints.
+"""
+
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Project-wide default: cursor pagination, stable under inserts and O(page)
+    on deep pages (no OFFSET scans).
+
+    Views choose the ordering with a `cursor_ordering` attribute; it must start
+    with an indexed column and end with a unique one (usually "id").
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "id"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset() for async views: the same cursor handling, with the
+        page fetched through the async ORM. Mirrors DRF's implementation.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            order = self.ordering[0]
+            is_reversed = order.startswith("-")
+            order_attr = order.lstrip("-")
+            if self.cursor.reverse != is_reversed:
+                queryset = queryset.filter(**{order_attr + "__lt": current_position})
+            else:
+                queryset = queryset.filter(**{order_attr + "__gt": current_position})
+
+        # One extra row tells whether there is a following page
+        results = [obj async for obj in queryset[offset:offset + self.page_size + 1]]
+        self.page = results[:self.page_size]
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
@@ -0,0 +1,227 @@
+# server/apps/core/projection.py
+
+"""
+Values-based read path: a ModelSerializer's list output built from one
+`.values()` query with joined lookups, instead of model instances and a
+get_attribute()/to_representation() call per field per row.
+
+compile_projection() maps every readable field of a serializer instance
+(after sparse fieldsets dropped theirs) to a column lookup:
+
+    model field, dotted source   ->  "points", "country__continent_id"
+    PrimaryKeyRelatedField       ->  the FK column ("country")
+    nested ModelSerializer       ->  its own fields under the relation
+                                     ("user__username"); None when the FK is null
+
+Values the database already returns in their JSON form (text, integers,
+booleans) are used as fetched; everything else still goes through the
+field's own to_representation(), so rows come out exactly as the serializer
+renders them. Serializers with a field that has no column (method fields,
+properties, "*" sources, many=True, paths through nullable relations)
+compile to None and keep the normal path.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+
+# (DRF field, model field) pairs whose to_representation() returns fetched values unchanged
+PASSTHROUGH = (
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField, models.AutoField)),
+    (serializers.BooleanField, (models.BooleanField,)),
+)
+
+UNSUPPORTED = (serializers.ManyRelatedField, serializers.ListSerializer, serializers.SerializerMethodField)
+
+
+class Projection:
+    """
+    A compiled serializer: `lookups` to pass to values() and `row()` to turn
+    one values() dict into the serializer's output.
+    """
+
+    def __init__(self, serializer, spec, lookups: Tuple[str, ...]):
+        self.serializer = serializer
+        self.spec = spec
+        self.lookups = lookups
+
+    def values(self, queryset, *extra: str):
+        """`queryset` as values() dicts with every column the rows need, plus `extra` (e.g. cursor columns)."""
+        names = self.lookups + tuple(name for name in extra if name not in self.lookups)
+        return queryset.values(*names)
+
+    def row(self, values: Dict) -> Dict:
+        return _build(self.spec, values)
+
+    def rows(self, values) -> List[Dict]:
+        spec = self.spec
+        return [_build(spec, row) for row in values]
+
+
+def _build(spec, values):
+    ret = {}
+    for name, lookup, convert, nested in spec:
+        value = values[lookup]
+        if value is None:
+            ret[name] = None
+        elif nested is not None:
+            ret[name] = _build(nested, values)
+        elif convert is None:
+            ret[name] = value
+        else:
+            ret[name] = convert(value)
+    return ret
+
+
+class ProjectedListSerializer(serializers.ListSerializer):
+    """ListSerializer over values() dicts, rendered by a Projection; read-only."""
+
+    def __init__(self, *args, projection: Projection, **kwargs):
+        self.projection = projection
+        super().__init__(*args, child=projection.serializer, **kwargs)
+
+    def to_representation(self, data):
+        return self.projection.rows(data)
+
+
+def _model_field(model, source_attrs) -> Optional[models.Field]:
+    """
+    The model field at the end of `source_attrs`, following non-null forward
+    relations only; None when the path leaves the columns.
+    """
+    field = None
+    for attr in source_attrs:
+        if field is not None:
+            if not (field.many_to_one or field.one_to_one) or field.null:
+                return None
+            model = field.related_model
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+    return field
+
+
+def _passthrough(field, model_field) -> bool:
+    return any(
+        isinstance(model_field, model_types)
+        and isinstance(field, drf_type)
+        and type(field).to_representation is drf_type.to_representation
+        for drf_type, model_types in PASSTHROUGH
+    )
+
+
+def _compile(serializer, model, prefix: str, lookups: List[str]):
+    if not isinstance(serializer, serializers.ModelSerializer):
+        return None
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return None
+    if serializer.Meta.model is not model and not issubclass(model, serializer.Meta.model):
+        return None
+
+    spec = []
+    for field in serializer._readable_fields:
+        if field.source == "*" or isinstance(field, UNSUPPORTED):
+            return None
+        model_field = _model_field(model, field.source_attrs)
+        if model_field is None:
+            return None
+        lookup = prefix + "__".join(field.source_attrs)
+
+        if isinstance(field, serializers.BaseSerializer):
+            # Nested: the FK column itself is the null check, then the related row's columns
+            if not model_field.is_relation or not (model_field.many_to_one or model_field.one_to_one):
+                return None
+            nested = _compile(field, model_field.related_model, f"{lookup}__", lookups)
+            if nested is None:
+                return None
+            spec.append((field.field_name, lookup, None, nested))
+        elif isinstance(field, PrimaryKeyRelatedField):
+            if len(field.source_attrs) != 1 or field.pk_field is not None or not model_field.is_relation:
+                return None
+            spec.append((field.field_name, lookup, None, None))
+        elif isinstance(field, serializers.RelatedField):
+            return None
+        else:
+            spec.append((field.field_name, lookup, None if _passthrough(field, model_field) else field.to_representation, None))
+        lookups.append(lookup)
+    return spec
+
+
+def compile_projection(serializer) -> Optional[Projection]:
+    """A Projection of `serializer` (an instance, so sparse fieldsets apply), or None if it can't be compiled."""
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+    if model is None:
+        return None
+    lookups: List[str] = []
+    spec = _compile(serializer, model, "", lookups)
+    if spec is None:
+        return None
+    return Projection(serializer, spec, tuple(dict.fromkeys(lookups)))
+
+
+def projected(serializer_class, queryset, **kwargs):
+    """
+    serializer_class(queryset, many=True, **kwargs), rendered from values()
+    when the serializer compiles.
+    """
+    projection = compile_projection(serializer_class(**kwargs))
+    if projection is None:
+        return serializer_class(queryset, many=True, **kwargs)
+    return ProjectedListSerializer(projection.values(queryset), projection=projection, **kwargs)
+
+
+async def aprojected(serializer_class, queryset, **kwargs):
+    """projected() with the rows fetched through the async ORM."""
+    projection = compile_projection(serializer_class(**kwargs))
+    if projection is None:
+        return serializer_class([obj async for obj in queryset.aiterator()], many=True, **kwargs)
+    rows = [row async for row in projection.values(queryset)]
+    return ProjectedListSerializer(rows, projection=projection, **kwargs)
+
+
+class ValuesReadViewMixin:
+    """
+    Serves `values_actions` from a projection of the read serializer:
+    filter_queryset() returns values() dicts and get_serializer(many=True) a
+    ProjectedListSerializer over them. Pagination is unchanged; cursor
+    pagination reads its position from the dicts, so the cursor column is
+    fetched too. Views whose serializer doesn't compile keep the normal path.
+    """
+
+    values_actions = ("list",)
+
+    def get_projection(self) -> Optional[Projection]:
+        if getattr(self, "action", None) not in self.values_actions:
+            return None
+        if not hasattr(self, "_projection"):
+            self._projection = compile_projection(super().get_serializer())
+        return self._projection
+
+    def filter_queryset(self, queryset):
+        qs = super().filter_queryset(queryset)
+        projection = self.get_projection()
+        if projection is None:
+            return qs
+        return projection.values(qs, *self._cursor_columns(qs))
+
+    def get_serializer(self, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None or not kwargs.get("many") or "data" in kwargs:
+            return super().get_serializer(*args, **kwargs)
+        kwargs.pop("many")
+        kwargs.setdefault("context", self.get_serializer_context())
+        return ProjectedListSerializer(*args, projection=projection, **kwargs)
+
+    def _cursor_columns(self, queryset) -> Tuple[str, ...]:
+        paginator = self.paginator
+        if paginator is None or not hasattr(paginator, "get_ordering"):
+            return ()
+        ordering = paginator.get_ordering(self.request, queryset, self)
+        return (ordering[0].lstrip("-"),) if ordering else ()
@@ -0,0 +1,60 @@
+# server/apps/core/realtime.py
+
+"""
+Publishing side of the WebSocket push (see consumers.py).
+
+Events are sent to channel-layer groups after the surrounding transaction
+commits, so clients never hear about rows that were rolled back:
+
+    user.<id>       -> new notifications for that user
+    challenge.<id>  -> score changes in that challenge
+
+Channel-layer errors are logged and never fail the write.
+"""
+
+import logging
+from typing import Iterable, Optional, Tuple
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+Message = Tuple[str, dict]  # (group, event)
+
+
+def user_group(user_id: int) -> str:
+    return f"user.{user_id}"
+
+
+def challenge_group(challenge_id: int) -> str:
+    return f"challenge.{challenge_id}"
+
+
+def event(kind: str, payload) -> dict:
+    """`kind` maps to a consumer handler: "notification.created" -> notification_created()."""
+    return {"type": kind, "payload": payload}
+
+
+async def _send_all(layer, messages):
+    for group, message in messages:
+        try:
+            await layer.group_send(group, message)
+        except Exception:  # noqa: BLE001 - pushes are best effort
+            logger.warning("Realtime publish to %s failed", group, exc_info=True)
+
+
+def _send(messages):
+    layer = get_channel_layer()
+    if layer is None:
+        return
+    # One hop into the event loop per commit, not per message
+    async_to_sync(_send_all)(layer, messages)
+
+
+def publish_on_commit(messages: Iterable[Message], using: Optional[str] = None):
+    """Send (group, event) pairs once the current transaction commits."""
+    messages = list(messages)
+    if messages:
+        transaction.on_commit(lambda: _send(messages), using=using)
@@ -0,0 +1,57 @@
+# server/apps/core/renderers.py
+
+"""
+JSON rendering on orjson, when it is installed.
+
+FastJSONRenderer produces what DRF's JSONRenderer does with the default
+settings (compact, UTF-8, datetimes as ISO 8601 with "Z" for UTC, U+2028/2029
+escaped) and encodes dates, times, UUIDs and dict/list subclasses natively.
+Everything else (Decimal, timedelta, lazy strings, querysets, ...) goes
+through DRF's JSONEncoder.default(), so it comes out as before. The stdlib
+encoder still renders when orjson can't: indented output (the browsable API,
+`; indent=` in Accept), non-default UNICODE_JSON/COMPACT_JSON, integers beyond
+64 bits and non-string keys. Unlike the stdlib encoder, orjson writes NaN and
+infinities as null instead of failing.
+
+bytes are taken as an already encoded body and sent unchanged, so JSON kept
+in a cache doesn't have to be decoded to be served.
+"""
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+PRE_ENCODED = (bytes, bytearray, memoryview)
+
+# DRF's conversions for the types orjson doesn't encode itself
+_default = encoders.JSONEncoder().default
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, PRE_ENCODED):
+            return bytes(data)
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            # Let the stdlib encoder render it, or raise the error it always raised
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same as JSONRenderer: U+2028/2029 are valid JSON but not valid JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,149 @@
+# server/apps/core/tests.py
+
+"""
+The values() read path (projection.py) must render exactly what the
+serializers render from model instances, for every row shape the hot list
+endpoints serve: null foreign keys, empty optional columns and `?fields=`
+subsets.
+
+    python manage.py test server.apps.core
+"""
+
+import json
+from datetime import date
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from server.apps.actions.models import EcoAction
+from server.apps.actions.serializers import EcoActionSerializer
+from server.apps.challenges.models import Challenge
+from server.apps.core.projection import compile_projection, projected
+from server.apps.leaderboard.models import LeaderboardEntry
+from server.apps.leaderboard.serializers import LeaderboardEntrySerializer
+from server.apps.location.models import City, Continent, Country
+from server.apps.location.serializers import CitySerializer
+from server.apps.notifications.models import Notification
+from server.apps.notifications.serializers import NotificationSerializer
+from server.apps.users.models import CustomUser
+
+CASES = [
+    (EcoActionSerializer, lambda: EcoAction.objects.select_related("user", "challenge").order_by("id")),
+    (LeaderboardEntrySerializer, lambda: LeaderboardEntry.objects.select_related("user", "challenge").order_by("id")),
+    (NotificationSerializer, lambda: Notification.objects.select_related("user").order_by("id")),
+    (CitySerializer, lambda: City.objects.select_related("country", "country__continent").order_by("id")),
+]
+
+SUBSETS = [
+    "id",
+    "id,user",
+    "user,challenge",
+    "challenge,points,score",
+    "message,is_read",
+    "name,country",
+    "id,unknown",
+    "unknown",
+]
+
+
+def _request(query=""):
+    return Request(APIRequestFactory().get(f"/api/?{query}"))
+
+
+class ProjectionFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            username="alice", email="alice@example.com", password="x", avatar="https://example.com/a.png"
+        )
+        # No avatar at all, and an empty one
+        cls.other = CustomUser.objects.create_user(username="bob", email="bob@example.com", password="x")
+        cls.empty = CustomUser.objects.create_user(username="eve", email="eve@example.com", password="x", avatar="")
+        cls.challenge = Challenge.objects.create(
+            title="Plastic-free week", description="", start_date=date(2026, 1, 1), end_date=date(2026, 1, 8)
+        )
+
+        for i, user in enumerate((cls.user, cls.other, cls.empty)):
+            EcoAction.objects.create(user=user, action_type="recycling", description=f"with {i}", points=i, challenge=cls.challenge)
+            EcoAction.objects.create(user=user, action_type="transport", description="no challenge", points=-i)
+            LeaderboardEntry.objects.create(user=user, challenge=cls.challenge, score=10 * i)
+            Notification.objects.create(user=user, message=f"Hello {user.username}   ✓", is_read=bool(i % 2))
+
+        africa = Continent.objects.create(name="Africa")
+        kenya = Country.objects.create(name="Kenya", code="KE", continent=africa)
+        City.objects.create(name="Nairobi", country=kenya)
+        City.objects.create(name="Nyeri", country=kenya)
+
+
+class ProjectionEquivalenceTests(ProjectionFixtureMixin, APITestCase):
+    def assertSameOutput(self, serializer_class, queryset, request=None):
+        context = {"request": request}
+        self.assertIsNotNone(compile_projection(serializer_class(context=context)))
+        expected = serializer_class(queryset, many=True, context=context).data
+        actual = projected(serializer_class, queryset, context=context).data
+        self.assertEqual(actual, expected)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_full_rows(self):
+        for serializer_class, queryset in CASES:
+            with self.subTest(serializer_class.__name__):
+                self.assertSameOutput(serializer_class, queryset())
+
+    def test_null_foreign_keys(self):
+        queryset = EcoAction.objects.select_related("user", "challenge").filter(challenge__isnull=True)
+        self.assertTrue(queryset.exists())
+        self.assertSameOutput(EcoActionSerializer, queryset)
+        self.assertEqual({row["challenge"] for row in projected(EcoActionSerializer, queryset).data}, {None})
+
+    def test_empty_queryset(self):
+        for serializer_class, queryset in CASES:
+            with self.subTest(serializer_class.__name__):
+                self.assertSameOutput(serializer_class, queryset().none())
+
+    def test_sparse_fieldsets(self):
+        for serializer_class, queryset in CASES:
+            for fields in SUBSETS:
+                with self.subTest(serializer_class.__name__, fields=fields):
+                    self.assertSameOutput(serializer_class, queryset(), _request(f"fields={fields}"))
+
+
+class ValuesReadViewTests(ProjectionFixtureMixin, APITestCase):
+    """The list endpoints against their serializer over the same rows, in the same order."""
+
+    ENDPOINTS = [
+        ("/api/actions/eco-actions/", EcoActionSerializer, EcoAction.objects.select_related("user", "challenge")),
+        ("/api/leaderboard/", LeaderboardEntrySerializer, LeaderboardEntry.objects.select_related("user", "challenge")),
+        ("/api/notifications/", NotificationSerializer, Notification.objects.select_related("user")),
+        ("/api/location/cities/", CitySerializer, City.objects.select_related("country", "country__continent")),
+    ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def _results(self, url, query=""):
+        response = self.client.get(f"{url}?{query}", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200, response.content)
+        return response, json.loads(response.content)["results"]
+
+    def assertListMatchesSerializer(self, url, serializer_class, queryset, query=""):
+        # The unfiltered page gives the row order; `?fields=` may leave out the ids
+        _response, full = self._results(url)
+        self.assertTrue(full)
+        response, results = self._results(url, query)
+        rows = queryset.in_bulk([row["id"] for row in full])
+        context = {"request": Request(response.wsgi_request)}
+        expected = serializer_class([rows[row["id"]] for row in full], many=True, context=context).data
+        self.assertEqual(results, json.loads(JSONRenderer().render(expected)))
+
+    def test_lists(self):
+        for url, serializer_class, queryset in self.ENDPOINTS:
+            with self.subTest(url):
+                self.assertListMatchesSerializer(url, serializer_class, queryset)
+
+    def test_lists_with_sparse_fieldsets(self):
+        for url, serializer_class, queryset in self.ENDPOINTS:
+            for fields in SUBSETS:
+                with self.subTest(url, fields=fields):
+                    self.assertListMatchesSerializer(url, serializer_class, queryset, f"fields={fields}")
+
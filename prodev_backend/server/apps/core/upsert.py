@@ -0,0 +1,89 @@
+# server/apps/core/upsert.py
+
+"""
+Additive upserts for counter tables (leaderboard scores, rollups).
+
+    INSERT INTO t (k1, k2, v1) VALUES (...), (...)
+    ON CONFLICT (k1, k2) DO UPDATE SET v1 = t.v1 + EXCLUDED.v1
+
+Callers aggregate their deltas per key first, so each key appears once per
+statement (Postgres rejects touching the same row twice in one upsert).
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+from django.db import connections, router, transaction
+from django.db.models import F
+
+UPSERT_BATCH_SIZE = 500
+UPSERT_VENDORS = {"postgresql", "sqlite"}
+
+Row = Tuple[tuple, tuple]  # (key values, increment values)
+
+
+def increment_upsert(
+    model,
+    key_fields: Sequence[str],
+    value_fields: Sequence[str],
+    rows: Iterable[Row],
+    using: Optional[str] = None,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> int:
+    """
+    Add `value_fields` increments to the rows identified by `key_fields`,
+    creating missing rows. `key_fields` must be covered by a unique constraint.
+    Returns the number of keys written.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    if connection.vendor not in UPSERT_VENDORS:
+        with transaction.atomic(using=using):
+            _fallback(model, key_fields, value_fields, rows, using)
+        return len(rows)
+
+    if len(rows) <= batch_size:
+        # A single statement is atomic on its own
+        _upsert(connection, model, key_fields, value_fields, rows)
+    else:
+        with transaction.atomic(using=using):
+            for start in range(0, len(rows), batch_size):
+                _upsert(connection, model, key_fields, value_fields, rows[start:start + batch_size])
+    return len(rows)
+
+
+def _upsert(connection, model, key_fields, value_fields, rows):
+    qn = connection.ops.quote_name
+    meta = model._meta
+    table = qn(meta.db_table)
+    keys = [qn(meta.get_field(name).column) for name in key_fields]
+    values = [qn(meta.get_field(name).column) for name in value_fields]
+
+    row_sql = "(" + ", ".join(["%s"] * (len(keys) + len(values))) + ")"
+    params = []
+    for key, increments in rows:
+        params.extend(key)
+        params.extend(increments)
+
+    assignments = ", ".join(f"{col} = {table}.{col} + EXCLUDED.{col}" for col in values)
+    sql = (
+        f"INSERT INTO {table} ({', '.join(keys + values)}) "
+        f"VALUES {', '.join([row_sql] * len(rows))} "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {assignments}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _fallback(model, key_fields, value_fields, rows, using):
+    # Backends without ON CONFLICT: one get_or_create + F() update per key.
+    manager = model._default_manager.db_manager(using)
+    for key, increments in rows:
+        lookup = dict(zip(key_fields, key))
+        obj, _ = manager.get_or_create(**lookup, defaults={name: 0 for name in value_fields})
+        manager.filter(pk=obj.pk).update(
+            **{name: F(name) + inc for name, inc in zip(value_fields, increments)}
+        )
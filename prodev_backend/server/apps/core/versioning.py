@@ -0,0 +1,66 @@
+# server/apps/core/versioning.py
+
+"""
+Per-table version counters (TableVersion) for cache validation.
+
+    track(Continent, Country, City)        # in AppConfig.ready()
+    versions_state([Country, Continent])   # -> ("location.continent:3,...", last change)
+
+Writes that bypass model signals (bulk_create, queryset.update) should call
+bump() themselves.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .models import TableVersion
+
+
+def label_for(model) -> str:
+    return model._meta.label_lower
+
+
+def bump(model, using: Optional[str] = None):
+    """Record a change to `model`'s table."""
+    label = label_for(model)
+    now = timezone.now()
+    manager = TableVersion.objects.db_manager(using)
+    if manager.filter(label=label).update(version=F("version") + 1, updated_at=now):
+        return
+    _row, created = manager.get_or_create(label=label, defaults={"version": 1, "updated_at": now})
+    if not created:
+        # Another writer created it first; still count this change
+        manager.filter(label=label).update(version=F("version") + 1, updated_at=now)
+
+
+def _bump_on_change(sender, using=None, **kwargs):
+    bump(sender, using=using)
+
+
+def track(*models):
+    """Bump the table version on every save/delete of these models."""
+    for model in models:
+        uid = f"table-version:{label_for(model)}"
+        post_save.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+
+
+def versions_state(models: Iterable, using: Optional[str] = None) -> Tuple[str, Optional[datetime]]:
+    """
+    One query: a token that changes whenever any of the tables changes, and
+    the time of the latest change (None if none was ever recorded).
+    """
+    labels = sorted(label_for(model) for model in models)
+    rows = dict(
+        (label, (version, updated_at))
+        for label, version, updated_at in TableVersion.objects.using(using)
+        .filter(label__in=labels)
+        .values_list("label", "version", "updated_at")
+    )
+    token = ",".join(f"{label}:{rows.get(label, (0, None))[0]}" for label in labels)
+    changed = [updated_at for _version, updated_at in rows.values()]
+    return token, max(changed) if changed else None
@@ -0,0 +1,48 @@
+# server/apps/core/ws_auth.py
+
+"""
+JWT authentication for WebSocket connections.
+
+Browsers can't set headers on a WebSocket handshake, so the access token is
+read from `?token=` and, for other clients, from an `Authorization: Bearer`
+header. scope["user"] is the token's user or AnonymousUser.
+"""
+
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+
+from server.apps.users.authentication import CachedJWTAuthentication
+
+
+def _raw_token(scope):
+    query = parse_qs(scope.get("query_string", b"").decode())
+    if query.get("token"):
+        return query["token"][0]
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, token = value.decode().partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token
+    return None
+
+
+@database_sync_to_async
+def _user_for(raw_token):
+    auth = CachedJWTAuthentication()
+    try:
+        return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        raw_token = _raw_token(scope)
+        scope = dict(scope, user=await _user_for(raw_token) if raw_token else AnonymousUser())
+        return await self.app(scope, receive, send)
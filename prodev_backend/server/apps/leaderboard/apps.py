@@ -7,3 +7,7 @@ class LeaderboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'server.apps.leaderboard'
     label = "leaderboard"
+
+    def ready(self):
+        # Import signals so they register
+        from . import signals  # noqa
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0003_challenge_participants'),
+        ('leaderboard', '0003_alter_leaderboardentry_challenge_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leaderboardentry',
+            index=models.Index(fields=['challenge', '-score', 'id'], name='leaderboard_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,217 @@
+# server/apps/leaderboard/mirror.py
+
+"""
+Optional sorted-set mirror of LeaderboardEntry.score, one set per challenge.
+
+Enabled with settings.LEADERBOARD_REDIS_URL:
+    ""          -> disabled, every read goes to the database
+    "memory://" -> in-process stand-in (tests, single-process dev)
+    "redis://…" -> Redis
+
+Members are LeaderboardEntry ids, zero-padded to a fixed width, and scores are
+stored negated. ZRANGE then lists (score DESC, id ASC), the database's order:
+tied members sort by their bytes, which for padded ids is ascending id.
+
+Writes are mirrored after the surrounding transaction commits. Mirror errors are
+logged and never fail the request; `manage.py rebuild_leaderboard_sets` brings
+the sets back in line with the database.
+"""
+
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Sets keyed by user id used "leaderboard:challenge:"; run rebuild_leaderboard_sets after upgrading
+KEY_PREFIX = "leaderboard:entries:"
+REBUILD_CHUNK = 1000
+MEMBER_WIDTH = 20  # digits of the largest bigint id
+
+Pair = Tuple[int, int]  # (entry_id, score)
+
+
+def key_for(challenge_id: int) -> str:
+    return f"{KEY_PREFIX}{challenge_id}"
+
+
+def member(entry_id: int) -> str:
+    return f"{entry_id:0{MEMBER_WIDTH}d}"
+
+
+class RedisLeaderboard:
+    """Sorted sets in Redis (or anything speaking redis-py's API, e.g. fakeredis)."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def incr(self, items: Iterable[Tuple[Tuple[int, int], int]]):
+        """`items`: ((entry_id, challenge_id), delta)."""
+        pipe = self.client.pipeline(transaction=False)
+        for (entry_id, challenge_id), delta in items:
+            pipe.zincrby(key_for(challenge_id), -delta, member(entry_id))
+        pipe.execute()
+
+    def set(self, challenge_id: int, entry_id: int, score: int, only_new: bool = False):
+        self.client.zadd(key_for(challenge_id), {member(entry_id): -score}, nx=only_new)
+
+    def remove(self, challenge_id: int, entry_id: int):
+        self.client.zrem(key_for(challenge_id), member(entry_id))
+
+    @staticmethod
+    def _pairs(rows) -> List[Pair]:
+        return [(int(name), -int(score)) for name, score in rows]
+
+    def top(self, challenge_id: int, n: int) -> List[Pair]:
+        return self._pairs(self.client.zrange(key_for(challenge_id), 0, n - 1, withscores=True))
+
+    def around(self, challenge_id: int, entry_id: int, n: int) -> Optional[List[Pair]]:
+        key = key_for(challenge_id)
+        position = self.client.zrank(key, member(entry_id))
+        if position is None:
+            return None
+        return self._pairs(self.client.zrange(key, max(0, position - n), position + n, withscores=True))
+
+    def ranks(self, challenge_id: int, scores: Iterable[int]) -> Dict[int, int]:
+        """Competition rank for each score: members with a strictly higher score + 1."""
+        scores = sorted(set(scores))
+        pipe = self.client.pipeline(transaction=False)
+        for score in scores:
+            pipe.zcount(key_for(challenge_id), "-inf", f"({-score}")
+        return {score: higher + 1 for score, higher in zip(scores, pipe.execute())}
+
+    def replace(self, challenge_id: int, pairs: Iterable[Pair]) -> int:
+        """Rebuild a set off to the side, then swap it in atomically with RENAME."""
+        key = key_for(challenge_id)
+        tmp = f"{key}:rebuild"
+        self.client.delete(tmp)
+        total = 0
+        chunk = {}
+        for entry_id, score in pairs:
+            chunk[member(entry_id)] = -score
+            if len(chunk) >= REBUILD_CHUNK:
+                self.client.zadd(tmp, chunk)
+                total += len(chunk)
+                chunk = {}
+        if chunk:
+            self.client.zadd(tmp, chunk)
+            total += len(chunk)
+        if total:
+            self.client.rename(tmp, key)
+        else:
+            self.client.delete(key)
+        return total
+
+
+class InMemoryLeaderboard:
+    """
+    Process-local stand-in with the same interface as RedisLeaderboard.
+    Reads sort on demand, so it is meant for tests and small dev databases.
+    """
+
+    def __init__(self):
+        self.sets = defaultdict(dict)
+
+    def incr(self, items):
+        for (entry_id, challenge_id), delta in items:
+            board = self.sets[challenge_id]
+            board[entry_id] = board.get(entry_id, 0) + delta
+
+    def set(self, challenge_id, entry_id, score, only_new=False):
+        board = self.sets[challenge_id]
+        if only_new and entry_id in board:
+            return
+        board[entry_id] = score
+
+    def remove(self, challenge_id, entry_id):
+        self.sets[challenge_id].pop(entry_id, None)
+
+    def _ordered(self, challenge_id):
+        # Same order as ZRANGE over the negated scores: score DESC, id ASC
+        return sorted(self.sets[challenge_id].items(), key=lambda kv: (-kv[1], kv[0]))
+
+    def top(self, challenge_id, n):
+        return self._ordered(challenge_id)[:n]
+
+    def around(self, challenge_id, entry_id, n):
+        rows = self._ordered(challenge_id)
+        ids = [entry for entry, _score in rows]
+        if entry_id not in ids:
+            return None
+        position = ids.index(entry_id)
+        return rows[max(0, position - n): position + n + 1]
+
+    def ranks(self, challenge_id, scores):
+        values = list(self.sets[challenge_id].values())
+        return {score: 1 + sum(1 for v in values if v > score) for score in set(scores)}
+
+    def replace(self, challenge_id, pairs):
+        self.sets[challenge_id] = dict(pairs)
+        if not self.sets[challenge_id]:
+            del self.sets[challenge_id]
+            return 0
+        return len(self.sets[challenge_id])
+
+
+@lru_cache(maxsize=None)
+def _board_for(url: str):
+    if not url:
+        return None
+    if url == "memory://":
+        return InMemoryLeaderboard()
+    import redis
+
+    return RedisLeaderboard(redis.Redis.from_url(url))
+
+
+def get_board():
+    """The configured mirror, or None when disabled."""
+    return _board_for(getattr(settings, "LEADERBOARD_REDIS_URL", ""))
+
+
+def _safely(operation, *args):
+    try:
+        operation(*args)
+    except Exception:  # noqa: BLE001 - the database stays the source of truth
+        logger.warning("Leaderboard mirror update failed", exc_info=True)
+
+
+def mirror_on_commit(method: str, *args, using: Optional[str] = None):
+    """Run `board.<method>(*args)` once the current transaction commits."""
+    board = get_board()
+    if board is None:
+        return
+    transaction.on_commit(lambda: _safely(getattr(board, method), *args), using=using)
+
+
+def _incr_by_entry(board, items, using):
+    from .models import LeaderboardEntry
+
+    deltas = dict(items)
+    entries = (
+        LeaderboardEntry.objects.using(using)
+        .filter(user_id__in={user_id for user_id, _c in deltas}, challenge_id__in={c for _u, c in deltas})
+        .values_list("id", "user_id", "challenge_id")
+    )
+    board.incr(
+        ((entry_id, challenge_id), deltas[(user_id, challenge_id)])
+        for entry_id, user_id, challenge_id in entries
+        if (user_id, challenge_id) in deltas
+    )
+
+
+def mirror_increments_on_commit(items, using: Optional[str] = None):
+    """
+    Mirror score deltas keyed by (user_id, challenge_id) once the transaction
+    commits; the entry ids the sets are keyed by are looked up then, when the
+    upserted rows are visible.
+    """
+    board = get_board()
+    if board is None:
+        return
+    items = list(items)
+    transaction.on_commit(lambda: _safely(_incr_by_entry, board, items, using), using=using)
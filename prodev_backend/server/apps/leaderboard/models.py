@@ -16,6 +16,10 @@ class LeaderboardEntry(models.Model):
     class Meta:
         unique_together = ("user", "challenge")
         ordering = ["-score"]
+        indexes = [
+            # Serves ranked reads: WHERE challenge = ? ORDER BY score DESC, id
+            models.Index(fields=["challenge", "-score", "id"], name="leaderboard_rank_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.challenge.title}: {self.score} pts"
@@ -0,0 +1,201 @@
+# server/apps/leaderboard/ranking.py
+
+"""
+Ranked reads for a single challenge.
+
+Entries are ordered by (score DESC, id ASC), which the (challenge, -score, id)
+index serves directly. Pages are fetched by keyset on that pair, RANK() and
+DENSE_RANK() are computed in SQL over the page rows only, and then shifted by
+one aggregate anchored on the first row of the page:
+
+    rank       = rows with a higher score + 1           (ties share a rank)
+    dense_rank = distinct higher scores + 1
+
+so neither a deep page nor "my rank" needs a window over the whole challenge.
+
+When the sorted-set mirror is enabled (see mirror.py), top-N and "my rank" are
+served from ZRANGE/ZRANK/ZCOUNT instead, in the same order, with one query to
+load the rows. Dense ranks count distinct scores within the window; a window
+that doesn't start at rank 1 takes its distinct higher scores from one
+aggregate, as a database page does.
+"""
+
+import base64
+import logging
+from typing import List, Optional, Tuple
+
+from django.db.models import Count, F, Q, Subquery
+from django.db.models.functions import DenseRank, Rank
+from django.db.models.expressions import Window
+
+from .mirror import get_board
+from .models import LeaderboardEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_NEIGHBOURS = 50
+
+RANK_ORDER = [F("score").desc(), F("id").asc()]
+
+Cursor = Tuple[int, int]  # (score, id) of the last row already served
+
+
+def encode_cursor(entry) -> str:
+    raw = f"{entry.score}:{entry.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(value: str) -> Optional[Cursor]:
+    try:
+        score, pk = base64.urlsafe_b64decode(value.encode()).decode().split(":")
+        return int(score), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _after(cursor: Cursor) -> Q:
+    score, pk = cursor
+    return Q(score__lt=score) | Q(score=score, id__gt=pk)
+
+
+def _before(cursor: Cursor) -> Q:
+    score, pk = cursor
+    return Q(score__gt=score) | Q(score=score, id__lt=pk)
+
+
+def _with_page_ranks(queryset):
+    # Window over the (already bounded) rows of the page only
+    return (
+        queryset.select_related("user")
+        .annotate(
+            page_rank=Window(Rank(), order_by=F("score").desc()),
+            page_dense_rank=Window(DenseRank(), order_by=F("score").desc()),
+        )
+        .order_by(*RANK_ORDER)
+    )
+
+
+def _apply_global_ranks(challenge_id: int, rows: List[LeaderboardEntry]) -> List[LeaderboardEntry]:
+    """Shift page-local ranks by the number of rows ahead of the first row."""
+    if not rows:
+        return rows
+    first = rows[0]
+    anchor = LeaderboardEntry.objects.filter(
+        challenge_id=challenge_id, score__gte=first.score
+    ).aggregate(
+        higher=Count("id", filter=Q(score__gt=first.score)),
+        tied_before=Count("id", filter=Q(score=first.score, id__lt=first.id)),
+        distinct_higher=Count("score", distinct=True, filter=Q(score__gt=first.score)),
+    )
+    _shift(rows, anchor["higher"], anchor["tied_before"], anchor["distinct_higher"])
+    return rows
+
+
+def _shift(rows, higher: int, tied_before: int, distinct_higher: int):
+    first_score = rows[0].score
+    for row in rows:
+        if row.score == first_score:
+            row.rank = higher + 1
+        else:
+            # Every row tied with the first one (on earlier pages too) is ahead
+            row.rank = higher + tied_before + row.page_rank
+        row.dense_rank = distinct_higher + row.page_dense_rank
+
+
+def ranking_page(
+    challenge_id: int, cursor: Optional[Cursor] = None, page_size: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[LeaderboardEntry], Optional[LeaderboardEntry]]:
+    """
+    Return (rows, last_row_if_more). Each row carries `rank` and `dense_rank`.
+    """
+    keys = LeaderboardEntry.objects.filter(challenge_id=challenge_id)
+    if cursor:
+        keys = keys.filter(_after(cursor))
+    # Fetch one extra row to know whether another page exists; being last in
+    # order it cannot change the ranks of the rows before it.
+    keys = keys.order_by(*RANK_ORDER).values("id")[: page_size + 1]
+
+    rows = list(_with_page_ranks(LeaderboardEntry.objects.filter(id__in=Subquery(keys))))
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if cursor:
+        _apply_global_ranks(challenge_id, rows)
+    else:
+        _shift(rows, 0, 0, 0)
+    return rows, (rows[-1] if has_more and rows else None)
+
+
+def ranking_around(
+    challenge_id: int, entry: LeaderboardEntry, neighbours: int
+) -> List[LeaderboardEntry]:
+    """`entry` plus up to `neighbours` rows above and below it, all ranked."""
+    base = LeaderboardEntry.objects.filter(challenge_id=challenge_id)
+    anchor = (entry.score, entry.id)
+    above = base.filter(_before(anchor)).order_by("score", "-id").values_list("id", flat=True)[:neighbours]
+    below = base.filter(_after(anchor)).order_by(*RANK_ORDER).values_list("id", flat=True)[:neighbours]
+    ids = [*above, entry.id, *below]
+
+    rows = list(_with_page_ranks(LeaderboardEntry.objects.filter(id__in=ids)))
+    return _apply_global_ranks(challenge_id, rows)
+
+
+# ---------- Sorted-set mirror reads ----------
+
+def _rows_from_mirror(board, challenge_id: int, pairs) -> List[LeaderboardEntry]:
+    """Load the entries behind mirror members and rank them from the mirror's scores."""
+    if not pairs:
+        return []
+    entries = LeaderboardEntry.objects.select_related("user").in_bulk([entry_id for entry_id, _score in pairs])
+    ranks = board.ranks(challenge_id, [score for _entry_id, score in pairs])
+    first_score = pairs[0][1]
+    distinct_higher = 0
+    if ranks[first_score] > 1:
+        distinct_higher = LeaderboardEntry.objects.filter(
+            challenge_id=challenge_id, score__gt=first_score
+        ).aggregate(n=Count("score", distinct=True))["n"]
+
+    # Pairs come in (score DESC, id ASC) order already
+    rows = []
+    previous = None
+    for entry_id, score in pairs:
+        entry = entries.get(entry_id)
+        if entry is None:  # deleted since; the mirror catches up on commit
+            continue
+        if score != previous:
+            distinct_higher += previous is not None
+            previous = score
+        entry.score = score
+        entry.rank = ranks[score]
+        entry.dense_rank = distinct_higher + 1
+        rows.append(entry)
+    return rows
+
+
+def top_entries(challenge_id: int, n: int) -> List[LeaderboardEntry]:
+    """Top `n` entries of a challenge, from the mirror when it is enabled."""
+    board = get_board()
+    if board is not None:
+        try:
+            return _rows_from_mirror(board, challenge_id, board.top(challenge_id, n))
+        except Exception:  # noqa: BLE001 - fall back to the database
+            logger.warning("Leaderboard mirror read failed", exc_info=True)
+    rows, _last = ranking_page(challenge_id, None, n)
+    return rows
+
+
+def entries_around(
+    challenge_id: int, entry: LeaderboardEntry, neighbours: int
+) -> List[LeaderboardEntry]:
+    """Like ranking_around(), served by ZRANK + ZRANGE when the mirror is enabled."""
+    board = get_board()
+    if board is not None:
+        try:
+            pairs = board.around(challenge_id, entry.id, neighbours)
+            if pairs is not None:
+                return _rows_from_mirror(board, challenge_id, pairs)
+        except Exception:  # noqa: BLE001 - fall back to the database
+            logger.warning("Leaderboard mirror read failed", exc_info=True)
+    return ranking_around(challenge_id, entry, neighbours)
@@ -0,0 +1,160 @@
+# server/apps/leaderboard/reconcile.py
+
+"""
+Leaderboard reconciliation: recompute LeaderboardEntry.score from EcoAction
+and correct any drift left by bulk edits, raw SQL or lost score tasks.
+
+Work is done one chunk of challenges at a time, each in its own short
+transaction:
+
+    SELECT ... FROM leaderboard_entry WHERE challenge IN (...) FOR UPDATE
+    SELECT user, challenge, SUM(points) FROM eco_action WHERE challenge IN (...) GROUP BY 1, 2
+    INSERT ... ON CONFLICT DO NOTHING (score 0, for entries that don't exist yet)
+        then both SELECTs again, with the new rows locked too
+    UPDATE ... (one bulk_update for the drifted entries)
+
+Scores are set, never incremented: an entry a score task creates between the
+reads is locked and overwritten like any other, not added to.
+
+Only the chunk's entries are locked, and only while it is being fixed, so
+the command can run against a live database. Score deltas that are still
+queued for a worker (see actions/changes.py) look like drift, so
+`manage.py recompute_leaderboard` refuses to correct anything while
+queued_tasks() reports work waiting.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.db import router, transaction
+from django.db.models import Sum
+
+from server.apps.actions.models import EcoAction
+from server.apps.core.realtime import publish_on_commit
+
+from .mirror import mirror_increments_on_commit
+from .models import LeaderboardEntry
+from .scoring import ScoreKey, score_events
+from .tasks import apply_score_deltas
+
+RECOMPUTE_CHUNK_SIZE = 50  # challenges per transaction
+UPDATE_BATCH_SIZE = 1000
+
+
+@dataclass
+class Drift:
+    """What one reconciliation pass found (and fixed, unless dry_run)."""
+    checked: int = 0
+    # (user_id, challenge_id) -> (stored, expected); stored is None for missing entries
+    drifted: Dict[ScoreKey, Tuple[Optional[int], int]] = field(default_factory=dict)
+
+    @property
+    def missing(self) -> int:
+        return sum(1 for stored, _expected in self.drifted.values() if stored is None)
+
+    @property
+    def total(self) -> int:
+        """Sum of absolute score differences."""
+        return sum(abs(expected - (stored or 0)) for stored, expected in self.drifted.values())
+
+    def merge(self, other: "Drift") -> "Drift":
+        self.checked += other.checked
+        self.drifted.update(other.drifted)
+        return self
+
+
+def expected_scores(challenge_ids: Sequence[int], using: Optional[str] = None) -> Counter:
+    """SUM(points) per (user_id, challenge_id), one aggregate query."""
+    rows = (
+        EcoAction.objects.using(using)
+        .filter(challenge_id__in=challenge_ids)
+        .order_by()
+        .values_list("user_id", "challenge_id")
+        .annotate(total=Sum("points"))
+    )
+    return Counter({(user_id, challenge_id): total or 0 for user_id, challenge_id, total in rows})
+
+
+def _locked_scores(challenge_ids: Sequence[int], using: str) -> Dict[ScoreKey, Tuple[int, int]]:
+    """(user_id, challenge_id) -> (pk, score) of the chunk's entries, locked until commit."""
+    return {
+        (user_id, challenge_id): (pk, score)
+        for pk, user_id, challenge_id, score in LeaderboardEntry.objects.using(using)
+        .select_for_update()
+        .filter(challenge_id__in=challenge_ids)
+        .order_by()
+        .values_list("id", "user_id", "challenge_id", "score")
+    }
+
+
+def reconcile_chunk(challenge_ids: Sequence[int], dry_run: bool = False, using: Optional[str] = None) -> Drift:
+    """Diff and fix the scores of `challenge_ids` in one transaction."""
+    using = using or router.db_for_write(LeaderboardEntry)
+    with transaction.atomic(using=using):
+        stored = _locked_scores(challenge_ids, using)
+        expected = expected_scores(challenge_ids, using=using)
+        drift = Drift(checked=len(stored))
+        missing = {key for key, total in expected.items() if key not in stored and total}
+
+        if dry_run:
+            for key, (_pk, score) in stored.items():
+                if score != expected[key]:
+                    drift.drifted[key] = (score, expected[key])
+            for key in missing:
+                drift.drifted[key] = (None, expected[key])
+            return drift
+
+        if missing:
+            # Rows a score task inserted meanwhile are kept as they are and
+            # locked below with the rest; the sums are read again under the lock
+            LeaderboardEntry.objects.using(using).bulk_create(
+                [LeaderboardEntry(user_id=user_id, challenge_id=challenge_id, score=0) for user_id, challenge_id in missing],
+                batch_size=UPDATE_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            stored = _locked_scores(challenge_ids, using)
+            expected = expected_scores(challenge_ids, using=using)
+
+        updates: List[LeaderboardEntry] = []
+        items = []
+        for key, (pk, score) in stored.items():
+            if score != expected[key]:
+                drift.drifted[key] = (None if key in missing else score, expected[key])
+                updates.append(LeaderboardEntry(pk=pk, score=expected[key]))
+                items.append((key, expected[key] - score))
+
+        if not updates:
+            return drift
+
+        LeaderboardEntry.objects.using(using).bulk_update(updates, ["score"], batch_size=UPDATE_BATCH_SIZE)
+        # bulk_create/bulk_update skip signals; send the corrections like any other score change
+        mirror_increments_on_commit(items, using=using)
+        publish_on_commit(score_events(items), using=using)
+    return drift
+
+
+def queued_tasks(timeout: float = 1.0) -> Optional[int]:
+    """
+    Messages waiting in the default queue plus score tasks held by workers;
+    0 when tasks run inline, None when the broker can't be inspected.
+    """
+    app = apply_score_deltas.app
+    if app.conf.task_always_eager:
+        return 0
+    try:
+        with app.connection_for_read() as connection:
+            waiting = connection.default_channel.queue_declare(
+                queue=app.conf.task_default_queue, passive=True
+            ).message_count
+        inspect = app.control.inspect(timeout=timeout)
+        held = 0
+        for replies in (inspect.active(), inspect.reserved(), inspect.scheduled()):
+            for tasks in (replies or {}).values():
+                held += sum(
+                    1 for task in tasks
+                    if (task.get("name") or task.get("request", {}).get("name")) == apply_score_deltas.name
+                )
+    except Exception:  # noqa: BLE001 - the caller decides what an unknown queue means
+        return None
+    return waiting + held
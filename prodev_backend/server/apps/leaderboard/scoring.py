@@ -0,0 +1,125 @@
+# server/apps/leaderboard/scoring.py
+
+"""
+Leaderboard scoring engine.
+
+EcoAction writes are turned into score deltas keyed by (user_id, challenge_id).
+Deltas are aggregated in memory and applied with a single upsert per batch:
+
+    INSERT ... ON CONFLICT (user_id, challenge_id)
+    DO UPDATE SET score = score + EXCLUDED.score
+
+so logging one action (or ten thousand) costs one round-trip per batch instead
+of a get_or_create plus an UPDATE per row.
+"""
+
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+from django.db import router
+
+from server.apps.core.realtime import challenge_group, event, publish_on_commit
+from server.apps.core.upsert import increment_upsert
+
+from .mirror import mirror_increments_on_commit
+from .models import LeaderboardEntry
+
+# (user_id, challenge_id, points) as stored on an EcoAction row
+ScoreState = Tuple[Optional[int], Optional[int], int]
+ScoreKey = Tuple[int, int]
+
+
+def action_state(action) -> ScoreState:
+    """Project the fields of an EcoAction that affect leaderboard scores."""
+    return (action.user_id, action.challenge_id, int(action.points or 0))
+
+
+def add_state(deltas: Counter, state: Optional[ScoreState], sign: int = 1) -> Counter:
+    """Accumulate `sign * points` for a state into `deltas` (no-op without a challenge)."""
+    if not state:
+        return deltas
+    user_id, challenge_id, points = state
+    if user_id and challenge_id:
+        deltas[(user_id, challenge_id)] += sign * points
+    return deltas
+
+
+def deltas_for_actions(actions: Iterable, sign: int = 1) -> Counter:
+    """Deltas for actions being created (sign=1) or deleted (sign=-1)."""
+    deltas: Counter = Counter()
+    for action in actions:
+        add_state(deltas, action_state(action), sign)
+    return deltas
+
+
+def deltas_for_changes(changes: Iterable[Tuple[Optional[ScoreState], Optional[ScoreState]]]) -> Counter:
+    """
+    Deltas for (previous, current) state pairs.
+    Moving an action between challenges subtracts from the old entry and adds to the new one.
+    """
+    deltas: Counter = Counter()
+    for previous, current in changes:
+        add_state(deltas, previous, -1)
+        add_state(deltas, current, 1)
+    return deltas
+
+
+def apply_deltas(deltas: Counter, using: Optional[str] = None) -> int:
+    """
+    Apply aggregated deltas to LeaderboardEntry.score.
+    Missing entries are created (which also enrols the user in the challenge).
+    Returns the number of (user, challenge) entries touched.
+    """
+    items = [(key, delta) for key, delta in deltas.items() if delta]
+    if not items:
+        return 0
+
+    using = using or router.db_for_write(LeaderboardEntry)
+    increment_upsert(
+        LeaderboardEntry,
+        ("user_id", "challenge_id"),
+        ("score",),
+        ((key, (delta,)) for key, delta in items),
+        using=using,
+    )
+
+    # Increments commute, so concurrent commits can reach the mirror in any order
+    mirror_increments_on_commit(items, using=using)
+    publish_on_commit(score_events(items), using=using)
+    return len(items)
+
+
+def score_events(items):
+    """One "leaderboard.scores" event per challenge, listing each user's delta."""
+    changes = {}
+    for (user_id, challenge_id), delta in items:
+        changes.setdefault(challenge_id, []).append({"user": user_id, "delta": delta})
+    return [
+        (challenge_group(challenge_id), event("leaderboard.scores", {"challenge": challenge_id, "changes": rows}))
+        for challenge_id, rows in changes.items()
+    ]
+
+
+# ---------- Task payloads ----------
+
+def encode_deltas(deltas: Counter) -> list:
+    """JSON form of `deltas` for a Celery task: [[user_id, challenge_id, delta], ...]."""
+    return [[user_id, challenge_id, delta] for (user_id, challenge_id), delta in deltas.items() if delta]
+
+
+def decode_deltas(rows) -> Counter:
+    return Counter({(user_id, challenge_id): delta for user_id, challenge_id, delta in rows})
+
+
+# ---------- Convenience entry points ----------
+
+def record_created(actions: Iterable, using: Optional[str] = None) -> int:
+    return apply_deltas(deltas_for_actions(actions, 1), using=using)
+
+
+def record_deleted(actions: Iterable, using: Optional[str] = None) -> int:
+    return apply_deltas(deltas_for_actions(actions, -1), using=using)
+
+
+def record_changed(changes: Iterable[Tuple[Optional[ScoreState], Optional[ScoreState]]], using: Optional[str] = None) -> int:
+    return apply_deltas(deltas_for_changes(changes), using=using)
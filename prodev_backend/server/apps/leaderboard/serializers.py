@@ -1,6 +1,7 @@
 # server/apps/leaderboard/serializers.py
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
 from .models import LeaderboardEntry
 from server.apps.users.models import CustomUser
 from server.apps.challenges.models import Challenge
@@ -18,13 +19,27 @@ class ChallengeLeaderboardSerializer(serializers.ModelSerializer):
         model = Challenge
         fields = ['id', 'title', 'description']
 
-class LeaderboardEntrySerializer(serializers.ModelSerializer):
+class LeaderboardEntrySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     user = UserLeaderboardSerializer()
     challenge = ChallengeLeaderboardSerializer()
     class Meta:
         model = LeaderboardEntry
         fields = ["id", "user", "challenge", "score"]
 
+class RankedEntrySerializer(serializers.ModelSerializer):
+    """
+    A leaderboard row with its position in the challenge.
+    `rank` is competition ranking (1, 2, 2, 4), `dense_rank` has no gaps (1, 2, 2, 3).
+    """
+    rank = serializers.IntegerField(read_only=True)
+    dense_rank = serializers.IntegerField(read_only=True)
+    user = UserLeaderboardSerializer()
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = ["rank", "dense_rank", "id", "user", "score"]
+
+
 class LeaderboardCreateSerializer(serializers.ModelSerializer):
     # Use PrimaryKeyRelatedField to accept IDs in form/json input
     user = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
@@ -0,0 +1,34 @@
+# server/apps/leaderboard/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from server.apps.core.realtime import challenge_group, event, publish_on_commit
+from .mirror import mirror_on_commit
+from .models import LeaderboardEntry
+
+
+@receiver(post_save, sender=LeaderboardEntry)
+def leaderboardentry_post_save_mirror(sender, instance: LeaderboardEntry, created: bool, raw=False, using=None, **kwargs):
+    """
+    Direct writes (join, admin/CRUD edits) carry an absolute score.
+    New rows only seed the member (NX) so they never clobber increments
+    already queued by the scoring engine.
+    """
+    if raw:
+        return
+    mirror_on_commit("set", instance.challenge_id, instance.id, instance.score, created, using=using)
+    _publish(instance, {"user": instance.user_id, "score": instance.score}, using)
+
+
+@receiver(post_delete, sender=LeaderboardEntry)
+def leaderboardentry_post_delete_mirror(sender, instance: LeaderboardEntry, using=None, **kwargs):
+    mirror_on_commit("remove", instance.challenge_id, instance.id, using=using)
+    _publish(instance, {"user": instance.user_id, "removed": True}, using)
+
+
+def _publish(instance, change, using):
+    payload = {"challenge": instance.challenge_id, "changes": [change]}
+    publish_on_commit(
+        [(challenge_group(instance.challenge_id), event("leaderboard.scores", payload))], using=using
+    )
@@ -0,0 +1,25 @@
+# server/apps/leaderboard/tasks.py
+
+from typing import Optional
+
+from celery import shared_task
+from django.db import router, transaction
+
+from . import scoring
+from .models import LeaderboardEntry
+
+
+@shared_task(name="leaderboard.apply_score_deltas")
+def apply_score_deltas(rows, using: Optional[str] = None) -> int:
+    """Apply score deltas queued by an EcoAction write (see scoring.encode_deltas)."""
+    using = using or router.db_for_write(LeaderboardEntry)
+    with transaction.atomic(using=using):
+        return scoring.apply_deltas(scoring.decode_deltas(rows), using=using)
+
+
+@shared_task(name="leaderboard.recompute")
+def recompute_scores(challenge_ids, using: Optional[str] = None) -> int:
+    """Reconcile the given challenges' scores (see reconcile.py). Returns the number of entries corrected."""
+    from .reconcile import reconcile_chunk
+
+    return len(reconcile_chunk(challenge_ids, using=using).drifted)
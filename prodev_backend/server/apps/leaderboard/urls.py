@@ -1,13 +1,23 @@
 # server/apps/leaderboard/urls.py
 
 from rest_framework.routers import DefaultRouter
-from .views import LeaderboardViewSet
+from .views import (
+    LeaderboardViewSet,
+    challenge_ranking,
+    challenge_ranking_me,
+    challenge_ranking_top,
+)
 from django.urls import path, include
+from server.apps.core.asyncviews import async_routes
 
 
 router = DefaultRouter()
 router.register(r"", LeaderboardViewSet)
 
 urlpatterns = [
-    path("", include(router.urls)),
+    path("challenges/<int:challenge_id>/ranking/", challenge_ranking, name="challenge-ranking"),
+    path("challenges/<int:challenge_id>/ranking/me/", challenge_ranking_me, name="challenge-ranking-me"),
+    path("challenges/<int:challenge_id>/ranking/top/", challenge_ranking_top, name="challenge-ranking-top"),
+    # GET list/retrieve run async under ASGI when ASYNC_READ_VIEWS is on
+    path("", include(async_routes(router.urls))),
 ]
@@ -1,14 +1,29 @@
 # server/apps/leaderboard/views.py
 
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, permissions, status
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
+from rest_framework.utils.urls import replace_query_param
+from server.apps.challenges.models import Challenge
+from server.apps.core.asyncviews import AsyncReadViewMixin
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
+from server.apps.core.projection import ValuesReadViewMixin
+from . import ranking
 from .models import LeaderboardEntry
-from .serializers import LeaderboardEntrySerializer, LeaderboardCreateSerializer, LeaderboardUpdateSerializer
+from .serializers import (
+    LeaderboardEntrySerializer,
+    LeaderboardCreateSerializer,
+    LeaderboardUpdateSerializer,
+    RankedEntrySerializer,
+)
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
     OpenApiParameter
 )
+from drf_spectacular.types import OpenApiTypes
 from rest_framework.response import Response
 
 
@@ -53,14 +68,15 @@ from rest_framework.response import Response
 )
 
 
-class LeaderboardViewSet(viewsets.ModelViewSet):
+class LeaderboardViewSet(AsyncReadViewMixin, ValuesReadViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     Leaderboards CRUD Operations
     """
-    queryset = LeaderboardEntry.objects.all()
+    queryset = LeaderboardEntry.objects.select_related("user", "challenge").all()
     serializer_class = LeaderboardEntrySerializer
+    cursor_ordering = ("-score", "id")
     permission_classes = [permissions.AllowAny]
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -85,3 +101,93 @@ class LeaderboardViewSet(viewsets.ModelViewSet):
         # Use detailed serializer for response
         full_serializer = LeaderboardEntrySerializer(update_serializer.instance, context=self.get_serializer_context())
         return Response(full_serializer.data)
+
+
+# ---------- Ranked reads ----------
+
+def _int_param(request, name, default, maximum):
+    try:
+        value = int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(1, min(value, maximum))
+
+
+CHALLENGE_ID_PARAM = OpenApiParameter(
+    name="challenge_id",
+    description="ID of the challenge",
+    required=True,
+    type=OpenApiTypes.INT,
+    location=OpenApiParameter.PATH,
+)
+
+
+@extend_schema(
+    tags=["Leaderboards"],
+    summary="Ranked leaderboard of a challenge (cursor paginated)",
+    parameters=[
+        CHALLENGE_ID_PARAM,
+        OpenApiParameter(name="cursor", type=OpenApiTypes.STR, description="Opaque cursor from `next`"),
+        OpenApiParameter(name="page_size", type=OpenApiTypes.INT, description=f"Max {ranking.MAX_PAGE_SIZE}"),
+    ],
+    responses=RankedEntrySerializer(many=True),
+)
+@api_view(["GET"])
+@permission_classes([permissions.AllowAny])
+def challenge_ranking(request, challenge_id):
+    challenge = get_object_or_404(Challenge.objects.only("id"), pk=challenge_id)
+    page_size = _int_param(request, "page_size", ranking.DEFAULT_PAGE_SIZE, ranking.MAX_PAGE_SIZE)
+
+    cursor = None
+    if request.query_params.get("cursor"):
+        cursor = ranking.decode_cursor(request.query_params["cursor"])
+        if cursor is None:
+            return Response({"detail": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+
+    rows, last = ranking.ranking_page(challenge.id, cursor, page_size)
+    next_url = None
+    if last is not None:
+        next_url = replace_query_param(
+            request.build_absolute_uri(), "cursor", ranking.encode_cursor(last)
+        )
+    return Response({"next": next_url, "results": RankedEntrySerializer(rows, many=True).data})
+
+
+@extend_schema(
+    tags=["Leaderboards"],
+    summary="Top N of a challenge",
+    parameters=[
+        CHALLENGE_ID_PARAM,
+        OpenApiParameter(name="n", type=OpenApiTypes.INT, description=f"Max {ranking.MAX_PAGE_SIZE}"),
+    ],
+    responses=RankedEntrySerializer(many=True),
+)
+@api_view(["GET"])
+@permission_classes([permissions.AllowAny])
+def challenge_ranking_top(request, challenge_id):
+    challenge = get_object_or_404(Challenge.objects.only("id"), pk=challenge_id)
+    n = _int_param(request, "n", 10, ranking.MAX_PAGE_SIZE)
+    rows = ranking.top_entries(challenge.id, n)
+    return Response({"results": RankedEntrySerializer(rows, many=True).data})
+
+
+@extend_schema(
+    tags=["Leaderboards"],
+    summary="Current user's rank in a challenge plus N neighbours",
+    parameters=[
+        CHALLENGE_ID_PARAM,
+        OpenApiParameter(name="neighbours", type=OpenApiTypes.INT, description=f"Rows above and below (max {ranking.MAX_NEIGHBOURS})"),
+    ],
+    responses={200: RankedEntrySerializer(many=True), 404: None},
+)
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def challenge_ranking_me(request, challenge_id):
+    entry = get_object_or_404(
+        LeaderboardEntry.objects.only("id", "user_id", "score"), challenge_id=challenge_id, user=request.user
+    )
+    neighbours = _int_param(request, "neighbours", 5, ranking.MAX_NEIGHBOURS)
+    rows = ranking.entries_around(challenge_id, entry, neighbours)
+    return Response(
+        {"me": entry.id, "results": RankedEntrySerializer(rows, many=True).data}
+    )
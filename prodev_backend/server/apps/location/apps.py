@@ -5,4 +5,11 @@ from django.apps import AppConfig
 
 class LocationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'server.apps.location' 
+    name = 'server.apps.location'
+
+    def ready(self):
+        # Location tables have no timestamps; version them for HTTP validators
+        from server.apps.core.versioning import track
+        from .models import Continent, Country, City
+
+        track(Continent, Country, City)
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:51
+
+from django.db import migrations, models
+
+from server.apps.location.search import fold
+
+
+def fill_search_name(apps, schema_editor):
+    City = apps.get_model("location", "City")
+    db = schema_editor.connection.alias
+    max_length = City._meta.get_field("search_name").max_length
+    cities = list(City.objects.using(db).only("id", "name"))
+    for city in cities:
+        # Folding can lengthen a name ("ß" -> "ss", ligatures split)
+        city.search_name = fold(city.name)[:max_length]
+    City.objects.using(db).bulk_update(cities, ["search_name"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('location', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='city',
+            name='search_name',
+            field=models.CharField(default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['country', 'search_name'], name='city_country_search_idx', opclasses=['int8_ops', 'varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['search_name'], name='city_search_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -2,6 +2,8 @@
 
 from django.db import models
 
+from .search import fold
+
 
 class Continent(models.Model):
     """Represents a continent e.g. Africa, Asia, Europe"""
@@ -25,6 +27,31 @@ class City(models.Model):
     """Represents a city, linked to a country"""
     name = models.CharField(max_length=100)
     country = models.ForeignKey(Country, on_delete=models.CASCADE, related_name="cities")
+    # Diacritics-folded, lowercased name for prefix search (see search.py)
+    search_name = models.CharField(max_length=100, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            # varchar_pattern_ops lets Postgres serve LIKE 'prefix%' under any collation
+            models.Index(
+                fields=["country", "search_name"],
+                name="city_country_search_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+            models.Index(
+                fields=["search_name"],
+                name="city_search_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Folding can lengthen a name ("ß" -> "ss", ligatures split)
+        self.search_name = fold(self.name)[: self._meta.get_field("search_name").max_length]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name}, {self.country.name}"
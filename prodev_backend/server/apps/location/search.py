@@ -0,0 +1,45 @@
+# server/apps/location/search.py
+
+"""
+City typeahead.
+
+City.search_name holds the name folded to lowercase ASCII ("Bogotá" -> "bogota"),
+so a prefix search is a `LIKE 'bog%'` range scan on the (country, search_name)
+or search_name index instead of a scan of every city.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+from django.db.models import F
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+MAX_QUERY_LENGTH = 100
+
+_SPACES = re.compile(r"\s+")
+
+
+def fold(text: str) -> str:
+    """Strip diacritics, casefold and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _SPACES.sub(" ", stripped.casefold()).strip()
+
+
+def search_cities(query: str, country_code: Optional[str] = None, limit: int = DEFAULT_LIMIT) -> List[dict]:
+    """Top `limit` cities whose folded name starts with the folded query."""
+    from .models import City
+
+    prefix = fold(query)[:MAX_QUERY_LENGTH]
+    if not prefix:
+        return []
+    cities = City.objects.filter(search_name__startswith=prefix)
+    if country_code:
+        cities = cities.filter(country__code=country_code.upper())
+    return list(
+        cities.order_by("search_name", "id").values(
+            "id", "name", "country", country_code=F("country__code")
+        )[:limit]
+    )
@@ -1,10 +1,11 @@
 # server/apps/location/serializers.py
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
 from .models import Continent, Country, City
 
 
-class ContinentSerializer(serializers.ModelSerializer):
+class ContinentSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Continent.
     Exposes: id, name
@@ -15,7 +16,7 @@ class ContinentSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
-class CountrySerializer(serializers.ModelSerializer):
+class CountrySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Country.
     Exposes: id, name, code, continent (FK id) and optional nested continent info.
@@ -28,7 +29,7 @@ class CountrySerializer(serializers.ModelSerializer):
         fields = ["id", "name", "code", "continent", "continent_detail"]
 
 
-class CitySerializer(serializers.ModelSerializer):
+class CitySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for City.
     Exposes: id, name, country (FK id), and optional nested country/continent info.
@@ -41,3 +42,36 @@ class CitySerializer(serializers.ModelSerializer):
     class Meta:
         model = City
         fields = ["id", "name", "country", "continent_id", "country_detail"]
+
+
+class CitySuggestionSerializer(serializers.Serializer):
+    """
+    Compact typeahead row built from values(), without nested objects.
+    Exposes: id, name, country (FK id), country_code
+    """
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    country = serializers.IntegerField()
+    country_code = serializers.CharField()
+
+
+# Tree (documentation only: the tree view renders plain dicts from tree.py)
+class CityLeafSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+
+
+class CountryBranchSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    code = serializers.CharField()
+    cities = CityLeafSerializer(many=True)
+
+
+class ContinentTreeSerializer(serializers.Serializer):
+    """
+    One continent with its countries and their cities, each object once.
+    """
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    countries = CountryBranchSerializer(many=True)
@@ -0,0 +1,28 @@
+# server/apps/location/tree.py
+
+"""
+Continent -> country -> city hierarchy assembled from three flat values()
+queries and grouped in dicts, so each object appears exactly once.
+"""
+
+from collections import defaultdict
+from typing import List
+
+from .models import Continent, Country, City
+
+
+def build_tree() -> List[dict]:
+    cities_by_country = defaultdict(list)
+    for city in City.objects.order_by("name", "id").values("id", "name", "country_id"):
+        cities_by_country[city.pop("country_id")].append(city)
+
+    countries_by_continent = defaultdict(list)
+    for country in Country.objects.order_by("name", "id").values("id", "name", "code", "continent_id"):
+        country["cities"] = cities_by_country.get(country["id"], [])
+        countries_by_continent[country.pop("continent_id")].append(country)
+
+    tree = []
+    for continent in Continent.objects.order_by("name", "id").values("id", "name"):
+        continent["countries"] = countries_by_continent.get(continent["id"], [])
+        tree.append(continent)
+    return tree
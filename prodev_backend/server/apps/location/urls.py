@@ -2,7 +2,7 @@
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ContinentViewSet, CountryViewSet, CityViewSet
+from .views import ContinentViewSet, CountryViewSet, CityViewSet, LocationTreeViewSet
 
 
 app_name = "location"
@@ -13,5 +13,6 @@ router.register(r"countries", CountryViewSet, basename="country")
 router.register(r"cities", CityViewSet, basename="city")
 
 urlpatterns = [
+    path("tree/", LocationTreeViewSet.as_view({"get": "list"}), name="tree"),
     path("", include(router.urls)),
 ]
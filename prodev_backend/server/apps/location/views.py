@@ -1,22 +1,49 @@
 # server/apps/location/views.py
 
-from rest_framework import viewsets, permissions
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from functools import partial
+
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
     OpenApiParameter,
 )
+from server.apps.core.caching import RenderedCacheMixin
+from server.apps.core.conditional import ConditionalGetMixin
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
+from server.apps.core.projection import ValuesReadViewMixin
+from server.apps.core.versioning import versions_state
 from .models import Continent, Country, City
-from .serializers import ContinentSerializer, CountrySerializer, CitySerializer
+from . import search
+from .serializers import (
+    ContinentSerializer,
+    CountrySerializer,
+    CitySerializer,
+    CitySuggestionSerializer,
+    ContinentTreeSerializer,
+)
+from .tree import build_tree
 
 
-class BaseModelViewSet(viewsets.ModelViewSet):
+class BaseModelViewSet(
+    ConditionalGetMixin, RenderedCacheMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet
+):
     """
     Base ModelViewSet.
+    Reads are validated and cached against the version counters of every
+    table the serializer renders (`versioned_models`).
     """
     permission_classes = [permissions.AllowAny]
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    cursor_ordering = ("name", "id")
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
+    versioned_models = ()
+
+    def get_data_state(self):
+        return versions_state(self.versioned_models)
 
 
 # -------------------- Continents --------------------
@@ -74,7 +101,8 @@ class ContinentViewSet(BaseModelViewSet):
     """
     queryset = Continent.objects.all().order_by("name")
     serializer_class = ContinentSerializer
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    versioned_models = (Continent,)
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
 
 # -------------------- Countries --------------------
@@ -132,7 +160,8 @@ class CountryViewSet(BaseModelViewSet):
     """
     queryset = Country.objects.select_related("continent").all().order_by("name")
     serializer_class = CountrySerializer
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    versioned_models = (Country, Continent)
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
 
 # -------------------- Cities --------------------
@@ -184,10 +213,67 @@ class CountryViewSet(BaseModelViewSet):
     ),
 )
 
-class CityViewSet(BaseModelViewSet):
+class CityViewSet(ValuesReadViewMixin, BaseModelViewSet):
     """
     CRUD for cities.
     """
     queryset = City.objects.select_related("country", "country__continent").all().order_by("name")
     serializer_class = CitySerializer
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    versioned_models = (City, Country, Continent)
+    conditional_actions = ("list", "retrieve", "search")
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
+
+    # ---------- CUSTOM ACTIONS ----------
+
+    @extend_schema(
+        tags=["Locations"],
+        summary="Typeahead search for cities by name prefix",
+        parameters=[
+            OpenApiParameter(name="q", type=str, required=True, description="Name prefix; accents and case are ignored"),
+            OpenApiParameter(name="country", type=str, description="ISO country code, e.g. KE"),
+            OpenApiParameter(name="limit", type=int, description=f"Max results (default {search.DEFAULT_LIMIT}, max {search.MAX_LIMIT})"),
+        ],
+        responses={200: CitySuggestionSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"], url_path="search", pagination_class=None)
+    def search(self, request):
+        return self.conditional(self._search, request)
+
+    def _search(self, request):
+        try:
+            limit = int(request.query_params.get("limit", search.DEFAULT_LIMIT))
+        except ValueError:
+            return Response({"limit": "Must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, search.MAX_LIMIT))
+        results = search.search_cities(
+            request.query_params.get("q", ""), request.query_params.get("country"), limit
+        )
+        return Response(CitySuggestionSerializer(results, many=True).data)
+
+
+# -------------------- Tree --------------------
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=["Locations"],
+        summary="Continent -> country -> city hierarchy in one response",
+        request=None,
+        responses={200: ContinentTreeSerializer(many=True)},
+    ),
+)
+
+class LocationTreeViewSet(ConditionalGetMixin, RenderedCacheMixin, viewsets.ViewSet):
+    """
+    The whole hierarchy, validated (ETag/304) and cached pre-compressed
+    against the location table versions.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get_data_state(self):
+        return versions_state((City, Country, Continent))
+
+    def list(self, request):
+        return self.conditional(partial(self.cached, self._tree), request)
+
+    def _tree(self, request):
+        return Response(build_tree())
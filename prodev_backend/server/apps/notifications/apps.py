@@ -7,3 +7,7 @@ class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'server.apps.notifications'
     label = "notifications"
+
+    def ready(self):
+        # Import signals so they register
+        from . import signals  # noqa
@@ -0,0 +1,33 @@
+# server/apps/notifications/counters.py
+
+"""
+Per-user unread notification counters (NotificationCounter).
+Deltas are aggregated per user and applied with one additive upsert.
+"""
+
+from collections import Counter
+from typing import Optional
+
+from django.db import router
+
+from server.apps.core.upsert import increment_upsert
+
+from .models import NotificationCounter
+
+
+def adjust_unread(deltas: Counter, using: Optional[str] = None) -> int:
+    """Add `deltas[user_id]` to each user's unread counter."""
+    rows = [((user_id,), (delta,)) for user_id, delta in deltas.items() if delta]
+    return increment_upsert(
+        NotificationCounter,
+        ("user_id",),
+        ("unread",),
+        rows,
+        using=using or router.db_for_write(NotificationCounter),
+    )
+
+
+def unread_count(user) -> int:
+    return (
+        NotificationCounter.objects.filter(user=user).values_list("unread", flat=True).first() or 0
+    )
@@ -0,0 +1,85 @@
+# server/apps/notifications/fanout.py
+
+"""
+Notification fan-out.
+
+An audience is a queryset of user ids; it is streamed with iterator() so the
+id list is never materialised, and notifications are inserted with one
+bulk_create (plus one unread-counter upsert) per batch:
+
+    fan_out("New challenge is live!", challenge_participants(challenge.id))
+"""
+
+from itertools import islice
+from typing import Iterable, Optional
+
+from django.db import router
+
+from server.apps.leaderboard.models import LeaderboardEntry
+from server.apps.users.models import CustomUser
+
+from .models import Notification
+
+FANOUT_BATCH_SIZE = 1000
+
+AUDIENCES = ("all", "challenge", "city")
+
+
+def all_users():
+    return CustomUser.objects.filter(is_active=True).order_by("id").values_list("id", flat=True)
+
+
+def challenge_participants(challenge_id: int):
+    return (
+        LeaderboardEntry.objects.filter(challenge_id=challenge_id, user__is_active=True)
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+    )
+
+
+def city_residents(city_id: int):
+    return (
+        CustomUser.objects.filter(city_id=city_id, is_active=True)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def audience_ids(audience: str, target_id: Optional[int] = None):
+    """Resolve an audience name (see AUDIENCES) to a user-id queryset."""
+    if audience == "all":
+        return all_users()
+    if audience == "challenge":
+        return challenge_participants(target_id)
+    if audience == "city":
+        return city_residents(target_id)
+    raise ValueError(f"Unknown audience: {audience}")
+
+
+def _stream(user_ids, batch_size: int):
+    if hasattr(user_ids, "iterator"):
+        # Server-side cursor where the backend has one
+        return user_ids.iterator(chunk_size=batch_size)
+    return iter(user_ids)
+
+
+def fan_out(
+    message: str,
+    user_ids: Iterable[int],
+    batch_size: int = FANOUT_BATCH_SIZE,
+    using: Optional[str] = None,
+) -> int:
+    """
+    Send `message` to every user in `user_ids` (a values_list queryset or any
+    iterable of ids). Returns the number of notifications created.
+    """
+    using = using or router.db_for_write(Notification)
+    ids = _stream(user_ids, batch_size)
+    created = 0
+    while batch := list(islice(ids, batch_size)):
+        # Each batch commits on its own (insert + counter upsert)
+        Notification.objects.using(using).bulk_create(
+            [Notification(user_id=user_id, message=message) for user_id in batch]
+        )
+        created += len(batch)
+    return created
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+BACKFILL_BATCH = 1000
+
+
+def backfill_counters(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    NotificationCounter = apps.get_model("notifications", "NotificationCounter")
+    db = schema_editor.connection.alias
+
+    unread = (
+        Notification.objects.using(db)
+        .filter(is_read=False)
+        .values("user_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    batch = []
+    for row in unread.iterator(chunk_size=BACKFILL_BATCH):
+        batch.append(NotificationCounter(user_id=row["user_id"], unread=row["n"]))
+        if len(batch) >= BACKFILL_BATCH:
+            NotificationCounter.objects.using(db).bulk_create(batch)
+            batch = []
+    if batch:
+        NotificationCounter.objects.using(db).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_alter_notification_user'),
+        ('users', '0006_alter_customuser_managers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,47 @@
 # server/apps/notifications/models.py
 
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
+from django.utils import timezone
 from server.apps.users.models import CustomUser
 from server.apps.core.models import TimeStampedModel
 
 
+class NotificationQuerySet(models.QuerySet):
+    """
+    bulk_create skips model signals, so unread counters for the whole batch
+    are applied here with one upsert.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .counters import adjust_unread
+        from .signals import publish_created
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            adjust_unread(Counter(o.user_id for o in created if o.pk and not o.is_read), using=self.db)
+            publish_created([o for o in created if o.pk], using=self.db)
+        for obj in created:
+            obj._loaded_state = obj.counter_state()
+        return created
+
+    def mark_read(self, user_id) -> int:
+        """
+        Mark the user's unread notifications in this queryset as read with one
+        UPDATE and lower their counter by the number of rows it changed.
+        """
+        from .counters import adjust_unread
+
+        with transaction.atomic(using=self.db):
+            updated = self.filter(user_id=user_id, is_read=False).update(
+                is_read=True, updated_at=timezone.now()
+            )
+            adjust_unread(Counter({user_id: -updated}), using=self.db)
+        return updated
+
+
 class Notification(TimeStampedModel):
     """
     User-specific notification for alerts and messages.
@@ -13,5 +50,38 @@ class Notification(TimeStampedModel):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
 
+    objects = NotificationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Per-user inbox, unread filter and newest-first paging
+            models.Index(fields=["user", "is_read", "-created_at"], name="notification_user_inbox_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember (user, is_read) as loaded so saves can adjust unread counters."""
+        instance = super().from_db(db, field_names, values)
+        if not instance.get_deferred_fields() & {"user_id", "is_read"}:
+            instance._loaded_state = instance.counter_state()
+        return instance
+
+    def counter_state(self):
+        return (self.user_id, self.is_read)
+
     def __str__(self):
         return f"To: {self.user.email} | Read: {self.is_read}"
+
+
+class NotificationCounter(models.Model):
+    """
+    Denormalized unread count per user, so reading it is a primary-key lookup
+    instead of COUNT(*) over the user's notifications.
+    """
+    user = models.OneToOneField(
+        CustomUser, on_delete=models.CASCADE, primary_key=True, related_name="notification_counter"
+    )
+    unread = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
@@ -1,6 +1,8 @@
 # server/apps/notifications/serializers.py
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
+from .fanout import AUDIENCES
 from .models import Notification
 from server.apps.users.models import CustomUser
 
@@ -13,7 +15,7 @@ class UserNotificationSerializer(serializers.ModelSerializer):
 
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     user = UserNotificationSerializer()
     class Meta:
         model = Notification
@@ -23,3 +25,32 @@ class NotificationCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = ["user", "message", "is_read"]
+
+
+class BroadcastSerializer(serializers.Serializer):
+    """
+    Fan-out request: one message to every user in an audience.
+    `target_id` is the challenge or city id for those audiences.
+    """
+    message = serializers.CharField()
+    audience = serializers.ChoiceField(choices=AUDIENCES)
+    target_id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if attrs["audience"] != "all" and attrs.get("target_id") is None:
+            raise serializers.ValidationError({"target_id": "Required for this audience."})
+        return attrs
+
+
+class MarkReadSerializer(serializers.Serializer):
+    """
+    Either `ids` (specific notifications) or `before` (everything created
+    before that time).
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000, required=False)
+    before = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("before" in attrs):
+            raise serializers.ValidationError("Provide either 'ids' or 'before'.")
+        return attrs
@@ -0,0 +1,69 @@
+# server/apps/notifications/signals.py
+
+from collections import Counter
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, pre_save, post_delete
+from django.dispatch import receiver
+
+from server.apps.core.realtime import event, publish_on_commit, user_group
+from server.apps.users.models import CustomUser
+from .counters import adjust_unread
+from .models import Notification
+
+
+def publish_created(notifications, using=None):
+    """Push new notifications to their users' sockets after commit."""
+    publish_on_commit(
+        (
+            (
+                user_group(n.user_id),
+                event("notification.created", {
+                    "id": n.id,
+                    "message": n.message,
+                    "is_read": n.is_read,
+                    "created_at": n.created_at.isoformat(),
+                }),
+            )
+            for n in notifications
+        ),
+        using=using,
+    )
+
+
+@receiver(pre_save, sender=Notification)
+def notification_pre_save_capture(sender, instance: Notification, raw=False, using=None, **kwargs):
+    """Only hand-built instances saved over an existing pk need a lookup."""
+    if raw or instance.pk is None or hasattr(instance, "_loaded_state"):
+        return
+    instance._loaded_state = (
+        Notification.objects.using(using).filter(pk=instance.pk).values_list("user_id", "is_read").first()
+    )
+
+
+@receiver(post_save, sender=Notification)
+def notification_post_save_update_counter(
+    sender, instance: Notification, created: bool, raw=False, using=None, **kwargs
+):
+    if raw:
+        return
+    previous = None if created else getattr(instance, "_loaded_state", None)
+    current = instance.counter_state()
+    deltas = Counter()
+    if previous and not previous[1]:
+        deltas[previous[0]] -= 1
+    if not current[1]:
+        deltas[current[0]] += 1
+    adjust_unread(deltas, using=using)
+    if created:
+        publish_created([instance], using=using)
+    instance._loaded_state = current
+
+
+@receiver(post_delete, sender=Notification)
+def notification_post_delete_update_counter(sender, instance: Notification, using=None, origin=None, **kwargs):
+    # The user's counter is being cascaded away with them
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is CustomUser or instance.is_read:
+        return
+    adjust_unread(Counter({instance.user_id: -1}), using=using)
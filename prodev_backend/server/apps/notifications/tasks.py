@@ -0,0 +1,13 @@
+# server/apps/notifications/tasks.py
+
+from typing import Optional
+
+from celery import shared_task
+
+from .fanout import audience_ids, fan_out
+
+
+@shared_task(name="notifications.fan_out")
+def fan_out_notification(message: str, audience: str, target_id: Optional[int] = None, using: Optional[str] = None) -> int:
+    """Send `message` to an audience (see fanout.AUDIENCES). Returns the number created."""
+    return fan_out(message, audience_ids(audience, target_id), using=using)
@@ -3,11 +3,13 @@
 from rest_framework.routers import DefaultRouter
 from .views import NotificationViewSet
 from django.urls import path, include
+from server.apps.core.asyncviews import async_routes
 
 
 router = DefaultRouter()
 router.register(r"", NotificationViewSet)
 
 urlpatterns = [
-    path("", include(router.urls)),
+    # GET list/retrieve run async under ASGI when ASYNC_READ_VIEWS is on
+    path("", include(async_routes(router.urls))),
 ]
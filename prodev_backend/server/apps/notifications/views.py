@@ -1,9 +1,23 @@
 # server/apps/notifications/views.py
 
-from rest_framework import viewsets, permissions
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
+from rest_framework.response import Response
+from server.apps.core.deferred import defer
+from server.apps.core.asyncviews import AsyncReadViewMixin
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
+from server.apps.core.projection import ValuesReadViewMixin
+from .counters import unread_count
 from .models import Notification
-from .serializers import NotificationSerializer, NotificationCreateSerializer
+from .serializers import (
+    NotificationSerializer,
+    NotificationCreateSerializer,
+    BroadcastSerializer,
+    MarkReadSerializer,
+)
+from .tasks import fan_out_notification
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -14,9 +28,17 @@ from drf_spectacular.utils import (
 @extend_schema_view(
     list=extend_schema(
         tags=["Notifications"],
-        summary="Get all the notifcations",
+        summary="Get my notifications, newest first",
         request=None,
-        parameters=[],
+        parameters=[
+            OpenApiParameter(
+                name="is_read",
+                description="Filter by read state (true/false)",
+                required=False,
+                type=bool,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
     ),
     retrieve=extend_schema(
         tags=["Notifications"],
@@ -34,7 +56,7 @@ from drf_spectacular.utils import (
     ),
     create=extend_schema(
         tags=["Notifications"],
-        summary="Create a notifcation",
+        summary="Create a notifcation (admin)",
         request={"application/json": NotificationCreateSerializer},
         responses={201: NotificationSerializer},
     ),
@@ -52,14 +74,83 @@ from drf_spectacular.utils import (
 )
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
-    queryset = Notification.objects.all()
+class NotificationViewSet(AsyncReadViewMixin, ValuesReadViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    queryset = Notification.objects.select_related("user")
     serializer_class = NotificationSerializer
-    permission_classes = [permissions.AllowAny]
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
+    # Keyset paging on the (user, is_read, -created_at) index
+    cursor_ordering = ("-created_at", "-id")
+
+    def get_queryset(self):
+        # Users only ever see their own inbox
+        qs = super().get_queryset().filter(user_id=self.request.user.id)
+        is_read = self.request.query_params.get("is_read")
+        if is_read is not None:
+            qs = qs.filter(is_read=is_read.lower() in ("1", "true", "yes"))
+        return qs
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return NotificationCreateSerializer
         return NotificationSerializer
 
+    def get_permissions(self):
+        # Creating sets the recipient, so it is an admin tool like broadcast
+        if self.action in ("create", "broadcast"):
+            return [permissions.IsAuthenticated(), permissions.IsAdminUser()]
+        return super().get_permissions()
+
+    def perform_update(self, serializer):
+        serializer.save(user=self.request.user)
+
+    # ---------- CUSTOM ACTIONS ----------
+
+    @extend_schema(
+        tags=["Notifications"],
+        summary="Get my unread notification count",
+        responses={200: {"type": "object", "properties": {"unread": {"type": "integer"}}}},
+    )
+    @action(detail=False, methods=["get"], url_path="unread-count")
+    def unread_count(self, request):
+        # Denormalized counter: a primary-key lookup, not COUNT(*)
+        return Response({"unread": unread_count(request.user)})
+
+    @extend_schema(
+        tags=["Notifications"],
+        summary="Send a notification to all users, a challenge's participants or a city's residents (admin)",
+        request={"application/json": BroadcastSerializer},
+        responses={202: {"type": "object", "properties": {"queued": {"type": "boolean"}}}},
+    )
+    @action(detail=False, methods=["post"], url_path="broadcast")
+    def broadcast(self, request):
+        serializer = BroadcastSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        # Audiences can be the whole user base; a worker does the inserts
+        defer(fan_out_notification, data["message"], data["audience"], data.get("target_id"))
+        return Response({"queued": True}, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        tags=["Notifications"],
+        summary="Mark my notifications as read, by id list or everything before a timestamp",
+        request={"application/json": MarkReadSerializer},
+        responses={
+            200: {
+                "type": "object",
+                "properties": {"updated": {"type": "integer"}, "unread": {"type": "integer"}},
+            }
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="mark-read")
+    def mark_read(self, request):
+        serializer = MarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        qs = Notification.objects.all()
+        if "ids" in data:
+            qs = qs.filter(pk__in=data["ids"])
+        else:
+            qs = qs.filter(created_at__lt=data["before"])
+        updated = qs.mark_read(request.user.id)
+        return Response({"updated": updated, "unread": unread_count(request.user)})
@@ -6,3 +6,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     name = "server.apps.users"
     label = "users"
+
+    def ready(self):
+        from . import signals  # noqa: F401
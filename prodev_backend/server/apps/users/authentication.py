@@ -0,0 +1,54 @@
+# server/apps/users/authentication.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from . import cache
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user through the versioned
+    user cache (see cache.py) instead of a query on every request. The same
+    is_active and revoked-token checks run on the cached user.
+    """
+
+    def get_user(self, validated_token):
+        return self._check_user(cache.get_user(self._user_id(validated_token)), validated_token)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views (server/apps/core/asyncviews.py)."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        # Signature and expiry checks only; access tokens are not looked up anywhere
+        validated_token = self.get_validated_token(raw_token)
+        user = await cache.aget_user(self._user_id(validated_token))
+        return self._check_user(user, validated_token), validated_token
+
+    @staticmethod
+    def _user_id(validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    @staticmethod
+    def _check_user(user, validated_token):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
@@ -0,0 +1,206 @@
+# server/apps/users/blacklist.py
+
+"""
+Set of blacklisted refresh-token jtis, consulted before the database.
+
+Enabled with settings.TOKEN_BLACKLIST_REDIS_URL:
+    ""          -> disabled, every check queries BlacklistedToken
+    "memory://" -> in-process set (tests, single-process dev); loaded from the
+                   database on first use
+    "redis://…" -> Redis sorted set, members are jtis, scores their expiry
+
+The set only answers "not blacklisted" once it has been loaded completely.
+Readiness is a member of the set itself (set by `manage.py prune_tokens`), so
+if the set is evicted or flushed it goes with it. Until then, or when the
+store cannot be reached, checks fall back to the database.
+
+Every new BlacklistedToken row (refresh rotation, logout, the admin) is added
+in two steps by its signals:
+
+    pre_save       "pending:<jti>" is added before the row is written; if that
+                   fails the blacklisting fails with it, so no revoked token
+                   can be missing
+    after commit   <jti> replaces it; if that fails the pending member stays
+
+A jti that is only pending is looked up in the database, which answers for
+rolled-back and unconfirmed blacklistings alike. Either way the set fails
+closed: a revoked token is never let through.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+logger = logging.getLogger(__name__)
+
+KEY = "auth:blacklist"
+# Members besides the jtis (which are hex): the ready marker never expires
+READY = "ready"
+PENDING = "pending:"
+LOAD_CHUNK = 1000
+
+Member = Tuple[str, int]  # (jti, exp as a unix timestamp)
+
+
+class RedisBlacklist:
+    local = False
+
+    def __init__(self, client):
+        self.client = client
+
+    def ready(self) -> bool:
+        return self.client.zscore(KEY, READY) is not None
+
+    def lookup(self, jti: str) -> Tuple[bool, bool]:
+        """(listed, pending) for `jti`."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zscore(KEY, jti)
+        pipe.zscore(KEY, PENDING + jti)
+        listed, pending = pipe.execute()
+        return listed is not None, pending is not None
+
+    def hold(self, jti: str, exp: int):
+        self.client.zadd(KEY, {PENDING + jti: exp})
+
+    def confirm(self, jti: str, exp: int):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zadd(KEY, {jti: exp})
+        pipe.zrem(KEY, PENDING + jti)
+        pipe.execute()
+
+    def load(self, members: Iterable[Member]) -> int:
+        """Add members in place (concurrent hold()/confirm() calls are kept), then mark the set ready."""
+        total = 0
+        chunk = {}
+        for jti, exp in members:
+            chunk[jti] = exp
+            if len(chunk) >= LOAD_CHUNK:
+                self.client.zadd(KEY, chunk)
+                total += len(chunk)
+                chunk = {}
+        if chunk:
+            self.client.zadd(KEY, chunk)
+            total += len(chunk)
+        self.client.zadd(KEY, {READY: "+inf"})
+        return total
+
+    def prune(self, now: int) -> int:
+        return self.client.zremrangebyscore(KEY, "-inf", now)
+
+
+class InMemoryBlacklist:
+    """Process-local stand-in with the same interface as RedisBlacklist."""
+
+    local = True
+
+    def __init__(self):
+        self.members = {}
+
+    def ready(self):
+        return READY in self.members
+
+    def lookup(self, jti):
+        return jti in self.members, PENDING + jti in self.members
+
+    def hold(self, jti, exp):
+        self.members[PENDING + jti] = exp
+
+    def confirm(self, jti, exp):
+        self.members[jti] = exp
+        self.members.pop(PENDING + jti, None)
+
+    def load(self, members):
+        total = 0
+        for jti, exp in members:
+            self.members[jti] = exp
+            total += 1
+        self.members[READY] = float("inf")
+        return total
+
+    def prune(self, now):
+        expired = [jti for jti, exp in self.members.items() if exp <= now]
+        for jti in expired:
+            del self.members[jti]
+        return len(expired)
+
+
+@lru_cache(maxsize=None)
+def _store_for(url: str):
+    if not url:
+        return None
+    if url == "memory://":
+        return InMemoryBlacklist()
+    import redis
+
+    return RedisBlacklist(redis.Redis.from_url(url))
+
+
+def get_store():
+    """The configured set, or None when disabled."""
+    return _store_for(getattr(settings, "TOKEN_BLACKLIST_REDIS_URL", ""))
+
+
+def rebuild(store=None) -> int:
+    """Drop expired members and load every unexpired blacklisted jti from the database."""
+    store = store or get_store()
+    if store is None:
+        return 0
+    now = aware_utcnow()
+    store.prune(int(now.timestamp()))
+    members = (
+        (jti, int(expires_at.timestamp()))
+        for jti, expires_at in BlacklistedToken.objects.filter(token__expires_at__gt=now)
+        .order_by()
+        .values_list("token__jti", "token__expires_at")
+        .iterator(chunk_size=LOAD_CHUNK)
+    )
+    return store.load(members)
+
+
+def is_blacklisted(jti: str) -> Optional[bool]:
+    """True/False from the set, or None when the database has to answer."""
+    store = get_store()
+    if store is None:
+        return None
+    try:
+        if not store.ready():
+            if not store.local:
+                return None
+            rebuild(store)
+        listed, pending = store.lookup(jti)
+    except Exception:  # noqa: BLE001 - the database stays the source of truth
+        logger.warning("Token blacklist set lookup failed", exc_info=True)
+        return None
+    if listed:
+        return True
+    return None if pending else False
+
+
+def hold(jti: str, exp: int):
+    """
+    Mark a jti as being blacklisted; called from BlacklistedToken's pre_save,
+    before the row is written. Errors propagate and fail the blacklisting.
+    """
+    store = get_store()
+    if store is None:
+        return
+    try:
+        store.hold(jti, exp)
+    except Exception:
+        logger.warning("Token blacklist set unreachable; failing the blacklisting", exc_info=True)
+        raise
+
+
+def confirm(jti: str, exp: int):
+    """Turn a held jti into a listed one; run once the blacklisting commits."""
+    store = get_store()
+    if store is None:
+        return
+    try:
+        store.confirm(jti, exp)
+    except Exception:  # noqa: BLE001 - the row is committed; the pending member keeps lookups on the database
+        logger.warning("Token blacklist set update failed; %s stays pending", jti, exc_info=True)
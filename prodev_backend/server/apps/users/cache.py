@@ -0,0 +1,117 @@
+# server/apps/users/cache.py
+
+"""
+Versioned cache of CustomUser rows for request authentication.
+
+Each user has a version stamp; the user is cached under (id, stamp).
+Invalidating a user writes a new stamp, so a request that read the row
+before the change can only fill a key nobody reads any more:
+
+    auth:user:v:<id>        -> stamp
+    auth:user:<id>:<stamp>  -> pickled CustomUser
+
+A new stamp only reaches the processes that share the cache, so the cache
+is used only with a shared backend (CACHE_URL=redis://... or file://...).
+With a per-process one (locmem, dummy) another worker could keep
+authenticating a deactivated user, or one whose password changed, until its
+copy expired; every request reads the user from the database instead.
+"""
+
+import uuid
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from .models import CustomUser
+
+USER_CACHE_PREFIX = "auth:user"
+# Bump when CustomUser's fields change so old pickles are never loaded
+USER_CACHE_VERSION = 1
+# Backends each worker process has its own copy of
+PER_PROCESS_BACKENDS = (LocMemCache, DummyCache)
+
+
+def _cache():
+    return caches[getattr(settings, "AUTH_USER_CACHE_ALIAS", "default")]
+
+
+def _timeout() -> int:
+    """AUTH_USER_CACHE_TIMEOUT, or 0 (disabled) when the cache isn't shared between processes."""
+    if isinstance(_cache(), PER_PROCESS_BACKENDS):
+        return 0
+    return getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 300)
+
+
+def enabled() -> bool:
+    """Whether users are cached, i.e. whether there is anything to invalidate."""
+    return bool(_timeout())
+
+
+def _stamp_key(user_id) -> str:
+    return f"{USER_CACHE_PREFIX}:v:{user_id}"
+
+
+def get_user(user_id) -> Optional[CustomUser]:
+    """The user with this primary key, from the cache when possible."""
+    timeout = _timeout()
+    if not timeout:
+        return CustomUser.objects.filter(pk=user_id).first()
+
+    cache = _cache()
+    stamp = cache.get(_stamp_key(user_id), version=USER_CACHE_VERSION)
+    if stamp is None:
+        cache.add(_stamp_key(user_id), uuid.uuid4().hex, timeout, version=USER_CACHE_VERSION)
+        stamp = cache.get(_stamp_key(user_id), version=USER_CACHE_VERSION)
+    key = f"{USER_CACHE_PREFIX}:{user_id}:{stamp}"
+
+    user = cache.get(key, version=USER_CACHE_VERSION)
+    if user is None:
+        user = CustomUser.objects.filter(pk=user_id).first()
+        if user is not None and stamp is not None:
+            cache.set(key, user, timeout, version=USER_CACHE_VERSION)
+    return user
+
+
+async def aget_user(user_id) -> Optional[CustomUser]:
+    """get_user() for async views, through the async cache and ORM APIs."""
+    timeout = _timeout()
+    if not timeout:
+        return await CustomUser.objects.filter(pk=user_id).afirst()
+
+    cache = _cache()
+    stamp = await cache.aget(_stamp_key(user_id), version=USER_CACHE_VERSION)
+    if stamp is None:
+        await cache.aadd(_stamp_key(user_id), uuid.uuid4().hex, timeout, version=USER_CACHE_VERSION)
+        stamp = await cache.aget(_stamp_key(user_id), version=USER_CACHE_VERSION)
+    key = f"{USER_CACHE_PREFIX}:{user_id}:{stamp}"
+
+    user = await cache.aget(key, version=USER_CACHE_VERSION)
+    if user is None:
+        user = await CustomUser.objects.filter(pk=user_id).afirst()
+        if user is not None and stamp is not None:
+            await cache.aset(key, user, timeout, version=USER_CACHE_VERSION)
+    return user
+
+
+def _restamp(user_ids: Iterable):
+    _cache().set_many(
+        {_stamp_key(user_id): uuid.uuid4().hex for user_id in user_ids},
+        _timeout(),
+        version=USER_CACHE_VERSION,
+    )
+
+
+def invalidate(user_ids: Iterable, using: Optional[str] = None):
+    """
+    Drop cached copies of these users, now and again after commit (a request
+    running before the commit could still cache the old row).
+    """
+    user_ids = list(user_ids)
+    if not user_ids or not enabled():
+        return
+    _restamp(user_ids)
+    transaction.on_commit(lambda: _restamp(user_ids), using=using)
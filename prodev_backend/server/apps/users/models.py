@@ -1,5 +1,7 @@
 # server/apps/users/models.py
 
+from contextvars import ContextVar
+
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
 from typing import Optional, TYPE_CHECKING
@@ -11,10 +13,47 @@ if TYPE_CHECKING:
     # Help the type checker understand the FK
     from server.apps.location.models import City as CityType
 
+_bulk_updating: ContextVar[bool] = ContextVar("users_bulk_updating", default=False)
+
+
+class CustomUserQuerySet(models.QuerySet):
+    """
+    update() and bulk_update() skip post_save, so they drop the cached
+    copies of the users they touch themselves (see users/cache.py). With the
+    cache disabled they are the stock methods.
+    """
+
+    def update(self, **kwargs):
+        from .cache import enabled, invalidate
+
+        # bulk_update() runs its batches through update() and knows the pks already
+        if _bulk_updating.get() or not enabled():
+            return super().update(**kwargs)
+        pks = list(self.values_list("pk", flat=True))
+        updated = super().update(**kwargs)
+        invalidate(pks, using=self.db)
+        return updated
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from .cache import enabled, invalidate
+
+        if not enabled():
+            return super().bulk_update(objs, fields, *args, **kwargs)
+        objs = list(objs)
+        token = _bulk_updating.set(True)
+        try:
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+        finally:
+            _bulk_updating.reset(token)
+        invalidate([o.pk for o in objs], using=self.db)
+        return updated
+
 
 class CustomUserManager(UserManager["CustomUser"]):
     """Custom manager for CustomUser to properly type the manager."""
-    pass
+
+    def get_queryset(self):
+        return CustomUserQuerySet(self.model, using=self._db)
 
 
 class CustomUser(AbstractUser, TimeStampedModel):
@@ -1,18 +1,33 @@
 # server/apps/users/profile_views.py
 
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import api_view, permission_classes
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from server.apps.users.serializers import UserSerializer, UserUpdateSerializer, ChangePasswordSerializer
 from server.apps.leaderboard.serializers import LeaderboardEntrySerializer
 from server.apps.challenges.serializers import ChallengeSerializer
+from server.apps.core.projection import aprojected, projected
 from server.apps.actions.serializers import EcoActionSerializer
 from server.apps.leaderboard.models import LeaderboardEntry
 from server.apps.challenges.models import Challenge
-from server.apps.actions.models import EcoAction
+from server.apps.actions.models import EcoAction, UserPointsDaily
+from server.apps.location.models import City
 from rest_framework import status
 
+STATS_GRANULARITY = {
+    # granularity -> (truncation, default window)
+    "day": (TruncDay, timedelta(days=30)),
+    "week": (TruncWeek, timedelta(weeks=12)),
+    "month": (TruncMonth, timedelta(days=365)),
+}
+
 
 @extend_schema(tags=["Profile"], methods=["GET"], responses=UserSerializer)
 @extend_schema(
@@ -42,6 +57,15 @@ def me(request):
     return Response(UserSerializer(request.user).data, status=status.HTTP_200_OK)
 
 
+async def me_async(view, request):
+    """GET /me/ for async dispatch (server/apps/core/asyncviews.py)."""
+    user = request.user
+    if user.city_id is not None:
+        # city_detail nests country and continent; load them in one query up front
+        user.city = await City.objects.select_related("country__continent").aget(pk=user.city_id)
+    return Response(UserSerializer(user).data, status=status.HTTP_200_OK)
+
+
 @extend_schema(
     tags=["Profile"],
     summary="Change current user's password",
@@ -66,7 +90,7 @@ def change_password(request):
 @permission_classes([IsAuthenticated])
 def get_user_leaderboard(request):
     entries = LeaderboardEntry.objects.filter(user=request.user)
-    serializer = LeaderboardEntrySerializer(entries, many=True)
+    serializer = projected(LeaderboardEntrySerializer, entries)
     return Response(serializer.data)
 
 
@@ -74,7 +98,9 @@ def get_user_leaderboard(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_user_challenges(request):
-    challenges = Challenge.objects.filter(participants=request.user)
+    # Subquery rather than a join so participant_count isn't narrowed to this user
+    joined = LeaderboardEntry.objects.filter(user=request.user).values("challenge_id")
+    challenges = Challenge.objects.filter(id__in=joined).with_participant_summary()
     serializer = ChallengeSerializer(challenges, many=True)
     return Response(serializer.data)
 
@@ -83,6 +109,73 @@ def get_user_challenges(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_user_actions(request):
-    actions = EcoAction.objects.filter(user=request.user)
-    serializer = EcoActionSerializer(actions, many=True)
+    # Rendered from values(): the user and challenge columns come from joins in the same query
+    actions = EcoAction.objects.filter(user=request.user).select_related("user", "challenge")
+    serializer = projected(EcoActionSerializer, actions)
     return Response(serializer.data)
+
+
+async def get_user_actions_async(view, request):
+    actions = EcoAction.objects.filter(user=request.user).select_related("user", "challenge")
+    serializer = await aprojected(EcoActionSerializer, actions)
+    return Response(serializer.data)
+
+
+@extend_schema(
+    tags=["Profile"],
+    summary="Get current user's points per day, week or month",
+    parameters=[
+        OpenApiParameter(name="granularity", type=str, enum=list(STATS_GRANULARITY), description="Bucket size (default: week)"),
+        OpenApiParameter(name="start", type=str, description="First day (YYYY-MM-DD)"),
+        OpenApiParameter(name="end", type=str, description="Last day (YYYY-MM-DD, default: today)"),
+    ],
+    responses={200: {"type": "object"}},
+)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_user_stats(request):
+    granularity = request.query_params.get("granularity", "week")
+    if granularity not in STATS_GRANULARITY:
+        return Response(
+            {"granularity": f"Must be one of: {', '.join(STATS_GRANULARITY)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    trunc, window = STATS_GRANULARITY[granularity]
+
+    try:
+        end = parse_date(request.query_params.get("end", "")) or timezone.localdate()
+        start = parse_date(request.query_params.get("start", "")) or end - window
+    except ValueError:
+        return Response({"detail": "Dates must be valid YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+    if start > end:
+        return Response({"start": "Must not be after end."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Served from the daily rollup: one grouped query, no scan of eco actions
+    rows = (
+        UserPointsDaily.objects.filter(user=request.user, performed_on__range=(start, end))
+        .annotate(period=trunc("performed_on"))
+        .values("period", "action_type")
+        .annotate(points=Sum("points"), count=Sum("count"))
+        .order_by("period", "action_type")
+    )
+
+    series = {}
+    for row in rows:
+        bucket = series.setdefault(
+            row["period"], {"period": row["period"], "points": 0, "count": 0, "by_type": {}}
+        )
+        bucket["points"] += row["points"]
+        bucket["count"] += row["count"]
+        bucket["by_type"][row["action_type"]] = {"points": row["points"], "count": row["count"]}
+
+    series = list(series.values())
+    return Response({
+        "granularity": granularity,
+        "start": start,
+        "end": end,
+        "totals": {
+            "points": sum(bucket["points"] for bucket in series),
+            "count": sum(bucket["count"] for bucket in series),
+        },
+        "series": series,
+    })
@@ -5,6 +5,7 @@ User serializers for read/write operations.
 """
 
 from rest_framework import serializers
+from server.apps.core.fieldsets import SparseFieldsetSerializerMixin
 from .models import CustomUser
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -37,7 +38,7 @@ class CityMinimalSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Read serializer for CustomUser.
     """
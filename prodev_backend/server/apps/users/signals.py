@@ -0,0 +1,44 @@
+# server/apps/users/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .blacklist import confirm, hold
+from .cache import invalidate
+from .models import CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+def customuser_post_save_invalidate(sender, instance: CustomUser, created: bool, raw=False, using=None, **kwargs):
+    """Every save (profile update, password change, is_active toggle) drops the cached copy."""
+    if not created:
+        invalidate([instance.pk], using=using)
+
+
+@receiver(post_delete, sender=CustomUser)
+def customuser_post_delete_invalidate(sender, instance: CustomUser, using=None, **kwargs):
+    invalidate([instance.pk], using=using)
+
+
+@receiver(pre_save, sender=BlacklistedToken)
+def blacklistedtoken_pre_save_hold(sender, instance: BlacklistedToken, raw=False, **kwargs):
+    """
+    Holds the jti before the row is written, so a blacklisting the set
+    can't take fails instead of committing (under autocommit too).
+    """
+    if instance._state.adding and not raw:
+        token = instance.token
+        hold(token.jti, int(token.expires_at.timestamp()))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def blacklistedtoken_post_save_confirm(
+    sender, instance: BlacklistedToken, created: bool, raw=False, using=None, **kwargs
+):
+    """Keeps the jti set complete whichever path blacklisted the token."""
+    if created and not raw:
+        token = instance.token
+        jti, exp = token.jti, int(token.expires_at.timestamp())
+        transaction.on_commit(lambda: confirm(jti, exp), using=using)
@@ -0,0 +1,50 @@
+# server/apps/users/tokens.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+
+from .blacklist import is_blacklisted
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check asks the jti set (blacklist.py) before the database."""
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        listed = is_blacklisted(jti)
+        if listed is None:
+            return super().check_blacklist()
+        if listed:
+            raise TokenError(_("Token is blacklisted"))
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
+
+
+class CachedTokenBlacklistSerializer(TokenBlacklistSerializer):
+    token_class = CachedBlacklistRefreshToken
+
+
+class CachedTokenVerifySerializer(TokenVerifySerializer):
+    def validate(self, attrs):
+        token = UntypedToken(attrs["token"])
+
+        if api_settings.BLACKLIST_AFTER_ROTATION:
+            jti = token.get(api_settings.JTI_CLAIM)
+            listed = is_blacklisted(jti)
+            if listed is None:
+                listed = BlacklistedToken.objects.filter(token__jti=jti).exists()
+            if listed:
+                raise ValidationError(_("Token is blacklisted"))
+
+        return {}
@@ -2,8 +2,18 @@
 
 from rest_framework.routers import DefaultRouter
 from .views import UserViewSet
-from .profile_views import change_password, me, get_user_leaderboard, get_user_challenges, get_user_actions
+from .profile_views import (
+    change_password,
+    me,
+    me_async,
+    get_user_leaderboard,
+    get_user_challenges,
+    get_user_actions,
+    get_user_actions_async,
+    get_user_stats,
+)
 from django.urls import path, include
+from server.apps.core.asyncviews import async_reads
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 
@@ -13,10 +23,12 @@ router.register(r"", UserViewSet)
 urlpatterns = [
     path("login/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-    path("me/", me, name="me"),
+    # GET runs async under ASGI when ASYNC_READ_VIEWS is on
+    path("me/", async_reads(me, me_async), name="me"),
     path("me/password/", change_password, name="me-password"),
     path("me/leaderboard/", get_user_leaderboard, name="user-leaderboard"),
     path("me/challenges/", get_user_challenges, name="user-challenges"),
-    path("me/actions/", get_user_actions, name="user-actions"),
+    path("me/actions/", async_reads(get_user_actions, get_user_actions_async), name="user-actions"),
+    path("me/stats/", get_user_stats, name="user-stats"),
     path("", include(router.urls)),
 ]
@@ -1,7 +1,9 @@
 # server/apps/users/views.py
 
 from rest_framework import viewsets, permissions, status
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework.parsers import FormParser, MultiPartParser
+from server.apps.core.parsers import FastJSONParser
+from server.apps.core.fieldsets import SparseFieldsetViewMixin
 from .models import CustomUser
 from .serializers import UserSerializer, UserCreateSerializer
 from drf_spectacular.utils import (
@@ -53,10 +55,10 @@ from rest_framework.response import Response
 )
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = CustomUser.objects.all()
     permission_classes = [permissions.AllowAny]
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update"]:
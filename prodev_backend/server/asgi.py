@@ -2,6 +2,8 @@
 ASGI config for server project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP goes to Django; WebSockets go through JWT auth to the Channels routes in
+server/routing.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -13,4 +15,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings.prod')
 
-application = get_asgi_application()
+# Initialise Django before importing anything that touches models
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+
+from server.apps.core.ws_auth import JWTAuthMiddleware  # noqa: E402
+from server.routing import websocket_urlpatterns  # noqa: E402
+
+application = ProtocolTypeRouter({
+    "http": django_asgi_app,
+    "websocket": JWTAuthMiddleware(URLRouter(websocket_urlpatterns)),
+})
@@ -0,0 +1,46 @@
+# server/benchmarks/context.py
+
+"""
+The dataset a benchmark run works against: a generated dataset (see
+server/seed/seed_scale.py) plus the user the requests are sent as.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from server.apps.actions.models import ActionTemplate, EcoAction
+from server.apps.users.models import CustomUser
+from server.seed import seed_scale
+
+
+@dataclass
+class BenchContext:
+    user: CustomUser
+    token: str
+    templates: List[tuple]  # (action_type, description, points, challenge_id)
+    scale: Dict[str, int]
+    seed: int
+
+    @property
+    def auth_header(self) -> Dict[str, str]:
+        return {"HTTP_AUTHORIZATION": f"Bearer {self.token}"}
+
+
+def prepare(scale: Dict[str, int], seed: int, fast: bool = True) -> BenchContext:
+    """Seed the dataset unless it is already loaded (e.g. a kept test database)."""
+    first = f"load_{seed}_{0:07d}"
+    if not CustomUser.objects.filter(username=first).exists():
+        seed_scale.run(scale, seed=seed, fast=fast)
+    user = CustomUser.objects.get(username=first)
+    templates = list(
+        ActionTemplate.objects.order_by("id").values_list("action_type", "description", "points", "challenge_id")
+    )
+    return BenchContext(
+        user=user,
+        token=str(AccessToken.for_user(user)),
+        templates=templates,
+        scale={**scale, "total_actions": EcoAction.objects.count()},
+        seed=seed,
+    )
@@ -0,0 +1,99 @@
+# server/benchmarks/renderers.py
+
+"""
+JSON benchmark: DRF's JSONRenderer/JSONParser against the project's
+FastJSONRenderer/FastJSONParser (server/apps/core/renderers.py, parsers.py)
+on the largest list responses: full pages (max_page_size rows) of the list
+endpoints, the location tree and an unpaginated list of every action.
+
+Each payload is first rendered by both renderers and the bodies compared:
+they must parse to the same data, and are reported as byte-identical or not.
+"""
+
+import io
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from server.apps.actions.models import EcoAction
+from server.apps.actions.serializers import EcoActionSerializer
+from server.apps.core.pagination import DefaultCursorPagination
+from server.apps.core.parsers import FastJSONParser
+from server.apps.core.projection import projected
+from server.apps.core.renderers import FastJSONRenderer, orjson
+from server.apps.leaderboard.models import LeaderboardEntry
+from server.apps.leaderboard.serializers import LeaderboardEntrySerializer
+from server.apps.location.models import City
+from server.apps.location.serializers import CitySerializer
+from server.apps.location.tree import build_tree
+from server.apps.notifications.models import Notification
+from server.apps.notifications.serializers import NotificationSerializer
+
+PAGE_SIZE = DefaultCursorPagination.max_page_size
+NEXT = "http://testserver/api/?cursor=cD0yMDI2LTAxLTAx&page_size=200"
+
+
+def _page(serializer_class, queryset) -> Dict:
+    """A cursor-paginated response body, as the list endpoints send it."""
+    return {"next": NEXT, "previous": None, "results": projected(serializer_class, queryset[:PAGE_SIZE]).data}
+
+
+PAYLOADS: List[Tuple[str, Callable[[], object]]] = [
+    ("actions.list", lambda: _page(EcoActionSerializer, EcoAction.objects.order_by("id"))),
+    ("leaderboard.list", lambda: _page(LeaderboardEntrySerializer, LeaderboardEntry.objects.order_by("-score", "id"))),
+    ("notifications.list", lambda: _page(NotificationSerializer, Notification.objects.order_by("-created_at", "-id"))),
+    ("location.cities", lambda: _page(CitySerializer, City.objects.order_by("name", "id"))),
+    ("location.tree", build_tree),
+    ("actions.all", lambda: projected(EcoActionSerializer, EcoAction.objects.order_by("id")).data),
+]
+
+
+class Mismatch(Exception):
+    """The fast renderer's body doesn't parse to the same data."""
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def measure(name: str, data, repeat: int) -> Dict:
+    stdlib_body = JSONRenderer().render(data)
+    fast_body = FastJSONRenderer().render(data)
+    if json.loads(stdlib_body) != json.loads(fast_body):
+        raise Mismatch(f"{name}: the rendered bodies differ")
+    parsed = FastJSONParser().parse(io.BytesIO(stdlib_body))
+    if parsed != JSONParser().parse(io.BytesIO(stdlib_body)):
+        raise Mismatch(f"{name}: the parsed bodies differ")
+
+    render = _median_ms(lambda: JSONRenderer().render(data), repeat)
+    fast_render = _median_ms(lambda: FastJSONRenderer().render(data), repeat)
+    parse = _median_ms(lambda: JSONParser().parse(io.BytesIO(stdlib_body)), repeat)
+    fast_parse = _median_ms(lambda: FastJSONParser().parse(io.BytesIO(stdlib_body)), repeat)
+    return {
+        "bytes": len(stdlib_body),
+        "identical": stdlib_body == fast_body,
+        "render_ms": {"stdlib": round(render, 3), "fast": round(fast_render, 3)},
+        "parse_ms": {"stdlib": round(parse, 3), "fast": round(fast_parse, 3)},
+        "render_speedup": round(render / fast_render, 2) if fast_render else None,
+        "parse_speedup": round(parse / fast_parse, 2) if fast_parse else None,
+    }
+
+
+def run(repeat: int, names: Optional[List[str]] = None, progress=None) -> Dict:
+    results = {}
+    for name, build in PAYLOADS:
+        if names and name not in names:
+            continue
+        results[name] = measure(name, build(), repeat)
+        if progress:
+            progress(name, results[name])
+    return {"meta": {"repeat": repeat, "orjson": getattr(orjson, "__version__", None)}, "results": results}
@@ -0,0 +1,133 @@
+# server/benchmarks/runner.py
+
+"""
+In-process benchmark runner.
+
+Requests go through django.test.Client, so URL routing, middleware, JWT
+authentication, the view, the serializer and the renderer are all measured;
+only the network hop and the app server are not. Every request runs under
+CaptureQueriesContext to count its SQL queries.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from .context import BenchContext
+from .scenarios import Scenario
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1, round(pct / 100 * len(samples) + 0.5) - 1))
+    return samples[rank]
+
+
+def _request(client: Client, scenario: Scenario, ctx: BenchContext, i: int):
+    extra = ctx.auth_header if scenario.auth else {}
+    if scenario.body is None:
+        return client.generic(scenario.method, scenario.path, **extra)
+    return client.generic(
+        scenario.method,
+        scenario.path,
+        json.dumps(scenario.body(ctx, i)),
+        content_type="application/json",
+        **extra,
+    )
+
+
+def measure(scenario: Scenario, ctx: BenchContext, iterations: int, warmup: int) -> Dict:
+    client = Client()
+    for i in range(warmup):
+        _request(client, scenario, ctx, i)
+
+    latencies, queries, errors = [], [], []
+    started = time.perf_counter()
+    for i in range(warmup, warmup + iterations):
+        with CaptureQueriesContext(connection) as captured:
+            t0 = time.perf_counter()
+            response = _request(client, scenario, ctx, i)
+            latencies.append((time.perf_counter() - t0) * 1000)
+        queries.append(len(captured.captured_queries))
+        if response.status_code >= 400 and len(errors) < 3:
+            errors.append(f"{response.status_code}: {response.content[:200]!r}")
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    max_queries = max(queries) if queries else 0
+    return {
+        "method": scenario.method,
+        "path": scenario.path,
+        "iterations": iterations,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 3),
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "min": round(latencies[0], 3),
+            "max": round(latencies[-1], 3),
+        },
+        # Single client, sequential requests
+        "throughput_rps": round(iterations / elapsed, 1) if elapsed else 0.0,
+        "queries": {"median": statistics.median(queries), "max": max_queries},
+        "query_budget": scenario.query_budget,
+        "within_budget": max_queries <= scenario.query_budget,
+        "errors": errors,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scenarios: List[Scenario], ctx: BenchContext, iterations: int, warmup: int, progress=None) -> Dict:
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = measure(scenario, ctx, iterations, warmup)
+        if progress:
+            progress(scenario.name, results[scenario.name])
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "dataset": {**ctx.scale, "seed": ctx.seed},
+            "iterations": iterations,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, previous: Dict) -> Dict[str, Dict]:
+    """Per-scenario change against an earlier run: p50/p99 ratio and query delta."""
+    changes = {}
+    for name, result in current["results"].items():
+        before = previous.get("results", {}).get(name)
+        if not before:
+            continue
+        changes[name] = {
+            "p50_ratio": round(result["latency_ms"]["p50"] / before["latency_ms"]["p50"], 3)
+            if before["latency_ms"]["p50"] else None,
+            "p99_ratio": round(result["latency_ms"]["p99"] / before["latency_ms"]["p99"], 3)
+            if before["latency_ms"]["p99"] else None,
+            "queries_delta": result["queries"]["max"] - before["queries"]["max"],
+        }
+    return changes
@@ -0,0 +1,53 @@
+# server/benchmarks/scenarios.py
+
+"""
+Benchmarked endpoints. Each scenario carries a query budget: the most SQL
+queries one request may run. Budgets are per request and independent of the
+dataset size, so a budget failure means a new N+1 or a lost cache.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from .context import BenchContext
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    query_budget: int
+    # Builds the JSON body of the i-th request (POST/PUT/PATCH only)
+    body: Optional[Callable[[BenchContext, int], dict]] = None
+    auth: bool = True
+
+
+def _eco_action(ctx: BenchContext, i: int) -> dict:
+    action_type, description, points, challenge_id = ctx.templates[i % len(ctx.templates)]
+    return {
+        "action_type": action_type,
+        "description": description,
+        "points": points,
+        "challenge": challenge_id,
+    }
+
+
+SCENARIOS: List[Scenario] = [
+    # Insert + challenge lookup; with eager Celery the score/rollup tasks run in the request too
+    Scenario("actions.create", "POST", "/api/actions/eco-actions/", query_budget=10, body=_eco_action),
+    Scenario("leaderboard.list", "GET", "/api/leaderboard/", query_budget=3),
+    Scenario("challenges.list", "GET", "/api/challenges/", query_budget=3),
+    Scenario("users.me.actions", "GET", "/api/users/me/actions/", query_budget=2),
+    Scenario("location.continents", "GET", "/api/location/continents/", query_budget=2, auth=False),
+    Scenario("location.countries", "GET", "/api/location/countries/", query_budget=2, auth=False),
+    Scenario("location.cities", "GET", "/api/location/cities/", query_budget=2, auth=False),
+    Scenario("location.tree", "GET", "/api/location/tree/", query_budget=4, auth=False),
+]
+
+
+def select(names: Optional[List[str]] = None) -> List[Scenario]:
+    """Scenarios whose name starts with any of `names` (all when empty)."""
+    if not names:
+        return list(SCENARIOS)
+    return [s for s in SCENARIOS if any(s.name.startswith(n) for n in names)]
@@ -0,0 +1,122 @@
+# server/benchmarks/serializers.py
+
+"""
+Serializer benchmark: the hot list serializers rendered the DRF way (model
+instances, per-field to_representation) and from values() through their
+compiled projection (server/apps/core/projection.py), over the same rows.
+
+Every case first checks the two outputs render to the same JSON bytes, then
+times fetch + serialize for each path; times are reported per 10k rows.
+"""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from django.db.models import QuerySet
+from rest_framework.renderers import JSONRenderer
+
+from server.apps.actions.models import EcoAction
+from server.apps.actions.serializers import EcoActionSerializer
+from server.apps.core.projection import compile_projection, projected
+from server.apps.leaderboard.models import LeaderboardEntry
+from server.apps.leaderboard.serializers import LeaderboardEntrySerializer
+from server.apps.location.models import City
+from server.apps.location.serializers import CitySerializer
+from server.apps.notifications.models import Notification
+from server.apps.notifications.serializers import NotificationSerializer
+
+PER_ROWS = 10_000
+
+
+@dataclass(frozen=True)
+class SerializerCase:
+    name: str
+    serializer_class: type
+    # The queryset the list endpoint serializes, joins included
+    queryset: Callable[[], QuerySet]
+
+
+CASES: List[SerializerCase] = [
+    SerializerCase(
+        "actions", EcoActionSerializer,
+        lambda: EcoAction.objects.select_related("user", "challenge").order_by("id"),
+    ),
+    SerializerCase(
+        "leaderboard", LeaderboardEntrySerializer,
+        lambda: LeaderboardEntry.objects.select_related("user", "challenge").order_by("-score", "id"),
+    ),
+    SerializerCase(
+        "notifications", NotificationSerializer,
+        lambda: Notification.objects.select_related("user").order_by("-created_at", "-id"),
+    ),
+    SerializerCase(
+        "cities", CitySerializer,
+        lambda: City.objects.select_related("country", "country__continent").order_by("name", "id"),
+    ),
+]
+
+
+class Mismatch(Exception):
+    """The projected output differs from the serializer's."""
+
+
+def _drf(case: SerializerCase, queryset):
+    return case.serializer_class(queryset, many=True).data
+
+
+def _values(case: SerializerCase, queryset):
+    return projected(case.serializer_class, queryset).data
+
+
+def check(case: SerializerCase, rows: int) -> int:
+    """Compare both paths over `rows` rows; returns the number of rows compared."""
+    if compile_projection(case.serializer_class()) is None:
+        raise Mismatch(f"{case.name}: {case.serializer_class.__name__} does not compile to a projection")
+    queryset = case.queryset()[:rows]
+    expected = _drf(case, queryset)
+    actual = _values(case, queryset)
+    if JSONRenderer().render(expected) != JSONRenderer().render(actual):
+        for i, (want, got) in enumerate(zip(expected, actual)):
+            if want != got:
+                raise Mismatch(f"{case.name}: row {i} differs:\n  serializer: {want}\n  values():   {got}")
+        raise Mismatch(f"{case.name}: {len(expected)} serializer rows, {len(actual)} values() rows")
+    return len(expected)
+
+
+def _time(render, case: SerializerCase, queryset, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(case, queryset.all())
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def measure(case: SerializerCase, rows: int, repeat: int) -> Dict:
+    count = check(case, rows)
+    if not count:
+        return {"rows": 0, "equivalent": True}
+    queryset = case.queryset()[:rows]
+    per = PER_ROWS / count
+    drf = statistics.median(_time(_drf, case, queryset, repeat)) * 1000 * per
+    values = statistics.median(_time(_values, case, queryset, repeat)) * 1000 * per
+    return {
+        "rows": count,
+        "equivalent": True,
+        "serializer_ms_per_10k": round(drf, 2),
+        "values_ms_per_10k": round(values, 2),
+        "speedup": round(drf / values, 2) if values else None,
+    }
+
+
+def run(rows: int, repeat: int, names: Optional[List[str]] = None, progress=None) -> Dict:
+    results = {}
+    for case in CASES:
+        if names and case.name not in names:
+            continue
+        results[case.name] = measure(case, rows, repeat)
+        if progress:
+            progress(case.name, results[case.name])
+    return {"meta": {"rows": rows, "repeat": repeat}, "results": results}
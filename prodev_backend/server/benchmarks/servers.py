@@ -0,0 +1,269 @@
+# server/benchmarks/servers.py
+
+"""
+Application-server benchmark: the same read endpoints served by real server
+processes, to compare deployments at equal worker counts:
+
+    gunicorn-sync   gunicorn sync workers, WSGI, sync views
+    uvicorn-sync    uvicorn workers, ASGI, sync views (run in a thread)
+    uvicorn-async   uvicorn workers, ASGI, ASYNC_READ_VIEWS (server/apps/core/asyncviews.py)
+
+Unlike runner.py this goes over the network: the load generator keeps
+`concurrency` HTTP/1.1 connections busy for a fixed time per endpoint and
+reuses them unless the server closes them (gunicorn's sync workers close
+every connection, as they do behind a proxy). The servers run against the
+configured database, so it must be one every process can reach.
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from server.apps.leaderboard.models import LeaderboardEntry
+
+from .context import BenchContext
+from .runner import percentile
+
+
+@dataclass(frozen=True)
+class ServerProfile:
+    name: str
+    argv: Tuple[str, ...]  # after `python -m`; {workers} and {port} are filled in
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+QUIET = {"REQUEST_LOG_LEVEL": "WARNING"}
+
+PROFILES: Dict[str, ServerProfile] = {
+    profile.name: profile
+    for profile in (
+        ServerProfile(
+            "gunicorn-sync",
+            ("gunicorn", "server.wsgi:application", "--worker-class", "sync", "--workers", "{workers}",
+             "--bind", "127.0.0.1:{port}", "--log-level", "warning"),
+            {**QUIET, "ASYNC_READ_VIEWS": "False"},
+        ),
+        ServerProfile(
+            "uvicorn-sync",
+            ("uvicorn", "server.asgi:application", "--workers", "{workers}", "--host", "127.0.0.1",
+             "--port", "{port}", "--lifespan", "off", "--no-access-log", "--log-level", "warning"),
+            {**QUIET, "ASYNC_READ_VIEWS": "False", "DB_CONN_MAX_AGE": "0"},
+        ),
+        ServerProfile(
+            "uvicorn-async",
+            ("uvicorn", "server.asgi:application", "--workers", "{workers}", "--host", "127.0.0.1",
+             "--port", "{port}", "--lifespan", "off", "--no-access-log", "--log-level", "warning"),
+            {**QUIET, "ASYNC_READ_VIEWS": "True", "DB_CONN_MAX_AGE": "0"},
+        ),
+    )
+}
+
+DEFAULT_PROFILES = ["gunicorn-sync", "uvicorn-async"]
+READY_PATH = "/api/location/continents/"
+
+
+def read_endpoints(ctx: BenchContext) -> List[Tuple[str, str]]:
+    """(name, path) of the endpoints that have async variants, requested as ctx.user."""
+    entry_id = LeaderboardEntry.objects.order_by("id").values_list("id", flat=True).first()
+    endpoints = [
+        ("leaderboard.list", "/api/leaderboard/"),
+        ("notifications.list", "/api/notifications/"),
+        ("users.me", "/api/users/me/"),
+        ("users.me.actions", "/api/users/me/actions/"),
+    ]
+    if entry_id is not None:
+        endpoints.insert(1, ("leaderboard.retrieve", f"/api/leaderboard/{entry_id}/"))
+    return endpoints
+
+
+# ---------- Server processes ----------
+
+def start(profile: ServerProfile, workers: int, port: int) -> subprocess.Popen:
+    argv = [arg.format(workers=workers, port=port) for arg in profile.argv]
+    return subprocess.Popen(
+        [sys.executable, "-m", *argv],
+        env={**os.environ, **profile.env},
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(process: subprocess.Popen, port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            status, _ = asyncio.run(_one_request(port, READY_PATH, {}))
+            if status < 500:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server did not answer on port {port} within {timeout:.0f}s")
+
+
+def stop(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ---------- Load generator ----------
+
+def _request_bytes(path: str, headers: Dict[str, str]) -> bytes:
+    lines = [f"GET {path} HTTP/1.1", "Host: 127.0.0.1", "Accept: application/json"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+    """Read one response; (status, connection reusable)."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split()[1])
+    headers = {}
+    for line in head[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip().lower()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.read()
+        return status, False
+    return status, headers.get("connection") != "close"
+
+
+async def _one_request(port: int, path: str, headers: Dict[str, str]) -> Tuple[int, bool]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(_request_bytes(path, headers))
+        await writer.drain()
+        return await _read_response(reader)
+    finally:
+        writer.close()
+
+
+@dataclass
+class _Tally:
+    latencies: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)  # first few only
+    failed: int = 0
+
+    def fail(self, error: str):
+        self.failed += 1
+        if len(self.errors) < 3:
+            self.errors.append(error)
+
+
+async def _worker(port: int, request: bytes, deadline: float, tally: _Tally):
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        # Reconnecting is part of the request when the server closed the connection
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            status, reusable = await _read_response(reader)
+            tally.latencies.append((time.perf_counter() - start) * 1000)
+            if status >= 400:
+                tally.fail(f"HTTP {status}")
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            reusable = False
+            tally.fail(repr(exc))
+        if not reusable and writer is not None:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def _load(port: int, path: str, headers: Dict[str, str], concurrency: int, duration: float) -> _Tally:
+    tally = _Tally()
+    request = _request_bytes(path, headers)
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_worker(port, request, deadline, tally) for _ in range(concurrency)))
+    return tally
+
+
+def load(port: int, path: str, headers: Dict[str, str], concurrency: int, duration: float, warmup: float) -> Dict:
+    if warmup > 0:
+        asyncio.run(_load(port, path, headers, concurrency, warmup))
+    tally = asyncio.run(_load(port, path, headers, concurrency, duration))
+    latencies = sorted(tally.latencies)
+    return {
+        "requests": len(latencies),
+        "failed": tally.failed,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 3) if latencies else None,
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p99": round(percentile(latencies, 99), 3),
+        },
+        "errors": tally.errors,
+    }
+
+
+def run(
+    profiles: List[ServerProfile],
+    ctx: BenchContext,
+    workers: int,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    port: Optional[int] = None,
+    progress=None,
+) -> Dict:
+    endpoints = read_endpoints(ctx)
+    results: Dict[str, Dict[str, Dict]] = {}
+    for profile in profiles:
+        server_port = port or free_port()
+        process = start(profile, workers, server_port)
+        try:
+            wait_ready(process, server_port)
+            results[profile.name] = {}
+            for name, path in endpoints:
+                # Minted per endpoint: access tokens are short-lived
+                headers = {"Authorization": f"Bearer {AccessToken.for_user(ctx.user)}"}
+                result = {"path": path, **load(server_port, path, headers, concurrency, duration, warmup)}
+                results[profile.name][name] = result
+                if progress:
+                    progress(profile.name, name, result)
+        finally:
+            stop(process)
+    return {
+        "meta": {
+            "workers": workers,
+            "concurrency": concurrency,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "dataset": {**ctx.scale, "seed": ctx.seed},
+        },
+        "results": results,
+    }
@@ -0,0 +1,21 @@
+# server/celery.py
+
+"""
+Celery app for side effects that don't belong in the request: leaderboard
+score deltas, points rollups and notification fan-out. Tasks live in each
+app's tasks.py and are queued after commit (see apps/core/deferred.py).
+
+    celery -A server worker -l info
+
+Without CELERY_BROKER_URL tasks run inline (task_always_eager).
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings.prod")
+
+app = Celery("server")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
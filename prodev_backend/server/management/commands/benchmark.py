@@ -0,0 +1,108 @@
+# server/management/commands/benchmark.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from server.benchmarks import runner
+from server.benchmarks.context import prepare
+from server.benchmarks.scenarios import select
+from server.seed import seed_scale
+
+DEFAULT_SCALE = "users=200,actions_per_user=50,notifications_per_user=5"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the core API endpoints (latency, throughput, SQL queries) against a "
+        "freshly seeded test database and writes the results as JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", default=DEFAULT_SCALE, help=f"Dataset size (default {DEFAULT_SCALE}).")
+        parser.add_argument("--seed", type=int, default=seed_scale.DEFAULT_SEED, help="Dataset random seed.")
+        parser.add_argument("--iterations", type=int, default=200, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per endpoint first.")
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run scenarios starting with this name (repeatable), e.g. location.",
+        )
+        parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results.")
+        parser.add_argument("--compare", help="An earlier results file to compare against.")
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep (and reuse) the seeded test database between runs.",
+        )
+        parser.add_argument(
+            "--no-budget",
+            action="store_true",
+            help="Report query budget overruns without failing.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            scale = seed_scale.parse_scale(options["scale"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        scenarios = select(options["scenarios"])
+        if not scenarios:
+            raise CommandError("No scenario matches --scenario.")
+        previous = None
+        if options["compare"]:
+            with open(options["compare"]) as fh:
+                previous = json.load(fh)
+
+        # Same isolation as the test runner: a throwaway test_<name> database
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            self.stdout.write(self.style.NOTICE(f"Seeding {scale} on {connection.vendor}..."))
+            ctx = prepare(scale, options["seed"])
+            self.stdout.write(f"{'scenario':<22} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'queries':>8} {'budget':>7}")
+            report = runner.run(
+                scenarios,
+                ctx,
+                iterations=max(1, options["iterations"]),
+                warmup=max(0, options["warmup"]),
+                progress=self._progress,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        if previous:
+            report["compare"] = runner.compare(report, previous)
+            for name, change in report["compare"].items():
+                self.stdout.write(
+                    f"  {name:<20} p50 x{change['p50_ratio']}, p99 x{change['p99_ratio']}, "
+                    f"queries {change['queries_delta']:+d}"
+                )
+        with open(options["output"], "w") as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(f"Results written to {options['output']}")
+
+        failed = [name for name, r in report["results"].items() if r["errors"]]
+        over = [name for name, r in report["results"].items() if not r["within_budget"]]
+        if failed:
+            raise CommandError(f"Requests failed: {', '.join(failed)}")
+        if over and not options["no_budget"]:
+            raise CommandError(f"Query budget exceeded: {', '.join(over)}")
+        if over:
+            self.stdout.write(self.style.WARNING(f"Query budget exceeded: {', '.join(over)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All endpoints within their query budgets."))
+
+    def _progress(self, name, result):
+        latency = result["latency_ms"]
+        queries = result["queries"]["max"]
+        style = self.style.SUCCESS if result["within_budget"] else self.style.ERROR
+        self.stdout.write(
+            f"{name:<22} {latency['p50']:>8.2f} {latency['p99']:>8.2f} {result['throughput_rps']:>8.1f} "
+            + style(f"{queries:>8} {result['query_budget']:>7}")
+        )
+        for error in result["errors"]:
+            self.stdout.write(self.style.ERROR(f"  {error}"))
@@ -0,0 +1,75 @@
+# server/management/commands/benchmark_renderers.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from server.benchmarks import renderers
+from server.benchmarks.context import prepare
+from server.seed import seed_scale
+
+DEFAULT_SCALE = "users=200,actions_per_user=50,notifications_per_user=5"
+
+
+class Command(BaseCommand):
+    help = (
+        "Times DRF's JSON renderer and parser against the project's orjson-backed pair on the "
+        "largest list responses, against a freshly seeded test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", default=DEFAULT_SCALE, help=f"Dataset size (default {DEFAULT_SCALE}).")
+        parser.add_argument("--seed", type=int, default=seed_scale.DEFAULT_SEED, help="Dataset random seed.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per payload; the median is reported.")
+        parser.add_argument(
+            "--payload",
+            action="append",
+            dest="payloads",
+            choices=[name for name, _build in renderers.PAYLOADS],
+            help="Only run this payload (repeatable).",
+        )
+        parser.add_argument("--output", default="benchmark-renderers.json", help="Where to write the JSON results.")
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep (and reuse) the seeded test database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            self.stdout.write(self.style.WARNING("orjson is not installed: both sides use the stdlib encoder."))
+        try:
+            scale = seed_scale.parse_scale(options["scale"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            self.stdout.write(self.style.NOTICE(f"Seeding {scale} on {connection.vendor}..."))
+            prepare(scale, options["seed"])
+            self.stdout.write(
+                f"{'payload':<20} {'KiB':>8} {'render ms':>10} {'fast':>8} {'speedup':>8} "
+                f"{'parse ms':>9} {'fast':>8} {'speedup':>8}"
+            )
+            report = renderers.run(max(1, options["repeat"]), names=options["payloads"], progress=self._progress)
+        except renderers.Mismatch as exc:
+            raise CommandError(f"Output differs: {exc}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        with open(options["output"], "w") as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _progress(self, name, result):
+        render, parse = result["render_ms"], result["parse_ms"]
+        self.stdout.write(
+            f"{name:<20} {result['bytes'] / 1024:>8.1f} {render['stdlib']:>10.2f} {render['fast']:>8.2f} "
+            f"{'x%.2f' % result['render_speedup']:>8} {parse['stdlib']:>9.2f} {parse['fast']:>8.2f} "
+            f"{'x%.2f' % result['parse_speedup']:>8}"
+        )
+        if not result["identical"]:
+            self.stdout.write(self.style.WARNING("  same data, different bytes (e.g. float formatting)"))
@@ -0,0 +1,75 @@
+# server/management/commands/benchmark_serializers.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from server.benchmarks import serializers
+from server.benchmarks.context import prepare
+from server.seed import seed_scale
+
+DEFAULT_SCALE = "users=200,actions_per_user=50,notifications_per_user=50"
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks that the values() read path renders the same JSON as the hot list serializers, "
+        "then times both per 10k rows against a freshly seeded test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", default=DEFAULT_SCALE, help=f"Dataset size (default {DEFAULT_SCALE}).")
+        parser.add_argument("--seed", type=int, default=seed_scale.DEFAULT_SEED, help="Dataset random seed.")
+        parser.add_argument("--rows", type=int, default=serializers.PER_ROWS, help="Rows per case (at most).")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path; the median is reported.")
+        parser.add_argument(
+            "--case",
+            action="append",
+            dest="cases",
+            choices=[case.name for case in serializers.CASES],
+            help="Only run this case (repeatable).",
+        )
+        parser.add_argument("--output", default="benchmark-serializers.json", help="Where to write the JSON results.")
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep (and reuse) the seeded test database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            scale = seed_scale.parse_scale(options["scale"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            self.stdout.write(self.style.NOTICE(f"Seeding {scale} on {connection.vendor}..."))
+            prepare(scale, options["seed"])
+            self.stdout.write(f"{'case':<15} {'rows':>7} {'serializer ms':>14} {'values() ms':>12} {'speedup':>8}")
+            report = serializers.run(
+                max(1, options["rows"]),
+                max(1, options["repeat"]),
+                names=options["cases"],
+                progress=self._progress,
+            )
+        except serializers.Mismatch as exc:
+            raise CommandError(f"Output differs: {exc}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        with open(options["output"], "w") as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Identical output on every case. Results written to {options['output']}"))
+
+    def _progress(self, name, result):
+        if not result["rows"]:
+            self.stdout.write(self.style.WARNING(f"{name:<15} no rows to compare"))
+            return
+        self.stdout.write(
+            f"{name:<15} {result['rows']:>7} {result['serializer_ms_per_10k']:>14.1f} "
+            f"{result['values_ms_per_10k']:>12.1f} " + self.style.SUCCESS(f"x{result['speedup']:>7.2f}")
+        )
@@ -0,0 +1,101 @@
+# server/management/commands/benchmark_servers.py
+
+import importlib.util
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from server.benchmarks import servers
+from server.benchmarks.context import prepare
+from server.seed import seed_scale
+
+DEFAULT_SCALE = "users=200,actions_per_user=50,notifications_per_user=5"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares gunicorn (WSGI, sync views) with uvicorn (ASGI, async read views) at equal "
+        "worker counts on the async-capable read endpoints. Runs against the configured "
+        "database, seeding the load dataset there if it is missing; needs gunicorn and uvicorn "
+        "installed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--server",
+            action="append",
+            dest="servers",
+            choices=list(servers.PROFILES),
+            help=f"Server profile to run (repeatable). Default: {', '.join(servers.DEFAULT_PROFILES)}.",
+        )
+        parser.add_argument("--workers", type=int, default=4, help="Worker processes per server.")
+        parser.add_argument("--concurrency", type=int, default=32, help="Open client connections.")
+        parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per endpoint.")
+        parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds per endpoint first.")
+        parser.add_argument("--port", type=int, help="Port to run the servers on (default: any free port).")
+        parser.add_argument("--scale", default=DEFAULT_SCALE, help=f"Dataset size (default {DEFAULT_SCALE}).")
+        parser.add_argument("--seed", type=int, default=seed_scale.DEFAULT_SEED, help="Dataset random seed.")
+        parser.add_argument("--output", default="benchmark-servers.json", help="Where to write the JSON results.")
+
+    def handle(self, *args, **options):
+        profiles = [servers.PROFILES[name] for name in options["servers"] or servers.DEFAULT_PROFILES]
+        missing = sorted({p.argv[0] for p in profiles if importlib.util.find_spec(p.argv[0]) is None})
+        if missing:
+            raise CommandError(f"Not installed: {', '.join(missing)} (pip install {' '.join(missing)}).")
+        if connection.vendor == "sqlite" and connection.settings_dict["NAME"] == ":memory:":
+            raise CommandError("The servers need a database they can all open; an in-memory SQLite one won't do.")
+        try:
+            scale = seed_scale.parse_scale(options["scale"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.NOTICE(f"Preparing {scale} on {connection.vendor}..."))
+        ctx = prepare(scale, options["seed"])
+        # The servers open their own connections
+        connection.close()
+
+        workers = max(1, options["workers"])
+        self.stdout.write(
+            f"{workers} worker(s), {options['concurrency']} connection(s), {options['duration']:.0f}s per endpoint"
+        )
+        self.stdout.write(f"{'server':<15} {'endpoint':<22} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9} {'failed':>7}")
+        try:
+            report = servers.run(
+                profiles,
+                ctx,
+                workers=workers,
+                concurrency=max(1, options["concurrency"]),
+                duration=max(1.0, options["duration"]),
+                warmup=max(0.0, options["warmup"]),
+                port=options["port"],
+                progress=self._progress,
+            )
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+
+        if len(report["results"]) > 1:
+            baseline, *others = report["results"]
+            for other in others:
+                self.stdout.write(self.style.NOTICE(f"{other} vs {baseline} (throughput, p99):"))
+                for name, result in report["results"][other].items():
+                    base = report["results"][baseline].get(name)
+                    if not base or not base["throughput_rps"] or not base["latency_ms"]["p99"]:
+                        continue
+                    self.stdout.write(
+                        f"  {name:<22} x{result['throughput_rps'] / base['throughput_rps']:.2f} req/s, "
+                        f"x{result['latency_ms']['p99'] / base['latency_ms']['p99']:.2f} p99"
+                    )
+
+        with open(options["output"], "w") as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _progress(self, server, name, result):
+        latency = result["latency_ms"]
+        style = self.style.ERROR if result["failed"] else self.style.SUCCESS
+        self.stdout.write(
+            f"{server:<15} {name:<22} {latency['p50']:>8.2f} {latency['p99']:>8.2f} "
+            f"{result['throughput_rps']:>9.1f} " + style(f"{result['failed']:>7}")
+        )
+        for error in result["errors"]:
+            self.stdout.write(self.style.ERROR(f"  {error}"))
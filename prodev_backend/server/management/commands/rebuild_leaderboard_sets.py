@@ -0,0 +1,43 @@
+# server/management/commands/rebuild_leaderboard_sets.py
+
+from django.core.management.base import BaseCommand, CommandError
+from server.apps.challenges.models import Challenge
+from server.apps.leaderboard.mirror import get_board
+from server.apps.leaderboard.models import LeaderboardEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the leaderboard sorted-set mirror from LeaderboardEntry rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--challenge",
+            type=int,
+            action="append",
+            dest="challenges",
+            help="Only rebuild this challenge id (repeatable). Defaults to all challenges.",
+        )
+
+    def handle(self, *args, **options):
+        board = get_board()
+        if board is None:
+            raise CommandError("LEADERBOARD_REDIS_URL is not set; the mirror is disabled.")
+
+        challenge_ids = options["challenges"] or list(
+            Challenge.objects.order_by("id").values_list("id", flat=True)
+        )
+        self.stdout.write(self.style.NOTICE(f"Rebuilding {len(challenge_ids)} challenge set(s)..."))
+
+        total = 0
+        for challenge_id in challenge_ids:
+            pairs = (
+                LeaderboardEntry.objects.filter(challenge_id=challenge_id)
+                .order_by()
+                .values_list("id", "score")
+                .iterator(chunk_size=2000)
+            )
+            count = board.replace(challenge_id, pairs)
+            total += count
+            self.stdout.write(f"  challenge {challenge_id}: {count} members")
+
+        self.stdout.write(self.style.SUCCESS(f"Leaderboard sets rebuilt ({total} members)."))
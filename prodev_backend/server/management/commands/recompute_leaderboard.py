@@ -0,0 +1,89 @@
+# server/management/commands/recompute_leaderboard.py
+
+from django.core.management.base import BaseCommand, CommandError
+from server.apps.challenges.models import Challenge
+from server.apps.leaderboard.reconcile import RECOMPUTE_CHUNK_SIZE, Drift, queued_tasks, reconcile_chunk
+
+
+class Command(BaseCommand):
+    help = "Recomputes leaderboard scores from eco actions and corrects drifted entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--challenge",
+            type=int,
+            action="append",
+            dest="challenges",
+            help="Only recompute this challenge id (repeatable). Defaults to all challenges.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=RECOMPUTE_CHUNK_SIZE,
+            help=f"Challenges per transaction (default {RECOMPUTE_CHUNK_SIZE}).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without correcting it.",
+        )
+        parser.add_argument(
+            "--ignore-queue",
+            action="store_true",
+            help="Correct drift even while tasks are waiting in the Celery queue.",
+        )
+
+    def handle(self, *args, **options):
+        challenge_ids = options["challenges"] or list(
+            Challenge.objects.order_by("id").values_list("id", flat=True)
+        )
+        chunk_size = max(1, options["chunk_size"])
+        dry_run = options["dry_run"]
+        if not dry_run:
+            self._check_queue(options["ignore_queue"])
+        self.stdout.write(self.style.NOTICE(
+            f"Recomputing {len(challenge_ids)} challenge(s){' (dry run)' if dry_run else ''}..."
+        ))
+
+        report = Drift()
+        for start in range(0, len(challenge_ids), chunk_size):
+            chunk = challenge_ids[start:start + chunk_size]
+            drift = reconcile_chunk(chunk, dry_run=dry_run)
+            report.merge(drift)
+            self.stdout.write(
+                f"  challenges {chunk[0]}..{chunk[-1]}: {drift.checked} entries, "
+                f"{len(drift.drifted)} drifted ({drift.missing} missing), off by {drift.total} pts"
+            )
+            if options["verbosity"] > 1:
+                for (user_id, challenge_id), (stored, expected) in sorted(drift.drifted.items()):
+                    self.stdout.write(
+                        f"    challenge {challenge_id} user {user_id}: "
+                        f"{'missing' if stored is None else stored} -> {expected}"
+                    )
+
+        summary = (
+            f"{report.checked} entries checked, {len(report.drifted)} drifted "
+            f"({report.missing} missing), off by {report.total} pts in total."
+        )
+        if not report.drifted:
+            self.stdout.write(self.style.SUCCESS(f"No drift. {summary}"))
+        elif dry_run:
+            self.stdout.write(self.style.WARNING(f"Drift found (not corrected). {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Drift corrected. {summary}"))
+
+    def _check_queue(self, ignore: bool):
+        # Queued score deltas look like drift; correcting it would count them twice
+        queued = queued_tasks()
+        if queued is None:
+            self.stdout.write(self.style.WARNING(
+                "Could not inspect the Celery queue. Score deltas still queued will be "
+                "applied on top of the corrected scores; stop producers and drain the queue first."
+            ))
+        elif queued and not ignore:
+            raise CommandError(
+                f"{queued} task(s) are waiting in the Celery queue. Queued score deltas look like drift "
+                "and would be counted twice: drain the queue, use --dry-run, or pass --ignore-queue."
+            )
+        elif queued:
+            self.stdout.write(self.style.WARNING(f"Ignoring {queued} queued task(s) (--ignore-queue)."))
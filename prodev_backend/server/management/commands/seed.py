@@ -1,14 +1,57 @@
 # server/management/commands/seed.py
 
-from django.core.management.base import BaseCommand
-from server.seed import run_seed
+from django.core.management.base import BaseCommand, CommandError
+from server.seed import run_seed, seed_scale
 
 
 class Command(BaseCommand):
-    help = "Seeds the database with initial CarbonJar data"
+    help = "Seeds the database with initial CarbonJar data, or a generated load-testing dataset with --scale"
 
-    def handle(self, *args, **kwargs):
-        self.stdout.write(self.style.NOTICE("Starting seed_data..."))
-        run_seed.run_all()
-        self.stdout.write(self.style.SUCCESS("Database successfully seeded!"))
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            help=(
+                "Generate a dataset instead of the demo data, e.g. "
+                "users=100000,actions_per_user=200,notifications_per_user=5,days=90"
+            ),
+        )
+        parser.add_argument(
+            "--fast",
+            action="store_true",
+            help="With --scale: COPY/bulk insert without per-row bookkeeping, then build "
+                 "leaderboard, rollup and unread-counter tables in one aggregate pass.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=seed_scale.DEFAULT_SEED,
+            help=f"Random seed for --scale (default {seed_scale.DEFAULT_SEED}); same seed, same data.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=seed_scale.DEFAULT_BATCH_SIZE,
+            help=f"Rows per INSERT/COPY with --scale (default {seed_scale.DEFAULT_BATCH_SIZE}).",
+        )
 
+    def handle(self, *args, **options):
+        if options["scale"] is None:
+            if options["fast"]:
+                raise CommandError("--fast only applies to --scale.")
+            self.stdout.write(self.style.NOTICE("Starting seed_data..."))
+            run_seed.run_all()
+            self.stdout.write(self.style.SUCCESS("Database successfully seeded!"))
+            return
+
+        try:
+            scale = seed_scale.parse_scale(options["scale"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.NOTICE(
+            f"Generating {scale} (seed {options['seed']}{', fast' if options['fast'] else ''})..."
+        ))
+        try:
+            seed_scale.run(scale, seed=options["seed"], fast=options["fast"], batch_size=max(1, options["batch_size"]))
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS("Load-testing dataset seeded!"))
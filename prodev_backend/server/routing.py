@@ -0,0 +1,10 @@
+# server/routing.py
+
+from django.urls import path
+
+from server.apps.core.consumers import LiveConsumer
+
+
+websocket_urlpatterns = [
+    path("ws/live/", LiveConsumer.as_asgi()),
+]
@@ -132,12 +132,8 @@ def _has_field(model, name: str) -> bool:
 # ---- SEEDING -----------------------------------------------------------------
 
 
-@transaction.atomic
-def run():
-    allowed = _allowed_types()
-    has_performed_on = _has_field(EcoAction, "performed_on")
-
-    # 1) Seed ActionTemplate catalog (skip if (action_type, description) exists)
+def seed_templates(allowed: set) -> None:
+    """Seed the ActionTemplate catalog (skip if (action_type, description) exists)."""
     created_templates = 0
     skipped_templates = 0
 
@@ -166,6 +162,15 @@ def run():
         f"[templates] created: {created_templates}, skipped(existing): {skipped_templates}, total: {ActionTemplate.objects.count()}"
     )
 
+
+@transaction.atomic
+def run():
+    allowed = _allowed_types()
+    has_performed_on = _has_field(EcoAction, "performed_on")
+
+    # 1) Seed ActionTemplate catalog
+    seed_templates(allowed)
+
     # 2) Seed EcoAction logs for users (skip if an identical log already exists for that day)
     users = list(CustomUser.objects.all())
     templates = list(ActionTemplate.objects.all())
@@ -4,8 +4,10 @@
 Seeds baseline notifications for all users.
 """
 
+from django.db.models import Q
+
 from server.apps.users.models import CustomUser
-from server.apps.notifications.models import Notification
+from server.apps.notifications.fanout import all_users, fan_out
 
 def run():
     """Create a few helpful starter notifications for each user."""
@@ -16,25 +18,22 @@ def run():
         "Tip: Link your actions to challenges to climb the leaderboard.",
     ]
 
-    users = CustomUser.objects.all()
-
     created = 0
-    skipped = 0
-
-    for user in users:
-        for msg in base_messages:
-            Notification.objects.create(user=user, message=msg, is_read=False)
-            created += 1
-
-        if not (user.phone_number or user.bio):
-            Notification.objects.create(
-                user=user,
-                message="Complete your profile to help personalize your experience.",
-                is_read=False,
-            )
-            created += 1
-        else:
-            skipped += 1
+
+    # One bulk insert per batch of users instead of one INSERT per notification
+    for msg in base_messages:
+        created += fan_out(msg, all_users())
+
+    incomplete = (
+        CustomUser.objects.filter(is_active=True)
+        .filter(Q(phone_number__isnull=True) | Q(phone_number=""))
+        .filter(Q(bio__isnull=True) | Q(bio=""))
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    nudged = fan_out("Complete your profile to help personalize your experience.", incomplete)
+    created += nudged
+    skipped = all_users().count() - nudged
 
     total = created + skipped
     if created == 0:
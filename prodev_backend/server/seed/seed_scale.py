@@ -0,0 +1,296 @@
+# server/seed/seed_scale.py
+
+"""
+Generated load-testing dataset: N users with M eco actions (and a few
+notifications) each, identical for the same --seed and day.
+
+Rows are generated in memory one batch of users at a time. By default they go
+through the managers' bulk_create, which keeps leaderboard scores, daily
+rollups and unread counters in step batch by batch. fast=True inserts plain
+rows instead (COPY on Postgres, executemany elsewhere) and fills those tables
+with one INSERT ... SELECT ... GROUP BY each at the end.
+
+    python manage.py seed --scale users=100000,actions_per_user=200 --fast
+"""
+
+import csv
+import io
+import random
+from datetime import datetime, time, timedelta
+from itertools import islice
+from typing import Dict, Iterable, List, Sequence
+
+from django.contrib.auth.hashers import make_password
+from django.db import connections, router, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from server.apps.actions.models import ActionTemplate, EcoAction, UserPointsDaily
+from server.apps.leaderboard.models import LeaderboardEntry
+from server.apps.location.models import City
+from server.apps.notifications.models import Notification, NotificationCounter
+from server.apps.users.models import CustomUser
+from server.seed import seed_actions, seed_challenges, seed_location
+
+# ---- CONFIG ------------------------------------------------------------------
+
+DEFAULT_SCALE: Dict[str, int] = {
+    "users": 1000,
+    "actions_per_user": 50,
+    "notifications_per_user": 5,
+    "days": 90,
+}
+
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 5000
+USERS_PER_ROUND = 1000  # users generated (with all their rows) per transaction
+
+PASSWORD = "password123"
+
+MESSAGES = [
+    "Your weekly impact summary is ready.",
+    "A new challenge just started. Join in!",
+    "You climbed the leaderboard. Keep going!",
+    "Don't forget to log today's eco actions.",
+    "Complete your profile to help personalize your experience.",
+]
+
+# ---- HELPERS -----------------------------------------------------------------
+
+
+def parse_scale(spec: str) -> Dict[str, int]:
+    """'users=100000,actions_per_user=200' -> DEFAULT_SCALE with those keys replaced."""
+    scale = dict(DEFAULT_SCALE)
+    for part in filter(None, (p.strip() for p in (spec or "").split(","))):
+        key, sep, value = part.partition("=")
+        key = key.strip()
+        if not sep or key not in DEFAULT_SCALE:
+            raise ValueError(f"Unknown scale setting '{part}'. Use: {', '.join(DEFAULT_SCALE)}.")
+        try:
+            scale[key] = int(value)
+        except ValueError:
+            raise ValueError(f"'{key}' must be an integer.")
+        if scale[key] < 0:
+            raise ValueError(f"'{key}' must not be negative.")
+    return scale
+
+
+def _chunks(rows: Iterable, size: int):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _copy(model, columns: Sequence[str], rows: List[tuple], using: str):
+    """Postgres COPY of `rows` into `columns` of `model`'s table."""
+    connection = connections[using]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["\\N" if v is None else v for v in row])
+    buffer.seek(0)
+
+    sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')".format(
+        connection.ops.quote_name(model._meta.db_table), _column_list(model, columns, connection)
+    )
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def _column_list(model, attnames: Sequence[str], connection) -> str:
+    return ", ".join(connection.ops.quote_name(model._meta.get_field(a).column) for a in attnames)
+
+
+def _adapters(model, columns: Sequence[str], connection):
+    """Per-column converters to what the driver expects (dates, datetimes)."""
+    ops = connection.ops
+    converters = []
+    for attname in columns:
+        internal = model._meta.get_field(attname).get_internal_type()
+        if internal == "DateTimeField":
+            converters.append(ops.adapt_datetimefield_value)
+        elif internal == "DateField":
+            converters.append(ops.adapt_datefield_value)
+        else:
+            converters.append(None)
+    return converters
+
+
+def _insert(model, columns: Sequence[str], rows: List[tuple], fast: bool, using: str):
+    """
+    fast: COPY on Postgres, otherwise one executemany() INSERT; either way
+    no model instances, signals or bulk_create bookkeeping.
+    Not fast: the model manager's bulk_create, so derived tables stay in step.
+    """
+    connection = connections[using]
+    if not fast:
+        model.objects.using(using).bulk_create([model(**dict(zip(columns, row))) for row in rows])
+    elif connection.vendor == "postgresql":
+        _copy(model, columns, rows, using)
+    else:
+        converters = _adapters(model, columns, connection)
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            connection.ops.quote_name(model._meta.db_table),
+            _column_list(model, columns, connection),
+            ", ".join(["%s"] * len(columns)),
+        )
+        adapted = [
+            tuple(value if convert is None else convert(value) for convert, value in zip(converters, row))
+            for row in rows
+        ]
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, adapted)
+
+
+def _insert_select(model, columns: Sequence[str], queryset, using: str) -> int:
+    """INSERT INTO model (columns) <queryset's SELECT>: the aggregate never leaves the database."""
+    connection = connections[using]
+    select, params = queryset.query.sql_with_params()
+    sql = "INSERT INTO {} ({}) {}".format(
+        connection.ops.quote_name(model._meta.db_table), _column_list(model, columns, connection), select
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def _aggregate(first_id: int, last_id: int, using: str) -> Dict[str, int]:
+    """Fill the tables derived from actions/notifications with one GROUP BY each."""
+    actions = EcoAction.objects.using(using).filter(user__gte=first_id, user__lte=last_id).order_by()
+    scores = (
+        actions.filter(challenge__isnull=False)
+        .values_list("user_id", "challenge_id")
+        .annotate(score=Sum("points"))
+    )
+    daily = actions.values_list("user_id", "performed_on", "action_type").annotate(
+        points=Sum("points"), count=Count("id")
+    )
+    unread = (
+        Notification.objects.using(using)
+        .filter(user__gte=first_id, user__lte=last_id, is_read=False)
+        .order_by()
+        .values_list("user_id")
+        .annotate(unread=Count("id"))
+    )
+    return {
+        "leaderboard": _insert_select(LeaderboardEntry, ("user_id", "challenge_id", "score"), scores, using),
+        "daily": _insert_select(
+            UserPointsDaily, ("user_id", "performed_on", "action_type", "points", "count"), daily, using
+        ),
+        "counters": _insert_select(NotificationCounter, ("user_id", "unread"), unread, using),
+    }
+
+
+# ---- GENERATORS --------------------------------------------------------------
+
+ACTION_COLUMNS = (
+    "user_id", "action_type", "description", "points", "challenge_id", "performed_on", "created_at", "updated_at",
+)
+NOTIFICATION_COLUMNS = ("user_id", "message", "is_read", "created_at", "updated_at")
+
+
+def _users(rng: random.Random, seed: int, start: int, count: int, city_ids: List[int], password: str):
+    for i in range(start, start + count):
+        yield CustomUser(
+            username=f"load_{seed}_{i:07d}",
+            email=f"load_{seed}_{i:07d}@example.com",
+            password=password,
+            city_id=rng.choice(city_ids) if city_ids else None,
+            profile_complete=rng.random() < 0.7,
+        )
+
+
+def _actions(rng: random.Random, user_ids: List[int], templates: List, scale: Dict[str, int], today):
+    """Rows for ACTION_COLUMNS."""
+    days = max(scale["days"], 1)
+    midnights = [timezone.make_aware(datetime.combine(today - timedelta(days=d), time())) for d in range(days)]
+    for user_id in user_ids:
+        for _ in range(scale["actions_per_user"]):
+            action_type, description, points, challenge_id = rng.choice(templates)
+            days_ago = rng.randrange(days)
+            created_at = midnights[days_ago] + timedelta(seconds=rng.randrange(86400))
+            yield (
+                user_id, action_type, description, points, challenge_id,
+                today - timedelta(days=days_ago), created_at, created_at,
+            )
+
+
+def _notifications(rng: random.Random, user_ids: List[int], scale: Dict[str, int], now):
+    """Rows for NOTIFICATION_COLUMNS."""
+    for user_id in user_ids:
+        for _ in range(scale["notifications_per_user"]):
+            created_at = now - timedelta(seconds=rng.randrange(scale["days"] * 86400 or 1))
+            yield (user_id, rng.choice(MESSAGES), rng.random() < 0.5, created_at, created_at)
+
+
+# ---- SEEDING -----------------------------------------------------------------
+
+
+def run(scale: Dict[str, int], seed: int = DEFAULT_SEED, fast: bool = False, batch_size: int = DEFAULT_BATCH_SIZE):
+    using = router.db_for_write(EcoAction)
+    if CustomUser.objects.using(using).filter(username=f"load_{seed}_{0:07d}").exists():
+        raise ValueError(f"A dataset with seed {seed} is already loaded; flush the database or pick another --seed.")
+
+    # Small reference data first (idempotent); the catalog seeders use the global RNG
+    random.seed(seed)
+    seed_location.run()
+    seed_challenges.run()
+    seed_actions.seed_templates(seed_actions._allowed_types())
+
+    rng = random.Random(seed)
+    today = timezone.localdate()
+    now = timezone.make_aware(datetime.combine(today, time()))
+    city_ids = list(City.objects.using(using).order_by("id").values_list("id", flat=True))
+    templates = list(
+        ActionTemplate.objects.using(using)
+        .order_by("id")
+        .values_list("action_type", "description", "points", "challenge_id")
+    )
+    if not templates:
+        raise ValueError("No action templates to generate actions from.")
+    # Hashing is deliberately slow; every generated user shares one hash
+    password = make_password(PASSWORD)
+
+    totals = {"users": 0, "actions": 0, "notifications": 0}
+    first_id = last_id = None
+    for start in range(0, scale["users"], USERS_PER_ROUND):
+        count = min(USERS_PER_ROUND, scale["users"] - start)
+        with transaction.atomic(using=using):
+            users = CustomUser.objects.using(using).bulk_create(
+                list(_users(rng, seed, start, count, city_ids, password)), batch_size=batch_size
+            )
+            user_ids = [u.pk for u in users]
+            first_id = user_ids[0] if first_id is None else first_id
+            last_id = user_ids[-1]
+
+            actions = list(_actions(rng, user_ids, templates, scale, today))
+            for batch in _chunks(actions, batch_size):
+                _insert(EcoAction, ACTION_COLUMNS, batch, fast, using)
+            notifications = list(_notifications(rng, user_ids, scale, now))
+            for batch in _chunks(notifications, batch_size):
+                _insert(Notification, NOTIFICATION_COLUMNS, batch, fast, using)
+
+        totals["users"] += count
+        totals["actions"] += len(actions)
+        totals["notifications"] += len(notifications)
+        print(f"[scale] users: {totals['users']}/{scale['users']}, actions: {totals['actions']}")
+
+    if fast and first_id is not None:
+        with transaction.atomic(using=using):
+            derived = _aggregate(first_id, last_id, using)
+        print(
+            f"[scale] leaderboard entries: {derived['leaderboard']}, daily rollups: {derived['daily']}, "
+            f"unread counters: {derived['counters']}"
+        )
+        print("[scale] Run `manage.py rebuild_leaderboard_sets` if the leaderboard mirror is enabled.")
+
+    print(
+        f"[scale] created users: {totals['users']}, actions: {totals['actions']}, "
+        f"notifications: {totals['notifications']} (seed {seed})"
+    )
+    return totals
@@ -58,6 +58,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost, so its timings cover the rest of the stack
+    'server.apps.core.instrumentation.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -68,6 +70,31 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per-request metrics (server/apps/core/instrumentation.py): a Server-Timing
+# header on every response. REQUEST_LOG_LEVEL=INFO also logs a JSON line per
+# request on the "server.requests" logger; it is off by default, as that is a
+# synchronous stderr write per request.
+# SLOW_REQUEST_MS > 0 turns on the sampler that logs the SQL of the slowest
+# requests; SLOW_REQUEST_SAMPLE_RATE is the share of requests whose SQL is kept.
+REQUEST_METRICS = config("REQUEST_METRICS", default=True, cast=bool)
+SLOW_REQUEST_MS = config("SLOW_REQUEST_MS", default=0, cast=int)
+SLOW_REQUEST_SAMPLE_RATE = config("SLOW_REQUEST_SAMPLE_RATE", default=1.0, cast=float)
+SLOW_REQUEST_KEEP = config("SLOW_REQUEST_KEEP", default=20, cast=int)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"plain": {"format": "%(message)s"}},
+    "handlers": {"requests": {"class": "logging.StreamHandler", "formatter": "plain"}},
+    "loggers": {
+        "server.requests": {
+            "handlers": ["requests"],
+            "level": config("REQUEST_LOG_LEVEL", default="WARNING"),
+            "propagate": False,
+        },
+    },
+}
+
 ROOT_URLCONF = 'server.urls'
 
 TEMPLATES = [
@@ -87,20 +114,68 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'server.wsgi.application'
+ASGI_APPLICATION = 'server.asgi.application'
+
+# Serve the hot read endpoints with async views (server/apps/core/asyncviews.py).
+# Only worth it under ASGI (uvicorn/daphne); under WSGI keep it off.
+ASYNC_READ_VIEWS = config("ASYNC_READ_VIEWS", default=False, cast=bool)
+
+# Channel layer for WebSocket push (server/apps/core/realtime.py):
+# in-memory (single process: tests, dev) unless CHANNEL_REDIS_URL is set.
+CHANNEL_REDIS_URL = config("CHANNEL_REDIS_URL", default="")
+
+CHANNEL_LAYERS = {
+    "default": (
+        {"BACKEND": "channels_redis.core.RedisChannelLayer", "CONFIG": {"hosts": [CHANNEL_REDIS_URL]}}
+        if CHANNEL_REDIS_URL
+        else {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+    )
+}
+
+# Celery (server/celery.py). Without a broker, tasks run inline after commit
+# (dev, tests); "memory://" gives an in-process broker for worker tests.
+CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="")
+CELERY_TASK_ALWAYS_EAGER = config("CELERY_TASK_ALWAYS_EAGER", default=not CELERY_BROKER_URL, cast=bool)
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_SERIALIZER = "json"
+CELERY_ACCEPT_CONTENT = ["json"]
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DB_CONN_MAX_AGE: seconds a connection is reused. Under ASGI every request
+# runs its queries in a thread of its own, so use 0 there (and a pooler).
 DATABASES = {
     "default": dj_database_url.config(
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
-        conn_max_age=600,
+        conn_max_age=config("DB_CONN_MAX_AGE", default=600, cast=int),
         ssl_require=True,
     )
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# CACHE_URL: "locmem://" (default), "redis://host:6379/1" or "file:///var/tmp/django_cache"
+
+CACHE_URL = config("CACHE_URL", default="locmem://")
+
+
+def _cache_from_url(url):
+    scheme, _, location = url.partition("://")
+    if scheme in ("redis", "rediss"):
+        return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": url}
+    if scheme == "file":
+        return {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location}
+    return {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": location}
+
+
+CACHES = {"default": _cache_from_url(CACHE_URL)}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -144,12 +219,19 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "server.apps.users.authentication.CachedJWTAuthentication",
     ),
+    "DEFAULT_PAGINATION_CLASS": "server.apps.core.pagination.DefaultCursorPagination",
+    "PAGE_SIZE": 50,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": "django_filters.rest_framework.DjangoFilterBackend",
+    # orjson-backed JSON (server/apps/core/renderers.py, parsers.py); stdlib without it
+    "DEFAULT_RENDERER_CLASSES": [
+        "server.apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "server.apps.core.parsers.FastJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
@@ -158,9 +240,27 @@ REST_FRAMEWORK = {
 
 AUTH_USER_MODEL = 'users.CustomUser'
 
+# Seconds a user row is cached for JWT authentication (server/apps/users/cache.py); 0 disables.
+# Only used with a shared cache (CACHE_URL=redis://... or file://...): invalidation
+# can't reach other workers' locmem caches, so it stays off there.
+AUTH_USER_CACHE_TIMEOUT = config("AUTH_USER_CACHE_TIMEOUT", default=300, cast=int)
+
+# Sorted-set mirror for leaderboard rank reads (server/apps/leaderboard/mirror.py):
+# "" disables it, "memory://" keeps it in-process, otherwise a redis:// URL.
+LEADERBOARD_REDIS_URL = config("LEADERBOARD_REDIS_URL", default="")
+
+# Set of blacklisted refresh-token jtis checked before the database
+# (server/apps/users/blacklist.py): "" disables it, "memory://" keeps it
+# in-process, otherwise a redis:// URL. `manage.py prune_tokens` loads it.
+TOKEN_BLACKLIST_REDIS_URL = config("TOKEN_BLACKLIST_REDIS_URL", default="")
+
 SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "ROTATE_REFRESH_TOKENS": True,
+    # Blacklist checks consult TOKEN_BLACKLIST_REDIS_URL's set first (server/apps/users/tokens.py)
+    "TOKEN_REFRESH_SERIALIZER": "server.apps.users.tokens.CachedTokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "server.apps.users.tokens.CachedTokenVerifySerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "server.apps.users.tokens.CachedTokenBlacklistSerializer",
 }
 
 CORS_ALLOW_ALL_ORIGINS = False
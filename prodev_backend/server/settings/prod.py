@@ -18,6 +18,17 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "server.apps.users.authentication.CachedJWTAuthentication",
     ),
+    "DEFAULT_PAGINATION_CLASS": "server.apps.core.pagination.DefaultCursorPagination",
+    "PAGE_SIZE": 50,
+    # JSON only: no browsable API (and its per-request form rendering) in production
+    "DEFAULT_RENDERER_CLASSES": [
+        "server.apps.core.renderers.FastJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "server.apps.core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
@@ -9,5 +9,7 @@ export interface Challenge {
     reward: string;
     start_date: string;
     end_date: string;
+    participant_count: number;
+    // Preview only (first few); the full list is at /challenges/{id}/participants/
     participants: User[];
 }
@@ -7,3 +7,21 @@ export interface City {
     continent: string;
     capital: boolean;
 }
+
+export interface CitySuggestion {
+    id: number;
+    name: string;
+    country: number;
+    country_code: string;
+}
+
+export interface LocationTree {
+    id: number;
+    name: string;
+    countries: {
+        id: number;
+        name: string;
+        code: string;
+        cities: { id: number; name: string }[];
+    }[];
+}
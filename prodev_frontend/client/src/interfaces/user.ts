@@ -12,3 +12,19 @@ export interface User {
     phone?: string;
     city?: City;
 }
+
+export interface PointsBucket {
+    points: number;
+    count: number;
+}
+
+export interface UserStats {
+    granularity: "day" | "week" | "month";
+    start: string;
+    end: string;
+    totals: PointsBucket;
+    series: (PointsBucket & {
+        period: string;
+        by_type: Record<string, PointsBucket>;
+    })[];
+}
@@ -2,7 +2,7 @@
 
 import API_BASE_URL from "./api";
 import { Action } from "@/interfaces/action";
-import { smartFetch } from "./http";
+import { smartFetch, smartFetchList } from "./http";
 
 //  Helper to join base + path safely.
 const url = (path: string) => {
@@ -16,7 +16,7 @@ const url = (path: string) => {
  * GET /api/actions/action-templates/
  */
 export const fetchActionTemplates = async (): Promise<Action[]> => {
-	return smartFetch<Action[]>(url("actions/action-templates/"));
+	return smartFetchList<Action>(url("actions/action-templates/"));
 };
 
 /**
@@ -2,7 +2,7 @@
 
 import API_BASE_URL from "./api";
 import { Challenge } from "@/interfaces/challenge";
-import { smartFetch } from "./http";
+import { smartFetch, smartFetchList } from "./http";
 
 
 const url = (path: string) => {
@@ -12,7 +12,7 @@ const url = (path: string) => {
 };
 
 export const fetchChallenges = async (): Promise<Challenge[]> => {
-	return smartFetch<Challenge[]>(url("challenges/"));
+	return smartFetchList<Challenge>(url("challenges/"));
 };
 
 export const fetchChallenge = async (id: number): Promise<Challenge> => {
@@ -14,6 +14,14 @@ type SmartInit = RequestInit & {
 	skipAuth?: boolean; // don't attach Authorization (e.g. login/refresh endpoints)
 };
 
+// ---- list helpers ------------------------------------------------------------
+
+// List endpoints are cursor-paginated: { next, previous, results }.
+export type Paginated<T> = { next: string | null; previous: string | null; results: T[] };
+
+export const unwrapList = <T>(data: T[] | Paginated<T>): T[] =>
+	Array.isArray(data) ? data : data?.results ?? [];
+
 // ---- token helpers (localStorage + cookies fallback) ------------------------
 
 const readCookie = (name: string): string | null => {
@@ -22,7 +30,7 @@ const readCookie = (name: string): string | null => {
 	return match ? decodeURIComponent(match[1]) : null;
 };
 
-const getAccessToken = (): string | null => {
+export const getAccessToken = (): string | null => {
 	if (typeof window === "undefined") return null;
 	// Preferred keys first, but support legacy ones
 	const keys = ["accessToken", "access", "access_token", "jwt", "token"];
@@ -75,3 +83,9 @@ export const smartFetch = async <T = unknown>(
 
 	return data as T;
 };
+
+/** GET a list endpoint and return the first page's rows. */
+export const smartFetchList = async <T = unknown>(
+	url: string,
+	init: SmartInit = {}
+): Promise<T[]> => unwrapList(await smartFetch<T[] | Paginated<T>>(url, init));
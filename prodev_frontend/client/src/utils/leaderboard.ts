@@ -1,6 +1,7 @@
 // src/utils/leaderboard.ts
 
 import API_BASE_URL from "./api";
+import { unwrapList } from "./http";
 import { Leaderboard } from "@/interfaces/leaderboard";
 
 
@@ -12,8 +13,7 @@ export const fetchLeaderboard = async (): Promise<Leaderboard[]> => {
 			throw new Error(`HTTP error! status: ${res.status}`);
 		}
 
-		const data: Leaderboard[] = await res.json();
-		return data;
+		return unwrapList<Leaderboard>(await res.json());
 	} catch (err: unknown) {
 		if (err instanceof Error) {
 			console.error("API Error:", err.message);
@@ -0,0 +1,49 @@
+// src/utils/live.ts
+
+import API_BASE_URL from "./api";
+import { getAccessToken } from "./http";
+
+export type LiveEvent =
+	| {
+			type: "notification.created";
+			data: { id: number; message: string; is_read: boolean; created_at: string };
+	  }
+	| {
+			type: "leaderboard.scores";
+			data: {
+				challenge: number;
+				changes: { user: number; delta?: number; score?: number; removed?: boolean }[];
+			};
+	  }
+	| { type: "subscribed"; data: { challenge: number } }
+	| { type: "error"; data: { detail: string } };
+
+// http://host:8000/api -> ws://host:8000/ws/live/
+const liveUrl = (token: string) => {
+	const origin = new URL(API_BASE_URL).origin.replace(/^http/, "ws");
+	return `${origin}/ws/live/?token=${encodeURIComponent(token)}`;
+};
+
+/**
+ * Push channel for new notifications and score changes in joined challenges.
+ * Replaces polling /notifications/ and /leaderboard/. Returns null when logged out.
+ */
+export const openLiveSocket = (onEvent: (event: LiveEvent) => void): WebSocket | null => {
+	const token = getAccessToken();
+	if (!token) return null;
+
+	const socket = new WebSocket(liveUrl(token));
+	socket.onmessage = (message) => {
+		try {
+			onEvent(JSON.parse(message.data) as LiveEvent);
+		} catch (err: unknown) {
+			console.error("Live event error:", err);
+		}
+	};
+	return socket;
+};
+
+/** Start receiving a challenge's score changes after joining it mid-session. */
+export const subscribeToChallenge = (socket: WebSocket, challengeId: number) => {
+	socket.send(JSON.stringify({ subscribe: challengeId }));
+};
@@ -1,7 +1,8 @@
 // src/utils/location.ts
 
 import API_BASE_URL from "./api";
-import { City } from "@/interfaces/location";
+import { unwrapList } from "./http";
+import { City, CitySuggestion, LocationTree } from "@/interfaces/location";
 
 
 export const fetchCities = async (): Promise<City[]> => {
@@ -12,8 +13,7 @@ export const fetchCities = async (): Promise<City[]> => {
 			throw new Error(`HTTP error! status: ${res.status}`);
 		}
 
-		const data: City[] = await res.json();
-		return data;
+		return unwrapList<City>(await res.json());
 	} catch (err: unknown) {
 		if (err instanceof Error) {
 			console.error("API Error:", err.message);
@@ -23,3 +23,33 @@ export const fetchCities = async (): Promise<City[]> => {
 		throw err;
 	}
 };
+
+/**
+ * Typeahead for the city picker: name-prefix matches, accents ignored.
+ */
+export const searchCities = async (
+	q: string,
+	country?: string,
+	limit = 10,
+): Promise<CitySuggestion[]> => {
+	if (!q.trim()) return [];
+	const params = new URLSearchParams({ q, limit: String(limit) });
+	if (country) params.set("country", country);
+
+	const res = await fetch(`${API_BASE_URL}/location/cities/search/?${params}`);
+	if (!res.ok) {
+		throw new Error(`HTTP error! status: ${res.status}`);
+	}
+	return res.json();
+};
+
+/**
+ * Whole continent -> country -> city hierarchy in one (cacheable) request.
+ */
+export const fetchLocationTree = async (): Promise<LocationTree[]> => {
+	const res = await fetch(`${API_BASE_URL}/location/tree/`);
+	if (!res.ok) {
+		throw new Error(`HTTP error! status: ${res.status}`);
+	}
+	return res.json();
+};
@@ -1,19 +1,14 @@
 // src/utils/notifications.ts
 
 import API_BASE_URL from "./api";
+import { smartFetch, smartFetchList } from "./http";
 import { Notification } from "@/interfaces/notification";
 
 
 export const fetchNotifications = async (): Promise<Notification[]> => {
 	try {
-		const res = await fetch(`${API_BASE_URL}/notifications`);
-
-		if (!res.ok) {
-			throw new Error(`HTTP error! status: ${res.status}`);
-		}
-
-		const data: Notification[] = await res.json();
-		return data;
+		// The inbox is per user, so the request must carry the access token
+		return await smartFetchList<Notification>(`${API_BASE_URL}/notifications/`);
 	} catch (err: unknown) {
 		if (err instanceof Error) {
 			console.error("API Error:", err.message);
@@ -23,3 +18,25 @@ export const fetchNotifications = async (): Promise<Notification[]> => {
 		throw err;
 	}
 };
+
+/**
+ * Unread badge count for the current user (requires auth).
+ */
+export const fetchUnreadCount = async (): Promise<number> => {
+	const { unread } = await smartFetch<{ unread: number }>(`${API_BASE_URL}/notifications/unread-count/`);
+	return unread;
+};
+
+/**
+ * Mark notifications read in one request: pass ids, or a timestamp to mark
+ * everything created before it. Resolves to the new unread count.
+ */
+export const markNotificationsRead = async (
+	target: { ids: number[] } | { before: string }
+): Promise<number> => {
+	const { unread } = await smartFetch<{ updated: number; unread: number }>(
+		`${API_BASE_URL}/notifications/mark-read/`,
+		{ method: "POST", body: JSON.stringify(target) }
+	);
+	return unread;
+};
@@ -3,8 +3,9 @@
 import API_BASE_URL from "./api";
 import { Challenge } from "@/interfaces/challenge";
 import { Leaderboard } from "@/interfaces/leaderboard";
-import { smartFetch } from "./http";
+import { smartFetch, smartFetchList } from "./http";
 import { Action } from "@/interfaces/action";
+import { UserStats } from "@/interfaces/user";
 
 const url = (path: string) => {
 	const base = (API_BASE_URL || "").replace(/\/+$/,"");
@@ -14,16 +15,12 @@ const url = (path: string) => {
 
 /**
  * List challenges for the current user.
- * If currentUserId provided, filter client-side by participants.
- * (Server endpoint is public; smartFetch will still attach auth if present.)
+ * Challenge payloads only carry a participants preview, so membership comes
+ * from the server-side /users/me/challenges/ endpoint (requires auth).
  */
 export const fetchUserChallenges = async (currentUserId?: number): Promise<Challenge[]> => {
-	const list = await smartFetch<Challenge[]>(url("challenges/"));
-	if (!currentUserId) return list;
-	return list.filter(c =>
-		Array.isArray(c.participants) &&
-		c.participants.some(p => Number(p.id) === Number(currentUserId))
-	);
+	if (!currentUserId) return smartFetchList<Challenge>(url("challenges/"));
+	return smartFetch<Challenge[]>(url("users/me/challenges/"));
 };
 
 /**
@@ -32,12 +29,21 @@ export const fetchUserChallenges = async (currentUserId?: number): Promise<Chall
  * (common in your project). If not, add a `?me=1` server filter and keep this.
  */
 export const fetchUserLeaderboard = async (): Promise<Leaderboard[]> => {
-	return smartFetch<Leaderboard[]>(url("leaderboard/"));
+	return smartFetchList<Leaderboard>(url("leaderboard/"));
 };
 
 /**
  * Current user's eco actions. Your EcoActionViewSet already filters to request.user.
  */
 export const fetchUserActions = async (): Promise<Action[]> => {
-	return smartFetch<Action[]>(url("actions/eco-actions/"));
+	return smartFetchList<Action>(url("actions/eco-actions/"));
+};
+
+/**
+ * Current user's points bucketed per day, week or month (from the daily rollup).
+ */
+export const fetchUserStats = async (
+	granularity: UserStats["granularity"] = "week",
+): Promise<UserStats> => {
+	return smartFetch<UserStats>(url(`users/me/stats/?granularity=${granularity}`));
 };
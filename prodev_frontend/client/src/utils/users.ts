@@ -1,6 +1,7 @@
 // src/utils/users.ts
 
 import API_BASE_URL from "./api";
+import { unwrapList } from "./http";
 import { User } from "@/interfaces/user";
 
 export const fetchUsers = async (): Promise<User[]> => {
@@ -11,8 +12,7 @@ export const fetchUsers = async (): Promise<User[]> => {
 			throw new Error(`HTTP error! status: ${res.status}`);
 		}
 
-		const data: User[] = await res.json();
-		return data;
+		return unwrapList<User>(await res.json());
 	} catch (err: unknown) {
 		if (err instanceof Error) {
 			console.error("API Error:", err.message);